@@ -5,6 +5,7 @@ Favorites API endpoints
 - GET /favorites - 내 즐겨찾기 목록
 - GET /favorites/check - 즐겨찾기 여부 확인
 - GET /favorites/stats/{id} - 좋아요 통계
+- POST /favorites/shopping-list - 여러 즐겨찾기 통합 장보기 리스트
 - DELETE /favorites/{id} - 즐겨찾기 삭제
 """
 
@@ -16,6 +17,8 @@ from app.models.favorite import (
     FavoriteCheck,
     FavoriteCreate,
     FavoriteResponse,
+    FavoriteShoppingList,
+    FavoriteShoppingListCreate,
     RecommendationLikeStats,
 )
 from app.models.user import User
@@ -79,6 +82,20 @@ def get_like_stats(
     return favorite_service.get_recommendation_like_stats(recommendation_id)
 
 
+@router.post("/shopping-list", response_model=FavoriteShoppingList)
+def get_shopping_list(
+    data: FavoriteShoppingListCreate,
+    current_user: User = Depends(get_current_user),
+    favorite_service: FavoriteService = Depends(get_favorite_service),
+):
+    """
+    선택한 즐겨찾기 레시피들의 통합 장보기 리스트
+
+    인증 필요: Authorization: Bearer {token}
+    """
+    return favorite_service.get_shopping_list(current_user.id, data.favorite_ids)
+
+
 @router.delete("/{favorite_id}")
 def remove_favorite(
     favorite_id: UUID,
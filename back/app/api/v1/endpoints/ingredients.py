@@ -0,0 +1,86 @@
+"""
+Ingredients API endpoints
+
+- GET /ingredients/suggest - 재료 자동완성 (접두사/초성)
+- GET /ingredients/related - 함께 쓰이는 재료
+- GET /ingredients/sets - 자주 함께 입력되는 재료 조합
+"""
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.ingredient import (
+    IngredientSet,
+    IngredientSuggestResponse,
+    RelatedIngredient,
+    RelatedIngredientsResponse,
+)
+from app.services.ingredient_cooccurrence import ingredient_cooccurrence
+from app.services.ingredient_suggest import TOP_N, ingredient_suggester
+
+router = APIRouter()
+
+
+@router.get(
+    "/suggest",
+    response_model=IngredientSuggestResponse,
+    summary="재료 자동완성",
+    description="입력 중인 재료명(자모 단위 부분 입력, 초성 포함)으로 인기순 재료를 제안합니다.",
+)
+def suggest_ingredients(
+    q: str = Query(
+        ..., min_length=1, max_length=20, description="입력 중인 재료명 (예: 계라, ㄱㄹ)"
+    ),
+    limit: int = Query(TOP_N, ge=1, le=TOP_N),
+    db: Session = Depends(get_db),
+):
+    """
+    ## 재료 자동완성
+
+    - **q**: "계라", "곌"처럼 입력 중인 글자나 "ㄱㄹ" 같은 초성
+    - 저장된 레시피 등장 횟수 기준 인기순
+    """
+    try:
+        ingredient_suggester.sync(db)
+    except Exception:
+        db.rollback()
+    return IngredientSuggestResponse(query=q, suggestions=ingredient_suggester.suggest(q, limit))
+
+
+@router.get(
+    "/related",
+    response_model=RelatedIngredientsResponse,
+    summary="함께 쓰이는 재료",
+    description="사용자 입력/생성 레시피에서 주어진 재료와 가장 자주 함께 등장한 재료를 반환합니다.",
+)
+def related_ingredients(
+    q: str = Query(..., min_length=1, max_length=20, description="재료명 (예: 계란)"),
+    source: Literal["inputs", "recipes"] | None = Query(
+        None, description="inputs: 사용자 입력, recipes: 생성 레시피 (생략 시 합산)"
+    ),
+    limit: int = Query(10, ge=1, le=50),
+):
+    related = ingredient_cooccurrence.top_cooccurring(q, limit=limit, source=source)
+    return RelatedIngredientsResponse(
+        ingredient=q,
+        related=[RelatedIngredient(name=name, count=count) for name, count in related],
+    )
+
+
+@router.get(
+    "/sets",
+    response_model=list[IngredientSet],
+    summary="자주 함께 입력되는 재료 조합",
+    description="사용자가 한 번에 함께 입력한 재료 조합을 검색 횟수 순으로 반환합니다.",
+)
+def common_ingredient_sets(
+    limit: int = Query(10, ge=1, le=50),
+    min_size: int = Query(2, ge=2, le=10, description="조합 최소 재료 수"),
+):
+    return [
+        IngredientSet(ingredients=names, count=count)
+        for names, count in ingredient_cooccurrence.most_common_sets(limit, min_size)
+    ]
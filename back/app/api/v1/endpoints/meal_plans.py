@@ -0,0 +1,58 @@
+"""
+Meal plan API endpoints
+
+- POST /meal-plans - 여러 날 식단 생성 (로그인 필요)
+- GET /meal-plans/{id} - 식단 조회
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.meal_plan import MealPlanCreate, MealPlanResponse
+from app.models.user import User
+from app.services.auth_service import get_current_user
+from app.services.llm_scheduler import LLMTenant
+from app.services.meal_plan_service import create_meal_plan, get_meal_plan
+
+router = APIRouter()
+
+
+@router.post(
+    "",
+    response_model=MealPlanResponse,
+    summary="식단 생성",
+    responses={400: {"description": "잘못된 요청 (생성/검증 실패)"}},
+)
+async def post_meal_plan(
+    plan: MealPlanCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    ## 여러 날 식단 생성
+
+    냉장고 재료로 2~7일 식단을 한 번에 구성하고 기간 전체 장보기 리스트를 반환합니다.
+
+    인증 필요: Authorization: Bearer {token}
+    """
+    try:
+        return await create_meal_plan(
+            plan, db, tenant=LLMTenant.for_user(current_user.id), user_id=current_user.id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@router.get(
+    "/{plan_id}",
+    response_model=MealPlanResponse,
+    summary="식단 조회",
+    responses={404: {"description": "해당 ID의 식단을 찾을 수 없음"}},
+)
+def get_meal_plans(plan_id: str, db: Session = Depends(get_db)):
+    """저장된 식단을 ID로 조회합니다."""
+    meal_plan = get_meal_plan(plan_id, db)
+    if meal_plan is None:
+        raise HTTPException(status_code=404, detail="not_found")
+    return meal_plan
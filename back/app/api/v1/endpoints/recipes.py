@@ -0,0 +1,43 @@
+"""
+Recipe search endpoint
+
+지금까지 생성된 레시피 검색 (제목/요약/재료, 문자 n-gram 유사도)
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.models.recipe_search import RecipeSearchHit, RecipeSearchResponse
+from app.services.recipe_index import SYNC_BATCH_SIZE
+from app.services.recipe_search import recipe_search_index
+
+router = APIRouter()
+
+
+@router.get(
+    "/search",
+    response_model=RecipeSearchResponse,
+    summary="레시피 검색",
+    description="저장된 모든 레시피에서 제목/요약/재료가 비슷한 레시피를 찾습니다.",
+)
+def search_recipes(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (예: 김치 볶음밥)"),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    recipe_search_index.sync(db, limit=SYNC_BATCH_SIZE)
+    hits = recipe_search_index.search(q.strip(), limit=limit)
+    return RecipeSearchResponse(
+        query=q,
+        total_indexed=len(recipe_search_index),
+        items=[
+            RecipeSearchHit(
+                recommendation_id=entry.recommendation_id,
+                recipe_index=entry.recipe_index,
+                score=round(score, 4),
+                recipe=entry.recipe,
+            )
+            for entry, score in hits
+        ],
+    )
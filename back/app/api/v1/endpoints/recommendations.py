@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
@@ -11,8 +13,10 @@ from app.models.recommendation import (
 from app.models.search_history import SearchHistoryCreate
 from app.models.user import User
 from app.services.auth_service import get_current_user_optional
+from app.services.llm_scheduler import LLMTenant
 from app.services.recommendation_service import create_recommendation, get_recommendation
 from app.services.search_history_service import SearchHistoryService
+from app.services.translation_service import translate_response
 from app.services.usage_service import UsageService
 
 router = APIRouter()
@@ -97,8 +101,16 @@ async def post_recommendations(
                 headers={"X-Daily-Remaining": "0"},
             )
 
+    # LLM 호출 공정 스케줄링 단위 (로그인 사용자 우선)
+    if current_user:
+        tenant = LLMTenant.for_user(current_user.id)
+    else:
+        tenant = LLMTenant.for_guest(client_ip)
+
     try:
-        response = await create_recommendation(payload, db)
+        response = await create_recommendation(
+            payload, db, tenant=tenant, user_id=current_user.id if current_user else None
+        )
 
         # 비로그인 사용자 사용량 증가
         if not current_user:
@@ -144,6 +156,7 @@ async def post_recommendations(
 )
 def get_recommendations(
     recommendation_id: str,
+    lang: Literal["ko", "en"] = Query(default="ko", description="응답 언어 (en: 영어 번역)"),
     db: Session = Depends(get_db),
 ):
     """
@@ -154,10 +167,15 @@ def get_recommendations(
     ### Path Parameters
     - **recommendation_id**: 추천 ID (예: rec_abc1234567)
 
+    ### Query Parameters
+    - **lang**: `en`이면 영어로 번역 (레시피별 최초 1회만 번역 후 캐시)
+
     ### 응답
     - 생성 시점의 전체 추천 데이터 (레시피 3개 + 장보기 리스트)
     """
     rec = get_recommendation(recommendation_id, db)
     if rec is None:
         raise HTTPException(status_code=404, detail="not_found")
+    if lang != "ko":
+        rec = translate_response(rec, lang, db)
     return rec
@@ -1,15 +1,20 @@
 """
 Public stats endpoint
 
-사용 통계 공개 API (레시피 수, 사용자 수)
+사용 통계 공개 API (레시피 수, 사용자 수, 요즘 인기) + 운영자용 비용 원장 집계
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.models.recommendation import RecommendationRecord
+from app.models.trending import TrendingItem, TrendingResponse
+from app.models.usage_ledger import UsageRollup
 from app.models.user import User
+from app.services.trending import trending_service
+from app.services.usage_ledger import UsageLedgerService
 
 router = APIRouter()
 
@@ -26,3 +31,33 @@ def get_stats(db: Session = Depends(get_db)):
         "total_recipes_generated": total_recs * 3,
         "total_users": total_users,
     }
+
+
+@router.get(
+    "/trending",
+    response_model=TrendingResponse,
+    summary="요즘 인기 재료/레시피",
+    description="최근 추천/즐겨찾기 기준 인기 재료와 레시피를 반환합니다 (하루 반감기 시간 감쇠).",
+)
+def get_trending(limit: int = Query(10, ge=1, le=50)):
+    trending = trending_service.get_trending(limit=limit)
+    return TrendingResponse(
+        ingredients=[TrendingItem(name=n, score=s) for n, s in trending["ingredients"]],
+        recipes=[TrendingItem(name=n, score=s) for n, s in trending["recipes"]],
+    )
+
+
+@router.get(
+    "/usage",
+    response_model=list[UsageRollup],
+    summary="사용량/비용 집계 (운영자)",
+    description="최근 N일 일자/공급자/모델별 토큰 사용량과 비용을 반환합니다. X-Admin-Key 헤더 필요.",
+)
+def get_usage_rollup(
+    days: int = Query(7, ge=1, le=90),
+    x_admin_key: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    if not settings.admin_api_key or x_admin_key != settings.admin_api_key:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    return UsageLedgerService(db).rollup(days=days)
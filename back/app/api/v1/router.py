@@ -3,6 +3,9 @@ from fastapi import APIRouter
 from app.api.v1.endpoints.auth import router as auth_router
 from app.api.v1.endpoints.favorites import router as favorites_router
 from app.api.v1.endpoints.images import router as images_router
+from app.api.v1.endpoints.ingredients import router as ingredients_router
+from app.api.v1.endpoints.meal_plans import router as meal_plans_router
+from app.api.v1.endpoints.recipes import router as recipes_router
 from app.api.v1.endpoints.recommendations import router as recommendations_router
 from app.api.v1.endpoints.search_histories import router as search_histories_router
 from app.api.v1.endpoints.stats import router as stats_router
@@ -11,6 +14,9 @@ api_router = APIRouter()
 api_router.include_router(
     recommendations_router, prefix="/recommendations", tags=["recommendations"]
 )
+api_router.include_router(recipes_router, prefix="/recipes", tags=["recipes"])
+api_router.include_router(meal_plans_router, prefix="/meal-plans", tags=["meal-plans"])
+api_router.include_router(ingredients_router, prefix="/ingredients", tags=["ingredients"])
 api_router.include_router(auth_router, prefix="/auth", tags=["auth"])
 api_router.include_router(favorites_router, prefix="/favorites", tags=["favorites"])
 api_router.include_router(
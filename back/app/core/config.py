@@ -16,8 +16,14 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expiration_minutes: int = 1440  # 24 hours
 
-    # Recipe Provider (youtube | anthropic | mock)
+    # Recipe Provider (youtube | anthropic | retrieval | local | mock)
+    # retrieval: 기존 생성 레시피 역색인 검색 우선, 3개 미만이면 anthropic 생성
+    # local: 번들 레시피 코퍼스(mmap) 검색 (네트워크/비용 없음, 장애 시 폴백으로도 사용)
     recipe_provider: str = "youtube"
+    retrieval_min_score: float = 0.5  # 커버리지 점수 하한 (0~1)
+    local_corpus_path: str | None = None  # 기본: back/data/recipes.corpus
+    allergen_data_path: str | None = None  # 기본: app/data/allergen_derivatives.json
+    dish_lexicon_path: str | None = None  # 기본: app/data/korean_dishes.json
 
     # LLM
     llm_provider: str = "anthropic"
@@ -26,6 +32,31 @@ class Settings(BaseSettings):
     llm_temperature: float = 0.7
     llm_max_tokens: int = 4000
 
+    # LLM 호출 스케줄러 (테넌트별 가중 공정 큐잉)
+    llm_max_concurrency: int = 8  # 워커당 동시 Anthropic 호출 상한
+    llm_tenant_concurrency: int = 2  # 테넌트(사용자/게스트 IP)당 동시 호출 상한
+    llm_user_weight: float = 3.0  # 로그인 사용자 가중치
+    llm_guest_weight: float = 1.0  # 게스트 가중치
+    llm_queue_timeout: float = 20.0  # 슬롯 대기 최대 시간 (초)
+    llm_executor_threads: int = 32  # LLM 호출 전용 스레드 수 (슬롯 대기 스레드 포함)
+
+    # 모델 라우팅 (요청별 Haiku/Sonnet 선택, anthropic provider)
+    llm_routing_enabled: bool = False
+    llm_routing_complexity_threshold: float = 4.0  # 이 점수 미만이면 Haiku
+    llm_routing_latency_budget: float = 20.0  # Sonnet EWMA 지연이 넘으면 Haiku로 우회 (초)
+    llm_routing_error_threshold: float = 0.5  # EWMA 에러율이 넘으면 다른 모델로 우회
+
+    # 요청 간 마이크로 배칭 (opt-in, anthropic provider)
+    llm_batch_enabled: bool = False
+    llm_batch_window_ms: int = 50  # 배치 수집 대기 시간
+    llm_batch_max_size: int = 4  # 한 번에 묶을 최대 요청 수
+    llm_batch_max_tokens: int = 16000  # 배치 호출 max_tokens 상한
+
+    # 사용량 원장 / 일일 비용 예산 (0 = 무제한, 초과 시 Haiku + 캐시 이미지만 사용)
+    daily_cost_budget_usd: float = 0.0
+    # 운영자 전용 API 키 (비어 있으면 /stats/usage 비활성화)
+    admin_api_key: str = ""
+
     # YouTube Data API v3
     youtube_api_key: str | None = None
 
@@ -33,6 +64,7 @@ class Settings(BaseSettings):
     haiku_model: str = "claude-haiku-4-5-20251001"
     haiku_max_tokens: int = 3000
     haiku_temperature: float = 0.3
+    haiku_description_token_budget: int = 250  # 영상 1개 설명에 쓸 입력 토큰 예산 (추정치)
 
     # Coupang
     coupang_partners_tracking_id: str | None = None
@@ -1,66 +1,91 @@
-"""알러지 재료와 파생 재료 매핑"""
-
-ALLERGEN_DERIVATIVES: dict[str, list[str]] = {
-    # 토마토
-    "토마토": [
-        "케첩",
-        "토마토소스",
-        "토마토페이스트",
-        "토마토퓨레",
-        "파스타소스",
-        "피자소스",
-        "마리나라소스",
-    ],
-    # 유제품
-    "우유": [
-        "치즈",
-        "버터",
-        "크림",
-        "생크림",
-        "요거트",
-        "요구르트",
-        "분유",
-        "연유",
-        "휘핑크림",
-        "모짜렐라",
-    ],
-    # 계란
-    "계란": ["달걀", "난황", "난백", "마요네즈", "마요"],
-    # 땅콩/견과류
-    "땅콩": ["피넛버터", "땅콩버터", "땅콩소스"],
-    # 대두
-    "대두": ["두부", "된장", "간장", "청국장", "콩나물", "두유", "미소", "콩"],
-    # 밀/글루텐
-    "밀": ["밀가루", "빵가루", "파스타", "국수", "라면", "우동", "소면", "스파게티", "빵"],
-    # 갑각류
-    "갑각류": ["새우", "게", "랍스터", "가재", "새우젓", "게장"],
-    "새우": ["새우젓"],
-    # 생선
-    "생선": ["멸치", "참치", "연어", "고등어", "어묵", "액젓", "피시소스", "멸치액젓"],
-}
-
-
-def get_all_derivatives(allergen: str) -> set[str]:
-    """알러지 재료와 모든 파생 재료 반환"""
-    allergen_normalized = allergen.strip().lower()
-    result = {allergen_normalized}
+"""
+알러지 재료와 파생 재료 매핑
+
+매핑 테이블은 JSON 데이터 파일(기본 `allergen_derivatives.json`, `ALLERGEN_DATA_PATH`로 교체)에서
+읽어 import 시점에 역색인(재료 → 확장 집합)을 한 번만 만듭니다.
+조회는 dict 한 번으로 끝나므로 알러지 그룹이 수백 개로 늘어도 요청 경로 비용은 같습니다.
+
+- 재료가 그룹의 기준 재료이거나 파생 재료면 그룹 전체로 확장
+- 확장 결과에 다른 그룹의 기준 재료가 있으면 그 그룹도 포함 (전이 폐포: 갑각류 → 새우 → 새우젓)
+- 매칭은 부분 문자열 기준이므로 "꽃게", "콩국수" 같은 합성어는 기준 재료로 이미 걸림
+  (재료가 아닌 단어의 오탐은 `exclusion_matcher.FALSE_POSITIVES`에서 예외 처리)
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+
+from app.core.config import settings
+
+DEFAULT_DATA_PATH = Path(__file__).with_name("allergen_derivatives.json")
+
+
+def load_allergen_table(path: str | Path | None = None) -> dict[str, list[str]]:
+    """데이터 파일 → {기준 재료: [파생 재료, ...]}"""
+    path = Path(path or settings.allergen_data_path or DEFAULT_DATA_PATH)
+    with path.open(encoding="utf-8") as f:
+        table = json.load(f)
+    return {base: list(derivatives) for base, derivatives in table.items()}
 
-    for base, derivatives in ALLERGEN_DERIVATIVES.items():
-        base_lower = base.lower()
-        derivatives_lower = [d.lower() for d in derivatives]
 
-        # allergen이 base거나 derivatives에 포함되면 전체 그룹 추가
-        if allergen_normalized == base_lower or allergen_normalized in derivatives_lower:
-            result.add(base_lower)
-            result.update(derivatives_lower)
+def build_reverse_index(table: dict[str, list[str]]) -> dict[str, frozenset[str]]:
+    """
+    재료 → 확장 집합 역색인 (전이 폐포 포함)
+
+    그룹 = 기준 재료 + 파생 재료. 재료가 속한 그룹들의 합집합에서 시작해
+    새로 들어온 재료가 다른 그룹의 기준 재료면 그 그룹을 더하는 과정을 더 늘지 않을 때까지 반복합니다.
+    """
+    groups: dict[str, frozenset[str]] = {}
+    for base, derivatives in table.items():
+        key = base.strip().lower()
+        groups[key] = groups.get(key, frozenset()) | {
+            key,
+            *(d.strip().lower() for d in derivatives),
+        }
+
+    member_of: dict[str, list[str]] = {}
+    for base, members in groups.items():
+        for term in members:
+            member_of.setdefault(term, []).append(base)
+
+    index: dict[str, frozenset[str]] = {}
+    for term, bases in member_of.items():
+        closure: set[str] = set()
+        pending = list(bases)
+        seen: set[str] = set()
+        while pending:
+            base = pending.pop()
+            if base in seen:
+                continue
+            seen.add(base)
+            for member in groups[base]:
+                if member not in closure:
+                    closure.add(member)
+                    if member in groups:
+                        pending.append(member)
+        index[term] = frozenset(closure)
+    return index
+
+
+ALLERGEN_DERIVATIVES: dict[str, list[str]] = load_allergen_table()
+_REVERSE_INDEX: dict[str, frozenset[str]] = build_reverse_index(ALLERGEN_DERIVATIVES)
+
+
+@lru_cache(maxsize=4096)
+def get_all_derivatives(allergen: str) -> frozenset[str]:
+    """알러지 재료와 모든 파생 재료 반환 (매핑에 없으면 자기 자신만)"""
+    allergen_normalized = allergen.strip().lower()
+    return _REVERSE_INDEX.get(allergen_normalized, frozenset({allergen_normalized}))
+
 
-    return result
+@lru_cache(maxsize=1024)
+def _expand(exclusions: frozenset[str]) -> frozenset[str]:
+    return frozenset().union(*(get_all_derivatives(e) for e in exclusions))
 
 
-def expand_exclusions(exclusions: list[str]) -> set[str]:
-    """제외 재료 목록을 파생 재료까지 확장"""
-    expanded = set()
-    for excl in exclusions:
-        if excl and excl.strip():
-            expanded.update(get_all_derivatives(excl.strip()))
-    return expanded
+def expand_exclusions(exclusions: Iterable[str]) -> frozenset[str]:
+    """제외 재료 목록을 파생 재료까지 확장 (같은 집합은 캐시 재사용)"""
+    return _expand(frozenset(e.strip().lower() for e in exclusions if e and e.strip()))
@@ -0,0 +1,54 @@
+"""재료 동의어 → 대표 재료명 (분량/수식어 제거 후 비교)"""
+
+INGREDIENT_SYNONYMS: dict[str, str] = {
+    # 계란
+    "달걀": "계란",
+    "에그": "계란",
+    # 육류
+    "쇠고기": "소고기",
+    "소 고기": "소고기",
+    "돼지 고기": "돼지고기",
+    "돈육": "돼지고기",
+    "닭 가슴살": "닭가슴살",
+    "닭고기 가슴살": "닭가슴살",
+    "닭": "닭고기",
+    # 채소/버섯
+    "청양 고추": "청양고추",
+    "깐마늘": "마늘",
+    "통마늘": "마늘",
+    "간마늘": "마늘",
+    "양송이": "양송이버섯",
+    "팽이": "팽이버섯",
+    "표고": "표고버섯",
+    "새송이": "새송이버섯",
+    "숙주나물": "숙주",
+    # 면/곡류
+    "스파게티면": "스파게티",
+    "파스타면": "파스타",
+    "흰쌀밥": "밥",
+    "쌀밥": "밥",
+    "공깃밥": "밥",
+    "즉석밥": "밥",
+    # 유제품
+    "모차렐라": "모짜렐라",
+    "모짜렐라치즈": "모짜렐라",
+    "모차렐라치즈": "모짜렐라",
+    "모짜렐라 치즈": "모짜렐라",
+    "슬라이스치즈": "치즈",
+    "슬라이스 치즈": "치즈",
+    # 양념
+    "후춧가루": "후추",
+    "백설탕": "설탕",
+    "흑설탕": "설탕",
+    "굵은소금": "소금",
+    "꽃소금": "소금",
+    "맛소금": "소금",
+    "진간장": "간장",
+    "양조간장": "간장",
+    "올리브오일": "올리브유",
+    "케찹": "케첩",
+    "마요": "마요네즈",
+    "참깨": "깨",
+    "통깨": "깨",
+    "식물성 기름": "식용유",
+}
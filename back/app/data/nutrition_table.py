@@ -0,0 +1,141 @@
+"""재료별 영양 성분 (가식부 100g 기준, 식품성분표 근사값)"""
+
+from typing import NamedTuple
+
+
+class NutritionEntry(NamedTuple):
+    kcal: float
+    protein: float
+    fat: float
+    carbs: float
+    serving_g: float  # 분량 표기가 없을 때 1인분에 쓰는 양 (g)
+    piece_g: float | None = None  # "N개/알/마리/쪽/장" 1단위 무게 (g)
+
+
+NUTRITION_TABLE: dict[str, NutritionEntry] = {
+    # 곡류/면/빵
+    "밥": NutritionEntry(143, 2.5, 0.3, 31.7, 210),
+    "쌀": NutritionEntry(357, 6.4, 0.9, 79.3, 90),
+    "현미밥": NutritionEntry(148, 3.0, 1.0, 31.0, 210),
+    "떡": NutritionEntry(225, 4.0, 0.4, 50.0, 100),
+    "라면": NutritionEntry(450, 9.0, 16.0, 66.0, 120, 120),
+    "국수": NutritionEntry(280, 8.0, 1.0, 58.0, 90),
+    "소면": NutritionEntry(280, 8.0, 1.0, 58.0, 90),
+    "우동": NutritionEntry(105, 2.6, 0.4, 22.0, 230, 230),
+    "파스타": NutritionEntry(371, 13.0, 1.5, 75.0, 90),
+    "스파게티": NutritionEntry(371, 13.0, 1.5, 75.0, 90),
+    "식빵": NutritionEntry(265, 9.0, 3.5, 49.0, 60, 30),
+    "빵": NutritionEntry(265, 9.0, 3.5, 49.0, 60),
+    "또띠아": NutritionEntry(310, 8.0, 7.0, 52.0, 50, 50),
+    "밀가루": NutritionEntry(364, 10.0, 1.0, 76.0, 30),
+    "부침가루": NutritionEntry(350, 9.0, 1.5, 75.0, 30),
+    "빵가루": NutritionEntry(395, 13.0, 5.0, 72.0, 10),
+    "감자": NutritionEntry(66, 2.0, 0.1, 15.0, 100, 150),
+    "고구마": NutritionEntry(128, 1.4, 0.2, 31.0, 100, 200),
+    # 육류/가공육
+    "돼지고기": NutritionEntry(242, 17.0, 19.0, 0.0, 100),
+    "삼겹살": NutritionEntry(331, 17.0, 28.0, 0.0, 100),
+    "소고기": NutritionEntry(218, 20.0, 15.0, 0.0, 100),
+    "닭고기": NutritionEntry(165, 21.0, 8.0, 0.0, 120),
+    "닭가슴살": NutritionEntry(109, 23.0, 1.2, 0.0, 100, 100),
+    "햄": NutritionEntry(240, 14.0, 19.0, 4.0, 40),
+    "스팸": NutritionEntry(310, 13.0, 27.0, 3.0, 50),
+    "소시지": NutritionEntry(260, 12.0, 22.0, 4.0, 50, 25),
+    "베이컨": NutritionEntry(400, 14.0, 38.0, 1.0, 30, 15),
+    # 해산물
+    "참치": NutritionEntry(190, 24.0, 10.0, 0.0, 60),
+    "참치캔": NutritionEntry(190, 24.0, 10.0, 0.0, 80, 100),
+    "연어": NutritionEntry(206, 20.0, 13.0, 0.0, 100),
+    "고등어": NutritionEntry(183, 20.0, 11.0, 0.0, 100),
+    "오징어": NutritionEntry(87, 18.0, 1.0, 1.0, 80, 250),
+    "새우": NutritionEntry(85, 19.0, 0.5, 0.0, 60, 15),
+    "멸치": NutritionEntry(270, 48.0, 5.0, 0.0, 10),
+    "어묵": NutritionEntry(135, 10.0, 4.0, 14.0, 60, 30),
+    "맛살": NutritionEntry(95, 8.0, 0.5, 14.0, 40, 20),
+    "김": NutritionEntry(190, 41.0, 1.7, 40.0, 2, 2),
+    "미역": NutritionEntry(18, 2.0, 0.3, 3.0, 50),
+    # 계란/콩/유제품
+    "계란": NutritionEntry(143, 12.6, 9.5, 0.7, 100, 50),
+    "달걀": NutritionEntry(143, 12.6, 9.5, 0.7, 100, 50),
+    "메추리알": NutritionEntry(158, 13.0, 11.0, 0.4, 40, 10),
+    "두부": NutritionEntry(84, 9.0, 5.0, 2.0, 150, 300),
+    "순두부": NutritionEntry(46, 5.0, 2.5, 1.5, 200, 350),
+    "콩나물": NutritionEntry(30, 3.5, 1.0, 3.0, 70),
+    "우유": NutritionEntry(65, 3.2, 3.5, 4.8, 200),
+    "치즈": NutritionEntry(330, 20.0, 26.0, 3.0, 20, 18),
+    "모짜렐라": NutritionEntry(280, 22.0, 20.0, 3.0, 40),
+    "버터": NutritionEntry(717, 0.9, 81.0, 0.1, 10),
+    "생크림": NutritionEntry(345, 2.0, 37.0, 3.0, 50),
+    "요거트": NutritionEntry(90, 4.0, 3.0, 12.0, 100, 85),
+    # 채소/버섯
+    "김치": NutritionEntry(20, 1.5, 0.5, 3.5, 80),
+    "양파": NutritionEntry(37, 1.0, 0.1, 8.5, 50, 200),
+    "대파": NutritionEntry(27, 1.5, 0.3, 5.5, 15, 80),
+    "파": NutritionEntry(27, 1.5, 0.3, 5.5, 10, 80),
+    "쪽파": NutritionEntry(25, 2.0, 0.3, 4.5, 10),
+    "마늘": NutritionEntry(130, 6.0, 0.2, 28.0, 5, 5),
+    "생강": NutritionEntry(58, 1.5, 0.5, 12.0, 3),
+    "당근": NutritionEntry(37, 1.0, 0.2, 8.5, 40, 150),
+    "애호박": NutritionEntry(20, 1.5, 0.2, 3.5, 80, 300),
+    "호박": NutritionEntry(20, 1.5, 0.2, 3.5, 80),
+    "오이": NutritionEntry(12, 1.0, 0.1, 2.5, 60, 200),
+    "배추": NutritionEntry(13, 1.0, 0.1, 2.5, 80),
+    "양배추": NutritionEntry(25, 1.3, 0.1, 5.5, 70),
+    "무": NutritionEntry(18, 0.8, 0.1, 4.0, 80),
+    "시금치": NutritionEntry(23, 3.0, 0.4, 3.5, 60),
+    "상추": NutritionEntry(15, 1.4, 0.2, 2.5, 30),
+    "깻잎": NutritionEntry(40, 4.0, 0.3, 7.0, 10, 2),
+    "브로콜리": NutritionEntry(34, 3.0, 0.4, 6.5, 60),
+    "파프리카": NutritionEntry(27, 1.0, 0.3, 6.0, 50, 150),
+    "피망": NutritionEntry(20, 1.0, 0.2, 4.5, 40, 100),
+    "고추": NutritionEntry(30, 1.5, 0.3, 6.5, 5, 10),
+    "청양고추": NutritionEntry(30, 1.5, 0.3, 6.5, 5, 10),
+    "토마토": NutritionEntry(18, 0.9, 0.2, 3.9, 100, 150),
+    "방울토마토": NutritionEntry(20, 1.0, 0.2, 4.0, 60, 15),
+    "가지": NutritionEntry(20, 1.1, 0.1, 4.5, 80, 150),
+    "버섯": NutritionEntry(25, 3.0, 0.3, 4.0, 50),
+    "팽이버섯": NutritionEntry(37, 2.7, 0.3, 7.0, 50, 150),
+    "표고버섯": NutritionEntry(34, 2.2, 0.5, 7.0, 30, 20),
+    "숙주": NutritionEntry(30, 3.0, 0.2, 5.0, 70),
+    "옥수수": NutritionEntry(96, 3.4, 1.5, 21.0, 50),
+    "아보카도": NutritionEntry(160, 2.0, 15.0, 9.0, 70, 140),
+    # 양념/소스
+    "간장": NutritionEntry(53, 8.0, 0.0, 5.0, 10),
+    "고추장": NutritionEntry(210, 4.0, 2.0, 45.0, 15),
+    "된장": NutritionEntry(170, 12.0, 6.0, 17.0, 15),
+    "고춧가루": NutritionEntry(300, 13.0, 10.0, 55.0, 3),
+    "설탕": NutritionEntry(387, 0.0, 0.0, 100.0, 5),
+    "올리고당": NutritionEntry(300, 0.0, 0.0, 75.0, 7),
+    "꿀": NutritionEntry(304, 0.3, 0.0, 82.0, 7),
+    "소금": NutritionEntry(0, 0.0, 0.0, 0.0, 1),
+    "후추": NutritionEntry(250, 10.0, 3.0, 64.0, 0.5),
+    "식용유": NutritionEntry(884, 0.0, 100.0, 0.0, 7),
+    "기름": NutritionEntry(884, 0.0, 100.0, 0.0, 7),
+    "올리브유": NutritionEntry(884, 0.0, 100.0, 0.0, 7),
+    "참기름": NutritionEntry(884, 0.0, 100.0, 0.0, 4),
+    "들기름": NutritionEntry(884, 0.0, 100.0, 0.0, 4),
+    "참깨": NutritionEntry(573, 18.0, 50.0, 23.0, 2),
+    "깨": NutritionEntry(573, 18.0, 50.0, 23.0, 2),
+    "마요네즈": NutritionEntry(680, 1.0, 75.0, 1.0, 10),
+    "케첩": NutritionEntry(110, 1.5, 0.2, 26.0, 15),
+    "굴소스": NutritionEntry(120, 3.0, 0.3, 25.0, 8),
+    "식초": NutritionEntry(20, 0.0, 0.0, 1.0, 5),
+    "맛술": NutritionEntry(230, 0.2, 0.0, 40.0, 7),
+    "물엿": NutritionEntry(300, 0.0, 0.0, 75.0, 7),
+    "카레": NutritionEntry(480, 6.0, 30.0, 45.0, 25),
+    "물": NutritionEntry(0, 0.0, 0.0, 0.0, 0),
+}
+
+# "N큰술" 등 부피/개수 단위 → g (개수 단위는 재료별 piece_g 사용)
+UNIT_GRAMS: dict[str, float] = {
+    "g": 1,
+    "kg": 1000,
+    "ml": 1,
+    "l": 1000,
+    "큰술": 15,
+    "작은술": 5,
+    "컵": 200,
+    "줌": 30,
+    "꼬집": 0.5,
+}
+PIECE_UNITS = ("개", "알", "마리", "쪽", "장", "조각", "모", "봉지", "팩", "캔", "통")
@@ -1,4 +1,5 @@
 import os
+import threading
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -10,6 +11,14 @@ from starlette.staticfiles import StaticFiles
 from app.api.v1.router import api_router
 from app.core.config import settings
 from app.core.database import create_tables
+from app.services.ingredient_cooccurrence import ingredient_cooccurrence
+from app.services.ingredient_suggest import ingredient_suggester
+from app.services.llm_scheduler import shutdown_llm_executor
+from app.services.recipe_index import recipe_index
+from app.services.recipe_search import recipe_search_index
+from app.services.trending import trending_service
+from app.services.youtube_adapter import close_http_client
+from app.services.youtube_video_index import youtube_video_index
 
 if settings.sentry_dsn:
     sentry_sdk.init(
@@ -22,9 +31,22 @@ if settings.sentry_dsn:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """앱 시작 시 DB 테이블 생성"""
+    """
+    앱 시작 시 DB 테이블 생성 + 검색/자동완성/영상 인덱스 백그라운드 색인 + 재료 동시 등장/인기 점수 갱신 작업,
+    종료 시 인기 점수 합산 + 동시 등장 스냅샷 저장 + 공유 HTTP 클라이언트 종료
+    """
     create_tables()
+    threading.Thread(target=recipe_index.warm_up, daemon=True).start()
+    threading.Thread(target=recipe_search_index.warm_up, daemon=True).start()
+    threading.Thread(target=ingredient_suggester.warm_up, daemon=True).start()
+    threading.Thread(target=ingredient_cooccurrence.run, daemon=True).start()
+    threading.Thread(target=youtube_video_index.warm_up, daemon=True).start()
+    threading.Thread(target=trending_service.run, daemon=True).start()
     yield
+    trending_service.stop()
+    ingredient_cooccurrence.stop()
+    shutdown_llm_executor()
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
@@ -46,7 +68,7 @@ def create_app() -> FastAPI:
 
         1. POST `/api/v1/recommendations` - 재료와 제약조건을 입력하여 추천 생성
         2. 응답으로 받은 `id`를 사용하여 추천 조회 가능
-        3. GET `/api/v1/recommendations/{id}` - 저장된 추천 결과 조회
+        3. GET `/api/v1/recommendations/{id}` - 저장된 추천 결과 조회 (`?lang=en`: 영어 번역)
         """,
         version="0.1.0",
         contact={
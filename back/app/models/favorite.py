@@ -5,14 +5,19 @@ Favorite model and schemas
 """
 
 from datetime import datetime
+from uuid import UUID as PyUUID
 from uuid import uuid4
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.models.recommendation import ShoppingItem
+
+# 통합 장보기 리스트 요청당 최대 즐겨찾기 수
+MAX_SHOPPING_LIST_FAVORITES = 200
 
 
 # SQLAlchemy ORM 모델
@@ -75,3 +80,18 @@ class RecommendationLikeStats(BaseModel):
 
     recommendation_id: str
     recipes: list[RecipeLikeCount]
+
+
+class FavoriteShoppingListCreate(BaseModel):
+    """즐겨찾기 통합 장보기 리스트 요청"""
+
+    favorite_ids: list[PyUUID] = Field(
+        min_length=1, max_length=MAX_SHOPPING_LIST_FAVORITES, description="즐겨찾기 ID 목록"
+    )
+
+
+class FavoriteShoppingList(BaseModel):
+    """즐겨찾기 통합 장보기 리스트 응답"""
+
+    recipe_titles: list[str] = Field(description="장보기 리스트에 포함된 레시피 제목")
+    shopping_list: list[ShoppingItem] = Field(description="정규화/중복 제거된 장보기 리스트")
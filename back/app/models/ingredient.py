@@ -0,0 +1,35 @@
+"""
+Ingredient schemas
+
+재료 입력 자동완성, 함께 쓰이는 재료
+"""
+
+from pydantic import BaseModel, Field
+
+
+class IngredientSuggestResponse(BaseModel):
+    """재료 자동완성 응답"""
+
+    query: str
+    suggestions: list[str] = Field(description="인기순 재료명 (정규화된 이름)")
+
+
+class RelatedIngredient(BaseModel):
+    """함께 쓰이는 재료"""
+
+    name: str
+    count: int = Field(description="함께 등장한 횟수")
+
+
+class RelatedIngredientsResponse(BaseModel):
+    """함께 쓰이는 재료 응답"""
+
+    ingredient: str
+    related: list[RelatedIngredient]
+
+
+class IngredientSet(BaseModel):
+    """자주 함께 입력되는 재료 조합"""
+
+    ingredients: list[str]
+    count: int = Field(description="이 조합으로 검색한 횟수")
@@ -0,0 +1,63 @@
+"""
+Meal plan model and schemas
+
+여러 날 식단을 일차 묶음별 생성 호출로 만들고 통합 장보기 리스트 제공
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field, model_validator
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+from app.models.recommendation import Constraints, Recipe, ShoppingItem
+
+# 식단 하나의 최대 레시피 수 (호출당 출력 토큰과 장보기 리스트 크기 대비)
+MAX_PLAN_RECIPES = 14
+
+
+# SQLAlchemy ORM 모델
+class MealPlanRecord(Base):
+    """식단 DB 모델"""
+
+    __tablename__ = "meal_plans"
+
+    id = Column(String(50), primary_key=True)  # "plan_a1b2c3d4e5"
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
+    created_at = Column(DateTime, nullable=False)
+    data = Column(JSON, nullable=False)  # MealPlanResponse 전체를 JSON으로
+
+
+# Pydantic 스키마
+class MealPlanCreate(BaseModel):
+    """식단 생성 요청"""
+
+    ingredients: list[str] = Field(
+        min_length=1, description="냉장고에 있는 재료 목록 (여러 날에 나눠 활용)"
+    )
+    constraints: Constraints = Field(default_factory=Constraints, description="끼니별 조리 제약")
+    days: int = Field(default=5, ge=2, le=7, description="식단 일수")
+    meals_per_day: int = Field(default=1, ge=1, le=2, description="하루 끼니 수")
+
+    @model_validator(mode="after")
+    def check_total(self) -> "MealPlanCreate":
+        if self.days * self.meals_per_day > MAX_PLAN_RECIPES:
+            raise ValueError(f"식단 레시피는 최대 {MAX_PLAN_RECIPES}개까지 가능합니다")
+        return self
+
+
+class MealPlanDay(BaseModel):
+    """하루 식단"""
+
+    day: int = Field(description="일차 (1부터)")
+    recipes: list[Recipe]
+
+
+class MealPlanResponse(BaseModel):
+    """식단 생성 응답"""
+
+    id: str = Field(description="식단 ID (plan_로 시작)")
+    created_at: datetime
+    days: list[MealPlanDay]
+    shopping_list: list[ShoppingItem] = Field(description="전체 기간 통합 장보기 리스트")
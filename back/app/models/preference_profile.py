@@ -0,0 +1,25 @@
+"""
+Preference profile model
+
+즐겨찾기에서 미리 계산한 사용자 취향 가중치 (재료/요리 스타일)
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+# SQLAlchemy ORM 모델
+class PreferenceProfile(Base):
+    """사용자 취향 프로필 DB 모델"""
+
+    __tablename__ = "preference_profiles"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    # {"ing:계란": 3.0, "style:볶음밥": 2.0, "time:quick": 1.0} - 특징별 즐겨찾기 수
+    weights = Column(JSON, nullable=False, default=dict)
+    favorite_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,26 @@
+"""
+Recipe search schemas
+
+저장된 레시피 검색 응답
+"""
+
+from pydantic import BaseModel, Field
+
+from app.models.recommendation import Recipe
+
+
+class RecipeSearchHit(BaseModel):
+    """검색된 레시피 하나"""
+
+    recommendation_id: str = Field(description="레시피가 포함된 추천 ID")
+    recipe_index: int = Field(description="추천 내 레시피 위치 (0, 1, 2)")
+    score: float = Field(description="코사인 유사도 (0~1)")
+    recipe: Recipe
+
+
+class RecipeSearchResponse(BaseModel):
+    """레시피 검색 결과"""
+
+    query: str
+    total_indexed: int = Field(description="검색 대상 레시피 수")
+    items: list[RecipeSearchHit]
@@ -0,0 +1,24 @@
+"""
+Recipe translation model
+
+레시피 내용 해시 기준 번역 캐시 (최초 `?lang=` 요청 시 1회만 번역)
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, String
+
+from app.core.database import Base
+
+
+# SQLAlchemy ORM 모델
+class RecipeTranslation(Base):
+    """레시피 번역 캐시 DB 모델"""
+
+    __tablename__ = "recipe_translations"
+
+    content_hash = Column(String(64), primary_key=True)  # 원문 레시피 SHA256
+    lang = Column(String(8), primary_key=True)  # "en"
+    # {"title", "summary", "ingredients_total", "ingredient_names", "steps", "tips", "warnings"}
+    data = Column(JSON, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
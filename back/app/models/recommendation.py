@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 from sqlalchemy import JSON, Column, DateTime, String
@@ -34,6 +35,19 @@ class RecommendationCreate(BaseModel):
         min_length=1, description="냉장고에 있는 재료 목록 (최소 1개 이상)"
     )
     constraints: Constraints = Field(default_factory=Constraints, description="조리 제약 조건")
+    latency_hint: Literal["fast", "quality"] | None = Field(
+        default=None, description="모델 선택 힌트 (fast: 응답 속도 우선, quality: 품질 우선)"
+    )
+
+
+class Nutrition(BaseModel):
+    """1인분 영양 성분 추정값 (번들 영양표 기준)"""
+
+    calories_kcal: int = Field(description="열량 (kcal)")
+    protein_g: float = Field(description="단백질 (g)")
+    fat_g: float = Field(description="지방 (g)")
+    carbs_g: float = Field(description="탄수화물 (g)")
+    matched_ratio: float = Field(description="영양표에 있는 재료 비율 (0~1, 추정 신뢰도)")
 
 
 class Recipe(BaseModel):
@@ -55,6 +69,7 @@ class Recipe(BaseModel):
     steps: list[str] = Field(description="조리 순서 (4-8단계)")
     tips: list[str] = Field(default_factory=list, description="조리 팁")
     warnings: list[str] = Field(default_factory=list, description="주의사항")
+    nutrition: Nutrition | None = Field(default=None, description="1인분 영양 성분 추정값")
 
 
 class ShoppingItem(BaseModel):
@@ -0,0 +1,41 @@
+"""
+Trending model and schemas
+
+요즘 인기 재료/레시피 (시간 감쇠 점수, 모든 워커의 이벤트를 합산한 공유 점수)
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+from sqlalchemy import Column, DateTime, Float, String
+
+from app.core.database import Base
+
+
+# SQLAlchemy ORM 모델
+class TrendingScore(Base):
+    """인기 항목 감쇠 점수 DB 모델 (워커별 증분을 합산)"""
+
+    __tablename__ = "trending_scores"
+
+    kind = Column(String(20), primary_key=True)  # ingredient | recipe
+    key = Column(String(200), primary_key=True)
+    score = Column(Float, nullable=False)  # updated_at 시점의 감쇠 점수
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+
+# Pydantic 스키마
+
+
+class TrendingItem(BaseModel):
+    """인기 항목"""
+
+    name: str = Field(description="재료명 또는 레시피 제목")
+    score: float = Field(description="시간 감쇠 인기 점수 (하루 전 이벤트는 절반 가중치)")
+
+
+class TrendingResponse(BaseModel):
+    """요즘 인기 응답"""
+
+    ingredients: list[TrendingItem]
+    recipes: list[TrendingItem]
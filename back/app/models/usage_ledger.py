@@ -0,0 +1,54 @@
+"""
+Usage ledger model and schemas
+
+외부 공급자(LLM/이미지) 호출별 실제 토큰 사용량과 비용 기록
+"""
+
+from datetime import date, datetime
+
+from pydantic import BaseModel
+from sqlalchemy import Boolean, Column, Date, DateTime, Float, Integer, String
+
+from app.core.database import Base
+
+
+# SQLAlchemy ORM 모델
+class UsageLedgerEntry(Base):
+    """공급자 호출 1건당 사용량/비용 DB 모델"""
+
+    __tablename__ = "usage_ledger"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    usage_date = Column(Date, nullable=False, default=lambda: datetime.utcnow().date(), index=True)
+    recommendation_id = Column(String(50), nullable=True, index=True)
+
+    provider = Column(String(20), nullable=False)  # anthropic | gemini | google | unsplash ...
+    model = Column(String(100), nullable=False)
+    operation = Column(String(30), nullable=False)  # recipe_generation | haiku_structuring | image
+
+    input_tokens = Column(Integer, nullable=False, default=0)
+    output_tokens = Column(Integer, nullable=False, default=0)
+    cache_read_tokens = Column(Integer, nullable=False, default=0)
+    cache_creation_tokens = Column(Integer, nullable=False, default=0)
+    image_calls = Column(Integer, nullable=False, default=0)
+
+    cost_usd = Column(Float, nullable=False, default=0.0)
+    success = Column(Boolean, nullable=False, default=True)
+
+
+# Pydantic 스키마
+class UsageRollup(BaseModel):
+    """일자/공급자/모델별 사용량 집계"""
+
+    usage_date: date
+    provider: str
+    model: str
+    calls: int
+    failed_calls: int
+    input_tokens: int
+    output_tokens: int
+    cache_read_tokens: int
+    cache_creation_tokens: int
+    image_calls: int
+    cost_usd: float
@@ -0,0 +1,26 @@
+"""
+YouTube video model
+
+검색/상세 조회로 받은 영상 메타데이터 보관 (재료 역색인으로 search.list 호출 생략)
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, BigInteger, Column, DateTime, String, Text
+
+from app.core.database import Base
+
+
+# SQLAlchemy ORM 모델
+class YouTubeVideo(Base):
+    """YouTube 영상 메타데이터 DB 모델"""
+
+    __tablename__ = "youtube_videos"
+
+    video_id = Column(String(32), primary_key=True)
+    title = Column(String(300), nullable=False)
+    description = Column(Text, nullable=False, default="")
+    view_count = Column(BigInteger, nullable=False, default=0)
+    channel_title = Column(String(200), nullable=False, default="")
+    ingredient_keys = Column(JSON, nullable=False)  # 제목/설명에서 뽑은 정규화 재료 키
+    fetched_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
@@ -0,0 +1,73 @@
+"""
+Aho-Corasick 다중 문자열 검색
+
+패턴 집합을 오토마톤으로 한 번 컴파일해 두고, 텍스트를 한 번만 훑어
+모든 패턴의 모든 출현 위치를 찾습니다 (패턴 수와 무관하게 O(텍스트 길이 + 매칭 수)).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+
+class AhoCorasick:
+    """문자 단위 Aho-Corasick 오토마톤"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: list[str] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]  # 상태 → 끝나는 패턴 번호 (실패 링크 출력 포함)
+
+        for pattern in dict.fromkeys(p for p in patterns if p):
+            self._insert(pattern)
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _insert(self, pattern: str) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(len(self.patterns))
+        self.patterns.append(pattern)
+
+    def _build(self) -> None:
+        # BFS로 실패 링크 계산 (얕은 상태의 링크가 먼저 확정됨)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int, str]]:
+        """
+        모든 출현 위치 (겹치는 매칭 포함)
+
+        Yields:
+            (시작 인덱스, 끝 인덱스(미포함), 패턴)
+        """
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                pattern = patterns[index]
+                yield i + 1 - len(pattern), i + 1, pattern
@@ -0,0 +1,248 @@
+"""
+YouTube 영상 설명 → 레시피 규칙 기반 추출
+
+요리 채널 영상 설명에는 "재료:" 목록과 번호 붙은 조리 순서가 이미 들어 있는 경우가 많아,
+이런 영상은 Haiku 호출 없이 설명만으로 레시피를 만들 수 있습니다.
+
+- 재료: "재료", "양념장" 같은 섹션 제목 아래 줄(또는 "재료: 계란 2개, 양파 1개" 같은 한 줄)을
+  분량 기준으로 나누고 공용 정규화기로 재료명 정리
+- 조리 순서: "1.", "2)", "①", "STEP 3" 같은 번호 줄, "만드는 법" 섹션 아래 줄
+- 링크, 해시태그, 구독/협찬 안내, 타임스탬프 줄은 잡음으로 보고 섹션을 끝냄
+- 신뢰도: 재료 수와 단계 수로 0~1 점수, 기준 이상인 영상만 로컬 레시피로 사용
+
+Haiku로 넘기는 영상은 `condense_description`으로 설명 줄마다 점수(재료/조리 순서/잡음)를 매겨
+관련 있는 줄만 토큰 예산 안에서 남깁니다 (앞 500자 자르기는 홍보 문구만 남고 재료 목록이 잘리기 쉬움).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from app.services.dish_lexicon import dish_lexicon
+from app.services.ingredient_normalizer import split_quantities
+
+MIN_INGREDIENTS = 3
+MIN_STEPS = 4
+MAX_STEPS = 8
+CONFIDENCE_THRESHOLD = 0.8
+MAX_TITLE_LENGTH = 20
+
+_INGREDIENT_HEADERS = [
+    "재료", "주재료", "부재료", "필수재료", "필수 재료", "선택재료", "선택 재료",
+    "양념", "양념장", "소스", "ingredients",
+]  # fmt: skip
+_STEP_HEADERS = [
+    "만드는 법", "만드는법", "만드는 방법", "만들기", "조리법", "조리 방법", "조리방법",
+    "조리순서", "조리 순서", "순서", "레시피", "recipe", "how to make",
+]  # fmt: skip
+_NOISE_KEYWORDS = [
+    "http", "www.", "구독", "좋아요", "알림", "instagram", "인스타", "문의", "협찬", "광고",
+    "유료", "제휴", "쿠팡", "business", "music", "bgm", "@",
+]  # fmt: skip
+_TITLE_NOISE = [
+    "황금레시피", "초간단", "레시피", "만들기", "만드는 법", "만드는법", "자취요리", "자취",
+    "백종원", "꿀팁", "shorts",
+]  # fmt: skip
+
+# 줄 앞뒤 장식 문자 (글머리표, 괄호, 이모지 등)
+_DECORATION = re.compile(
+    r"^[\s\-–—•·*▶▷►■□●○◆◇★☆※✔✅✓☑️>\[\]【】<>〈〉《》「」『』=~:：]+|[\s\]】>〉》」』:：]+$"
+)
+_EMOJI = re.compile(r"[\U0001F000-\U0001FAFF☀-➿️]")
+_SECTION = re.compile(
+    r"^(?P<head>"
+    + "|".join(
+        re.escape(h) for h in sorted(_INGREDIENT_HEADERS + _STEP_HEADERS, key=len, reverse=True)
+    )
+    + r")(?:\s*\([^)]*\))?\s*(?P<sep>[:：\]】>)]?)(?:\s*\([^)]*\))?\s*(?P<rest>.*)$",
+    re.IGNORECASE,
+)
+# 번호 뒤에 숫자가 바로 오면 소수/분량("0.5큰술")이나 시각("1:30")이므로 단계가 아님
+_NUMBERED = re.compile(
+    r"^(?:step\s*)?(?:\d{1,2}\s*[.)\]:：](?!\d)|\(\d{1,2}\)|[①-⑳])\s*(?P<text>.+)$",
+    re.IGNORECASE,
+)
+_TIMESTAMP = re.compile(r"^\d{1,2}:\d{2}")
+_SERVINGS = re.compile(r"(\d{1,2})\s*인분")
+_TIME = re.compile(r"(?:조리\s*시간|소요\s*시간|총)\s*[:：]?\s*(?:약\s*)?(\d{1,3})\s*분")
+_ITEM_SPLIT = re.compile(r"[,，、|]|(?<!\d)/|/(?!\d)|\s·\s|\s{2,}")  # "1/2"의 /는 분량
+_BRACKETED = re.compile(r"\[[^\]]*\]|【[^】]*】|\([^)]*\)|#\S+")
+_TITLE_SPLIT = re.compile(r"[|/!?~♥❤]|\s-\s")
+_QUANTITY_HINT = re.compile(
+    r"\d+(?:[./]\d+)?\s*(?:g|kg|ml|개|큰술|작은술|컵|스푼|숟가락|T|t|대|줌|쪽|장)|약간|적당량"
+)
+_COOKING_VERBS = re.compile(
+    r"썰|볶|끓|넣|섞|굽|구워|데치|삶|튀기|졸이|무치|버무|재워|익히|부어|뿌려|올려|담아"
+)
+_HANGUL = re.compile(r"[가-힣]")
+
+
+@dataclass
+class ParsedRecipe:
+    """설명에서 추출한 레시피"""
+
+    title: str
+    ingredients: list[str] = field(default_factory=list)
+    quantities: dict[str, str] = field(default_factory=dict)  # 재료명 → 분량 표기 ("200g")
+    steps: list[str] = field(default_factory=list)
+    servings: int | None = None
+    time_min: int | None = None
+
+    @property
+    def confidence(self) -> float:
+        """재료 수/단계 수 기반 추출 신뢰도 (0~1)"""
+        ingredient_score = min(len(self.ingredients) / MIN_INGREDIENTS, 1.0)
+        step_score = min(len(self.steps) / MIN_STEPS, 1.0)
+        return 0.5 * ingredient_score + 0.5 * step_score
+
+    @property
+    def is_confident(self) -> bool:
+        return self.confidence >= CONFIDENCE_THRESHOLD and len(self.steps) >= MIN_STEPS
+
+
+def _strip(line: str) -> str:
+    return _DECORATION.sub("", _EMOJI.sub("", line)).strip()
+
+
+def _is_noise(line: str) -> bool:
+    lower = line.lower()
+    return (
+        line.startswith("#")
+        or bool(_TIMESTAMP.match(line))
+        or any(k in lower for k in _NOISE_KEYWORDS)
+    )
+
+
+def _is_metadata(line: str) -> bool:
+    """조리시간/인분 정보만 있는 줄인지 (예: "조리시간: 15분", "2인분") - 조리 단계 아님"""
+    for pattern in (_TIME, _SERVINGS):
+        match = pattern.match(line)
+        if match and not line[match.end() :].strip(" )"):
+            return True
+    return False
+
+
+def _add_ingredients(parsed: ParsedRecipe, text: str) -> None:
+    for chunk in _ITEM_SPLIT.split(text):
+        chunk = _strip(chunk)
+        # 문장형 줄("재료는 냉장고에 있는 걸로 해요")은 재료 목록이 아님
+        if not chunk or len(chunk) > 30 or chunk.endswith(("요", "다", ".")):
+            continue
+        for name, quantity in split_quantities(chunk):
+            if len(name) > 15 or name in parsed.quantities or name in parsed.ingredients:
+                continue
+            parsed.ingredients.append(name)
+            if quantity:
+                parsed.quantities[name] = quantity
+
+
+def _fit_steps(steps: list[str]) -> list[str]:
+    """단계가 너무 많으면 이웃 단계를 합쳐 MAX_STEPS 이하로"""
+    while len(steps) > MAX_STEPS:
+        i = min(range(len(steps) - 1), key=lambda k: len(steps[k]) + len(steps[k + 1]))
+        steps = [*steps[:i], f"{steps[i]} {steps[i + 1]}", *steps[i + 2 :]]
+    return steps
+
+
+def clean_title(video_title: str) -> str:
+    """영상 제목 → 레시피 제목 (괄호/해시태그/홍보 문구 제거, 20자 이내)"""
+    text = _EMOJI.sub("", _BRACKETED.sub(" ", video_title))
+    segments = [s.strip() for s in _TITLE_SPLIT.split(text) if s.strip()]
+    # 음식명이 들어 있는 구간 우선
+    segment = next(
+        (s for s in segments if dish_lexicon.longest_match(s)), segments[0] if segments else ""
+    )
+    for word in _TITLE_NOISE:
+        segment = segment.replace(word, " ")
+    title = " ".join(segment.split())
+    if len(title) > MAX_TITLE_LENGTH:
+        match = dish_lexicon.longest_match(title)
+        title = match.korean if match else title[:MAX_TITLE_LENGTH].strip()
+    return title or video_title[:MAX_TITLE_LENGTH]
+
+
+def estimate_tokens(text: str) -> int:
+    """입력 토큰 수 근사 (한글 음절 1토큰, 그 외 4자당 1토큰)"""
+    hangul = len(_HANGUL.findall(text))
+    return hangul + (len(text) - hangul + 3) // 4
+
+
+def score_line(line: str) -> float:
+    """
+    설명 한 줄의 레시피 관련도 점수
+
+    섹션 제목/번호 붙은 단계 3, 분량 표기 2, 조리 동사 1.5, 그 외 0, 잡음 -1
+    """
+    if _is_noise(line):
+        return -1.0
+    header = _SECTION.match(line)
+    if (header and (header.group("sep") or not header.group("rest"))) or _NUMBERED.match(line):
+        return 3.0
+    if _QUANTITY_HINT.search(line):
+        return 2.0
+    if _COOKING_VERBS.search(line):
+        return 1.5
+    return 0.0
+
+
+def condense_description(description: str, budget: int) -> str:
+    """
+    설명에서 관련 있는 줄만 토큰 예산 안에서 남김 (원래 줄 순서 유지)
+
+    점수 높은 줄부터 예산을 채우고, 관련 줄이 하나도 없으면 잡음이 아닌 앞쪽 줄로 채웁니다.
+    """
+    lines = [line for line in (_strip(raw) for raw in description.splitlines()) if line]
+    scored = [(score_line(line), i, line) for i, line in enumerate(lines)]
+    relevant = [item for item in scored if item[0] > 0]
+    pool = relevant or [item for item in scored if item[0] == 0]
+
+    kept: list[tuple[int, str]] = []
+    used = 0
+    for _, i, line in sorted(pool, key=lambda item: (-item[0], item[1])):
+        cost = estimate_tokens(line) + 1  # 줄바꿈
+        if used + cost > budget:
+            continue
+        kept.append((i, line))
+        used += cost
+    return "\n".join(line for _, line in sorted(kept))
+
+
+def parse_description(video_title: str, description: str) -> ParsedRecipe:
+    """영상 제목/설명 → 재료, 분량, 조리 순서 추출"""
+    parsed = ParsedRecipe(title=clean_title(video_title))
+    section: str | None = None  # "ingredients" | "steps" | None
+
+    for raw in description.splitlines():
+        line = _strip(raw)
+        if not line:
+            continue
+        if _is_noise(line):
+            section = None
+            continue
+
+        header = _SECTION.match(line)
+        if header and (header.group("sep") or not header.group("rest")):
+            head = header.group("head").lower()
+            section = "ingredients" if head in _INGREDIENT_HEADERS else "steps"
+            if section == "ingredients" and header.group("rest"):
+                _add_ingredients(parsed, header.group("rest"))
+            continue
+
+        numbered = _NUMBERED.match(line)
+        if numbered:
+            step = _strip(numbered.group("text"))
+            if len(step) >= 4:
+                parsed.steps.append(step)
+            section = "steps"
+        elif section == "ingredients":
+            _add_ingredients(parsed, line)
+        elif section == "steps" and len(line) >= 6 and not _is_metadata(line):
+            parsed.steps.append(line)
+
+    parsed.steps = _fit_steps(parsed.steps)
+    if servings := _SERVINGS.search(description):
+        parsed.servings = int(servings.group(1))
+    if time_match := _TIME.search(description):
+        parsed.time_min = int(time_match.group(1))
+    return parsed
@@ -0,0 +1,78 @@
+"""
+한국 음식명 사전 (최장 일치 검색)
+
+음식명 → 영어 검색어 매핑을 데이터 파일(기본 `app/data/korean_dishes.json`, `DISH_LEXICON_PATH`로 교체)에서 읽어
+Aho-Corasick 오토마톤으로 한 번만 컴파일합니다. 레시피 제목을 한 번 훑어
+가장 긴 음식명을 찾으므로 사전이 수천 개로 늘어도 조회는 O(제목 길이)입니다.
+
+- 최장 일치: "매콤한 김치볶음밥"은 "볶음밥"이 아니라 "김치볶음밥"으로 매칭
+- 공백 무시: "김치 볶음밥"도 "김치볶음밥"으로 매칭
+- 길이가 같으면 제목에서 먼저 나온 음식명 우선
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import NamedTuple
+
+from app.core.config import settings
+from app.services.aho_corasick import AhoCorasick
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "korean_dishes.json"
+
+
+class DishMatch(NamedTuple):
+    """음식명 매칭 결과"""
+
+    korean: str
+    english: str
+
+
+def _compact(text: str) -> str:
+    return "".join(text.split())
+
+
+class DishLexicon:
+    """음식명 → 영어 검색어 최장 일치 사전"""
+
+    def __init__(self, translations: dict[str, str]):
+        self.translations = translations
+        self._by_key: dict[str, str] = {}  # 공백 제거 음식명 → 원래 표기
+        for korean in translations:
+            key = _compact(korean)
+            if key:
+                self._by_key.setdefault(key, korean)
+        self._automaton = AhoCorasick(self._by_key)
+
+    @classmethod
+    def from_file(cls, path: str | Path | None = None) -> DishLexicon:
+        path = Path(path or settings.dish_lexicon_path or DEFAULT_DATA_PATH)
+        with path.open(encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.translations)
+
+    def longest_match(self, title: str) -> DishMatch | None:
+        """제목에 포함된 가장 긴 음식명 (없으면 None)"""
+        best: tuple[int, int, str] | None = None  # (-길이, 시작 위치, 키)
+        for start, end, key in self._automaton.finditer(_compact(title)):
+            candidate = (start - end, start, key)
+            if best is None or candidate < best:
+                best = candidate
+        if best is None:
+            return None
+        korean = self._by_key[best[2]]
+        return DishMatch(korean, self.translations[korean])
+
+    def english(self, title: str) -> str | None:
+        """제목 → 영어 검색어 (매칭 없으면 None)"""
+        match = self.longest_match(title)
+        return match.english if match else None
+
+
+dish_lexicon = DishLexicon.from_file()
@@ -0,0 +1,99 @@
+"""
+제외 재료(알러지) 매처
+
+제외 재료 집합마다 파생 재료까지 확장한 Aho-Corasick 오토마톤을 한 번만 만들고
+(frozenset 기준 LRU 캐시), 레시피 텍스트/영상 제목을 한 번에 훑어 모든 매칭을 위치와 함께 보고합니다.
+
+알러지 안전이 걸린 검사이므로 기본은 부분 문자열 매칭입니다 ("털게찜", "강낭콩", "호밀빵" 모두 매칭).
+한 글자 재료가 들어간 것으로 확인된 일반 단어("맛있게", "비밀", "밀폐")만
+`FALSE_POSITIVES`에 올려 예외로 둡니다 - 매칭 위치를 덮는 예외 단어가 있을 때만 무시합니다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import NamedTuple
+
+from app.data.allergen_derivatives import expand_exclusions
+from app.services.aho_corasick import AhoCorasick
+
+# 재료명이 아닌데 한 글자 알러지 재료를 포함하는 단어 (확인된 오탐만 추가)
+FALSE_POSITIVES: tuple[str, ...] = (
+    # 게: 부사형 어미 "-게"
+    "맛있게", "하게", "있게", "없게", "쉽게", "맵게", "짜게", "달게", "싱겁게", "크게", "작게",
+    "얇게", "굵게", "잘게", "곱게", "길게", "짧게", "두껍게", "부드럽게", "빠르게", "세게",
+    "노랗게", "빨갛게", "뜨겁게", "차갑게", "게임",
+    # 밀
+    "비밀", "밀폐", "밀착", "밀어", "밀대", "치밀", "세밀", "긴밀", "은밀",
+    # 빵
+    "빵빵",
+)  # fmt: skip
+
+
+class ExclusionMatch(NamedTuple):
+    """제외 재료 매칭 결과"""
+
+    term: str
+    start: int
+    end: int
+
+
+class ExclusionMatcher:
+    """컴파일된 제외 재료 매처"""
+
+    def __init__(self, terms: Iterable[str], false_positives: Iterable[str] = FALSE_POSITIVES):
+        self._automaton = AhoCorasick(t.lower() for t in terms if t)
+        # 재료 → [(예외 단어, 예외 단어 안에서 재료 위치)]
+        self._false_positives: dict[str, list[tuple[str, int]]] = {}
+        for term in self._automaton.patterns:
+            for word in false_positives:
+                offset = word.find(term)
+                while offset != -1:
+                    self._false_positives.setdefault(term, []).append((word, offset))
+                    offset = word.find(term, offset + 1)
+
+    def __bool__(self) -> bool:
+        return len(self._automaton) > 0
+
+    @property
+    def terms(self) -> list[str]:
+        return list(self._automaton.patterns)
+
+    def _accept(self, text: str, start: int, end: int, term: str) -> bool:
+        for word, offset in self._false_positives.get(term, ()):
+            begin = start - offset
+            if begin >= 0 and text.startswith(word, begin):
+                return False
+        return True
+
+    def find_all(self, text: str) -> list[ExclusionMatch]:
+        """모든 매칭 (위치 순, 경계 규칙 통과한 것만)"""
+        if not self:
+            return []
+        text = text.lower()
+        return [
+            ExclusionMatch(term, start, end)
+            for start, end, term in self._automaton.finditer(text)
+            if self._accept(text, start, end, term)
+        ]
+
+    def first(self, text: str) -> ExclusionMatch | None:
+        """첫 번째 매칭 (없으면 None)"""
+        if not self:
+            return None
+        text = text.lower()
+        for start, end, term in self._automaton.finditer(text):
+            if self._accept(text, start, end, term):
+                return ExclusionMatch(term, start, end)
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compile(exclusions: frozenset[str]) -> ExclusionMatcher:
+    return ExclusionMatcher(expand_exclusions(exclusions))
+
+
+def get_exclusion_matcher(exclusions: list[str]) -> ExclusionMatcher:
+    """제외 재료 목록 → 파생 재료까지 포함한 매처 (같은 집합은 캐시된 매처 재사용)"""
+    return _compile(frozenset(e.strip().lower() for e in exclusions if e and e.strip()))
@@ -2,8 +2,12 @@
 Favorite service
 
 - 즐겨찾기 추가/삭제/조회
+- 추가/삭제 시 취향 프로필 증분 갱신
+- 여러 즐겨찾기의 통합 장보기 리스트
+- 즐겨찾기 추가 시 인기 레시피 트래커 반영
 """
 
+import logging
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
@@ -16,9 +20,16 @@ from app.models.favorite import (
     FavoriteCheck,
     FavoriteCreate,
     FavoriteResponse,
+    FavoriteShoppingList,
     RecipeLikeCount,
     RecommendationLikeStats,
 )
+from app.models.recommendation import RecommendationRecord
+from app.services.preference_service import PreferenceService
+from app.services.recommendation_service import shopping_items
+from app.services.trending import trending_service
+
+logger = logging.getLogger(__name__)
 
 
 class FavoriteService:
@@ -55,6 +66,8 @@ class FavoriteService:
         self.db.add(favorite)
         self.db.commit()
         self.db.refresh(favorite)
+        self._update_preferences(user_id, favorite.recommendation_id, favorite.recipe_index, +1)
+        trending_service.record_favorite(favorite.recipe_title)
 
         return FavoriteResponse(
             id=str(favorite.id),
@@ -78,8 +91,22 @@ class FavoriteService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="즐겨찾기를 찾을 수 없습니다."
             )
 
+        recommendation_id, recipe_index = favorite.recommendation_id, favorite.recipe_index
         self.db.delete(favorite)
         self.db.commit()
+        self._update_preferences(user_id, recommendation_id, recipe_index, -1)
+
+    def _update_preferences(
+        self, user_id: UUID, recommendation_id: str, recipe_index: int, delta: int
+    ) -> None:
+        """취향 프로필 반영 (실패해도 즐겨찾기 동작에는 영향 없음)"""
+        try:
+            PreferenceService(self.db).apply_favorite(
+                user_id, recommendation_id, recipe_index, delta
+            )
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"취향 프로필 갱신 실패 (무시): {e}")
 
     def get_user_favorites(self, user_id: UUID) -> list[FavoriteResponse]:
         """사용자의 모든 즐겨찾기 조회"""
@@ -102,6 +129,41 @@ class FavoriteService:
             for f in favorites
         ]
 
+    def get_shopping_list(self, user_id: UUID, favorite_ids: list[UUID]) -> FavoriteShoppingList:
+        """
+        여러 즐겨찾기 레시피의 필요 재료를 하나의 장보기 리스트로 통합
+
+        즐겨찾기 수와 관계없이 즐겨찾기 1회 + 추천 레코드 1회(IN 조회)만 실행합니다.
+        다른 사용자의 즐겨찾기 ID는 무시합니다.
+        """
+        favorites = (
+            self.db.query(Favorite.recommendation_id, Favorite.recipe_index)
+            .filter(Favorite.user_id == user_id, Favorite.id.in_(set(favorite_ids)))
+            .order_by(Favorite.created_at)
+            .all()
+        )
+        if not favorites:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="즐겨찾기를 찾을 수 없습니다."
+            )
+
+        records = dict(
+            self.db.query(RecommendationRecord.id, RecommendationRecord.data).filter(
+                RecommendationRecord.id.in_({f.recommendation_id for f in favorites})
+            )
+        )
+
+        titles: list[str] = []
+        need: set[str] = set()
+        for rec_id, index in favorites:
+            recipes = (records.get(rec_id) or {}).get("recipes", [])
+            if not 0 <= index < len(recipes):
+                continue
+            titles.append(recipes[index].get("title", ""))
+            need.update(x for x in recipes[index].get("ingredients_need", []) if x)
+
+        return FavoriteShoppingList(recipe_titles=titles, shopping_list=shopping_items(need))
+
     def check_favorite(
         self, user_id: UUID, recommendation_id: str, recipe_index: int
     ) -> FavoriteCheck:
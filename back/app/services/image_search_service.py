@@ -32,65 +32,14 @@ from urllib.parse import quote
 import httpx
 
 from app.core.config import settings
+from app.services.dish_lexicon import dish_lexicon
+from app.services.usage_ledger import UsageMeter
 
 logger = logging.getLogger(__name__)
 
-# 한국 음식 영어 번역 매핑 사전
+# 한국 음식 영어 번역 매핑 사전 (데이터: app/data/korean_dishes.json)
 # 검색 정확도 향상을 위해 한국어 + 영어 + 문맥 키워드 조합
-KOREAN_FOOD_TRANSLATIONS: dict[str, str] = {
-    # 밥/면 요리
-    "김치볶음밥": "kimchi fried rice korean food",
-    "볶음밥": "fried rice korean",
-    "비빔밥": "bibimbap mixed rice bowl korean",
-    "덮밥": "rice bowl donburi korean",
-    "김밥": "gimbap kimbap korean sushi roll",
-    "주먹밥": "jumeokbap rice ball korean",
-    "잡채": "japchae glass noodles korean",
-    "라면": "ramyeon korean instant noodles",
-    "칼국수": "kalguksu knife-cut noodles korean",
-    "냉면": "naengmyeon cold noodles korean",
-    "비빔국수": "bibim guksu spicy noodles korean",
-    # 찌개/국
-    "된장찌개": "doenjang jjigae soybean paste stew korean",
-    "김치찌개": "kimchi jjigae stew korean",
-    "순두부찌개": "sundubu jjigae soft tofu stew korean",
-    "부대찌개": "budae jjigae army stew korean",
-    "된장국": "doenjang guk soybean paste soup korean",
-    "미역국": "miyeok guk seaweed soup korean",
-    "계란국": "gyeran guk egg soup korean",
-    "콩나물국": "kongnamul guk bean sprout soup korean",
-    # 고기 요리
-    "불고기": "bulgogi korean bbq beef marinated",
-    "제육볶음": "jeyuk bokkeum spicy pork stir-fry korean",
-    "닭볶음탕": "dak bokkeum tang spicy chicken stew korean",
-    "삼겹살": "samgyeopsal pork belly korean bbq",
-    "갈비": "galbi korean bbq ribs",
-    "닭갈비": "dak galbi spicy chicken ribs korean",
-    "돼지갈비": "dwaeji galbi pork ribs korean",
-    # 계란 요리
-    "계란말이": "gyeran mari rolled omelette korean",
-    "계란찜": "gyeran jjim steamed egg korean",
-    "계란후라이": "fried egg korean",
-    "스크램블": "scrambled eggs",
-    # 반찬
-    "김치": "kimchi korean fermented cabbage",
-    "나물": "namul seasoned vegetables korean",
-    "시금치나물": "sigeumchi namul spinach korean",
-    "콩나물무침": "kongnamul muchim bean sprout korean",
-    "무생채": "mu saengchae radish salad korean",
-    # 튀김/전
-    "김치전": "kimchi jeon pancake korean",
-    "파전": "pajeon green onion pancake korean",
-    "해물파전": "haemul pajeon seafood pancake korean",
-    "감자전": "gamja jeon potato pancake korean",
-    # 기타
-    "떡볶이": "tteokbokki spicy rice cakes korean",
-    "순대": "sundae korean blood sausage",
-    "어묵": "eomuk fish cake korean",
-    "만두": "mandu korean dumplings",
-    "떡국": "tteokguk rice cake soup korean",
-    "삼계탕": "samgyetang ginseng chicken soup korean",
-}
+KOREAN_FOOD_TRANSLATIONS: dict[str, str] = dish_lexicon.translations
 
 
 class ImageSearchAdapter(ABC):
@@ -131,16 +80,11 @@ class GoogleImageSearchAdapter(ImageSearchAdapter):
         """
         query = query.strip()
 
-        # 정확히 일치하는 번역이 있으면 사용
-        if query in KOREAN_FOOD_TRANSLATIONS:
-            english_part = KOREAN_FOOD_TRANSLATIONS[query]
+        # 최장 일치 음식명 (예: "간단한 김치볶음밥" → "볶음밥"이 아닌 "김치볶음밥")
+        english_part = dish_lexicon.english(query)
+        if english_part:
             return f"{query} {english_part}"
 
-        # 부분 일치 검색 (예: "간단한 김치볶음밥" → "김치볶음밥" 매칭)
-        for korean_term, english_translation in KOREAN_FOOD_TRANSLATIONS.items():
-            if korean_term in query:
-                return f"{query} {english_translation}"
-
         # 번역이 없으면 기본 한국 음식 키워드 추가
         return f"{query} korean food dish"
 
@@ -152,17 +96,8 @@ class GoogleImageSearchAdapter(ImageSearchAdapter):
         """
         query = query.strip()
 
-        # 정확 일치
-        if query in KOREAN_FOOD_TRANSLATIONS:
-            return KOREAN_FOOD_TRANSLATIONS[query]
-
-        # 부분 일치
-        for korean_term, english_translation in KOREAN_FOOD_TRANSLATIONS.items():
-            if korean_term in query:
-                return english_translation
-
-        # 기본값
-        return f"{query} food"
+        # 최장 일치 음식명, 없으면 기본값
+        return dish_lexicon.english(query) or f"{query} food"
 
     async def _search_with_query(self, search_query: str) -> str | None:
         """
@@ -327,20 +262,8 @@ class GeminiImageGenerationAdapter(ImageSearchAdapter):
 
     def _get_english_name(self, recipe_title: str) -> str:
         """한국어 레시피 제목을 영어명으로 변환"""
-        english_name = KOREAN_FOOD_TRANSLATIONS.get(recipe_title, None)
-
-        # 부분 일치 검색
-        if english_name is None:
-            for korean_term, english_translation in KOREAN_FOOD_TRANSLATIONS.items():
-                if korean_term in recipe_title:
-                    english_name = english_translation
-                    break
-
-        # 번역이 없으면 기본 템플릿
-        if english_name is None:
-            english_name = f"{recipe_title} Korean dish"
-
-        return english_name
+        # 최장 일치 음식명, 번역이 없으면 기본 템플릿
+        return dish_lexicon.english(recipe_title) or f"{recipe_title} Korean dish"
 
     def _build_prompt(self, recipe_title: str, has_reference: bool = False) -> str:
         """
@@ -674,6 +597,8 @@ class ImageSearchService:
         else:
             logger.warning(f"알 수 없는 provider '{provider}', Unsplash 사용")
             self.primary = UnsplashImageSearchAdapter()
+            provider = "unsplash"
+        self.primary_name = provider
 
         # Fallback은 항상 Unsplash (Mock/Gemini 제외)
         if provider not in ("mock", "gemini"):
@@ -837,7 +762,12 @@ class ImageSearchService:
         self._evict_lru()
         self._save_cache()
 
-    async def get_image(self, recipe_title: str) -> str | None:
+    async def get_image(
+        self,
+        recipe_title: str,
+        usage: UsageMeter | None = None,
+        cache_only: bool = False,
+    ) -> str | None:
         """
         레시피 이미지 검색 (캐싱 + 폴백)
 
@@ -849,6 +779,8 @@ class ImageSearchService:
 
         Args:
             recipe_title: 레시피 제목
+            usage: 요청 사용량 수집기 (공급자 호출 수 기록, 캐시 히트는 제외)
+            cache_only: True면 캐시만 조회 (일일 예산 초과 시 저비용 모드)
 
         Returns:
             이미지 URL 또는 None
@@ -861,8 +793,13 @@ class ImageSearchService:
             logger.info(f"캐시 히트: '{recipe_title}'")
             return cached_url
 
+        if cache_only:
+            return None
+
         # 2. Primary provider 시도
         try:
+            if usage:
+                usage.record_images(self.primary_name)
             image_url = await self.primary.search_image(recipe_title)
             if image_url:
                 self._cache_store(recipe_title, image_url)
@@ -874,6 +811,8 @@ class ImageSearchService:
         if self.fallback:
             try:
                 logger.info(f"Fallback provider 시도: '{recipe_title}'")
+                if usage:
+                    usage.record_images("unsplash")
                 image_url = await self.fallback.search_image(recipe_title)
                 if image_url:
                     self._cache_store(recipe_title, image_url)
@@ -0,0 +1,391 @@
+"""
+재료 동시 등장 행렬 (입력 재료 + 생성 레시피)
+
+어떤 재료가 함께 쓰이는지 조회할 때마다 search_histories/recommendations 전체를 훑지 않도록,
+백그라운드 작업이 마지막으로 처리한 행 이후만 읽어 희소 행렬을 증분 갱신하고 압축 저장합니다.
+
+- 재료 ID: 정규화 재료 키 순서대로 부여, 스냅샷에 이름 목록으로 저장해 재시작 후에도 유지
+- 행렬: 대칭 CSR (indptr/indices/data NumPy 배열), 대각선은 재료 단독 등장 횟수
+  새 관측은 dict(COO)에 모았다가 작업 주기마다 한 번에 CSR로 병합
+- 입력 재료 조합: 사용자가 함께 입력한 재료 집합별 횟수 (상위 MAX_SETS개만 유지)
+- 출처별 행렬: inputs(사용자 입력, `SearchHistory.ingredients`), recipes(생성 레시피 `ingredients_total`)
+- 스냅샷: `data/cooccurrence.npz` (np.savez_compressed, 워터마크 포함)
+  gunicorn 워커마다 같은 행렬을 만들므로 파일 잠금을 얻은 워커 하나만 저장 (프로세스별 임시 파일 후 교체)
+- DB 읽기는 잠금 밖에서 배치 단위로 하고, 잠금은 메모리 병합에만 사용 (조회가 스캔을 기다리지 않음)
+"""
+
+from __future__ import annotations
+
+import fcntl
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.search_history import SearchHistory
+from app.services.ingredient_normalizer import ingredient_key, normalize_ingredient
+from app.services.recipe_index import SYNC_BATCH_SIZE, Watermark, iter_stored_recipes
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = Path(__file__).parent.parent.parent / "data" / "cooccurrence.npz"
+JOB_INTERVAL_SECONDS = 300.0
+SNAPSHOT_WAIT_SECONDS = 10.0
+MAX_SETS = 5000
+MAX_SET_SIZE = 10  # 이보다 재료가 많은 입력은 조합 집계에서 제외 (행렬에는 반영)
+SOURCES = ("inputs", "recipes")
+
+
+class SparseCooccurrence:
+    """대칭 동시 등장 횟수 CSR 행렬 + 병합 대기 관측"""
+
+    def __init__(
+        self,
+        indptr: np.ndarray | None = None,
+        indices: np.ndarray | None = None,
+        data: np.ndarray | None = None,
+    ):
+        self.indptr = np.zeros(1, dtype=np.int64) if indptr is None else indptr
+        self.indices = np.zeros(0, dtype=np.int32) if indices is None else indices
+        self.data = np.zeros(0, dtype=np.int64) if data is None else data
+        self._pending: Counter[tuple[int, int]] = Counter()
+
+    @property
+    def size(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def nnz(self) -> int:
+        return len(self.indices)
+
+    def add(self, ids: list[int]) -> None:
+        """재료 ID 집합 1건 관측 (모든 순서쌍 + 대각선)"""
+        for a in ids:
+            for b in ids:
+                self._pending[(a, b)] += 1
+
+    def compact(self, size: int) -> None:
+        """대기 관측을 CSR에 병합 (행 수를 size로 확장)"""
+        if not self._pending and size == self.size:
+            return
+        old_rows = np.repeat(np.arange(self.size, dtype=np.int64), np.diff(self.indptr))
+        if self._pending:
+            pending = np.array(list(self._pending), dtype=np.int64)
+            new_rows, new_cols = pending[:, 0], pending[:, 1]
+            new_data = np.fromiter(self._pending.values(), dtype=np.int64, count=len(pending))
+        else:
+            new_rows = new_cols = new_data = np.zeros(0, dtype=np.int64)
+
+        keys = np.concatenate([old_rows * size + self.indices, new_rows * size + new_cols])
+        values = np.concatenate([self.data, new_data])
+        unique, inverse = np.unique(keys, return_inverse=True)
+        summed = np.bincount(inverse, weights=values).astype(np.int64)
+
+        rows = unique // size
+        self.indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=size), out=self.indptr[1:])
+        self.indices = (unique % size).astype(np.int32)
+        self.data = summed
+        self._pending.clear()
+
+    def row(self, ingredient_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """(함께 등장한 재료 ID, 횟수) - 대각선 포함"""
+        if ingredient_id >= self.size:
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int64)
+        start, end = self.indptr[ingredient_id], self.indptr[ingredient_id + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def count(self, ingredient_id: int) -> int:
+        """재료 단독 등장 횟수 (대각선)"""
+        cols, counts = self.row(ingredient_id)
+        hit = np.flatnonzero(cols == ingredient_id)
+        return int(counts[hit[0]]) if len(hit) else 0
+
+
+class IngredientCooccurrence:
+    """재료 동시 등장 집계 (프로세스 단위 싱글톤, 백그라운드 작업으로 갱신)"""
+
+    def __init__(self, snapshot_file: Path = SNAPSHOT_FILE):
+        self.snapshot_file = snapshot_file
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self.matrices = {source: SparseCooccurrence() for source in SOURCES}
+        self._sets: Counter[tuple[int, ...]] = Counter()
+        self._watermarks = {source: Watermark() for source in SOURCES}
+        self._writer: int | None = None  # 스냅샷 저장 잠금 파일 디스크립터 (저장 담당 워커만)
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    # ---- 스냅샷 ----
+
+    def _load(self) -> None:
+        if not self.snapshot_file.exists():
+            return
+        try:
+            with np.load(self.snapshot_file) as snap:
+                names = [str(name) for name in snap["names"]]
+                matrices = {
+                    source: SparseCooccurrence(
+                        snap[f"{source}_indptr"], snap[f"{source}_indices"], snap[f"{source}_data"]
+                    )
+                    for source in SOURCES
+                }
+                bounds, members = snap["set_indptr"], snap["set_indices"].tolist()
+                sets = Counter(
+                    {
+                        tuple(members[bounds[k] : bounds[k + 1]]): int(count)
+                        for k, count in enumerate(snap["set_counts"])
+                    }
+                )
+                watermarks = {
+                    source: Watermark(
+                        datetime.fromisoformat(str(value)) if str(value) else None,
+                        {str(v) for v in snap[f"{source}_seen"]}
+                        if f"{source}_seen" in snap
+                        else set(),
+                    )
+                    for source, value in zip(SOURCES, snap["watermarks"], strict=True)
+                }
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"재료 동시 등장 스냅샷 로드 실패, 새로 시작: {e}")
+            return
+
+        self._names = names
+        self._ids = {ingredient_key(name): i for i, name in enumerate(names)}
+        self.matrices = matrices
+        self._sets = sets
+        self._watermarks = watermarks
+        logger.info(f"재료 동시 등장 스냅샷 로드: 재료 {len(names)}개, 조합 {len(sets)}개")
+
+    def _is_writer(self) -> bool:
+        """스냅샷 저장 담당 워커인지 (처음 잠금을 얻은 프로세스가 종료 때까지 담당)"""
+        if self._writer is not None:
+            return True
+        try:
+            self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.snapshot_file.with_suffix(".lock"), os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            logger.error(f"재료 동시 등장 스냅샷 잠금 파일 열기 실패: {e}")
+            return False
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._writer = fd
+        logger.info(f"재료 동시 등장 스냅샷 저장 담당: pid={os.getpid()}")
+        return True
+
+    def _snapshot_arrays(self) -> dict[str, np.ndarray] | None:
+        """저장할 배열 (변경이 없으면 None)"""
+        with self._lock:
+            if not self._dirty:
+                return None
+            sets = list(self._sets.items())
+            arrays = {
+                "names": np.array(self._names, dtype=str),
+                "set_indptr": np.cumsum([0, *(len(ids) for ids, _ in sets)], dtype=np.int64),
+                "set_indices": np.array([i for ids, _ in sets for i in ids], dtype=np.int32),
+                "set_counts": np.array([count for _, count in sets], dtype=np.int64),
+                "watermarks": np.array(
+                    [w.at.isoformat() if w else "" for w in self._watermarks.values()], dtype=str
+                ),
+            }
+            for source, watermark in self._watermarks.items():
+                arrays[f"{source}_seen"] = np.array(sorted(watermark.seen), dtype=str)
+            for source, matrix in self.matrices.items():
+                arrays[f"{source}_indptr"] = matrix.indptr
+                arrays[f"{source}_indices"] = matrix.indices
+                arrays[f"{source}_data"] = matrix.data
+            self._dirty = False
+            return arrays
+
+    def save_snapshot(self) -> None:
+        """압축 스냅샷 저장 (저장 담당 워커만, 변경이 있을 때만, 임시 파일에 쓴 뒤 교체)"""
+        if not self._is_writer():
+            return
+        # 진행 중인 동기화가 끝난 뒤 저장 (읽었지만 아직 병합 전인 행이 워터마크에만 반영되지 않도록)
+        if not self._sync_lock.acquire(timeout=SNAPSHOT_WAIT_SECONDS):
+            logger.warning("재료 동시 등장 동기화 진행 중, 스냅샷 저장 건너뜀")
+            return
+        try:
+            arrays = self._snapshot_arrays()
+        finally:
+            self._sync_lock.release()
+        if arrays is None:
+            return
+        try:
+            self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.snapshot_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            tmp.replace(self.snapshot_file)
+        except OSError as e:
+            logger.error(f"재료 동시 등장 스냅샷 저장 실패: {e}")
+
+    # ---- 증분 갱신 ----
+
+    def _id_list(self, ingredients: list[str]) -> list[int]:
+        """재료 목록 → 중복 없는 ID 목록 (정렬, 처음 보는 재료는 새 ID)"""
+        ids = set()
+        for ingredient in ingredients:
+            key = ingredient_key(ingredient)
+            if not key:
+                continue
+            ingredient_id = self._ids.get(key)
+            if ingredient_id is None:
+                ingredient_id = len(self._names)
+                self._ids[key] = ingredient_id
+                self._names.append(normalize_ingredient(ingredient))
+            ids.add(ingredient_id)
+        return sorted(ids)
+
+    def _observe(self, source: str, ingredients: list[str]) -> None:
+        ids = self._id_list(ingredients)
+        if not ids:
+            return
+        self.matrices[source].add(ids)
+        if source == "inputs" and 2 <= len(ids) <= MAX_SET_SIZE:
+            self._sets[tuple(ids)] += 1
+
+    def _prune_sets(self) -> None:
+        if len(self._sets) > MAX_SETS:
+            self._sets = Counter(dict(self._sets.most_common(MAX_SETS)))
+
+    def _read_batches(self, db: Session) -> Iterator[list[tuple[str, list[str]]]]:
+        """
+        워터마크 이후 행을 (출처, 재료 목록) 배치로 읽기 (잠금 없이, 읽으면서 워터마크 전진)
+
+        읽기 도중 DB 오류가 나도 이미 읽은 행은 배치로 넘긴 뒤 예외를 다시 올립니다
+        (워터마크만 전진하고 행이 반영되지 않는 일이 없도록).
+        """
+        batch: list[tuple[str, list[str]]] = []
+        try:
+            watermark = self._watermarks["inputs"]
+            query = db.query(SearchHistory.id, SearchHistory.searched_at, SearchHistory.ingredients)
+            if watermark:
+                query = query.filter(SearchHistory.searched_at >= watermark.at)
+            for row_id, searched_at, ingredients in query.order_by(
+                SearchHistory.searched_at, SearchHistory.id
+            ).yield_per(SYNC_BATCH_SIZE):
+                if not watermark.is_new(str(row_id), searched_at):
+                    continue
+                batch.append(("inputs", ingredients or []))
+                watermark.advance(str(row_id), searched_at)
+                if len(batch) >= SYNC_BATCH_SIZE:
+                    yield batch
+                    batch = []
+
+            for stored in iter_stored_recipes(db, since=self._watermarks["recipes"]):
+                batch.append(("recipes", stored.recipe.ingredients_total))
+                if len(batch) >= SYNC_BATCH_SIZE:
+                    yield batch
+                    batch = []
+        except Exception:
+            if batch:
+                yield batch
+            raise
+        if batch:
+            yield batch
+
+    def sync(self, db: Session) -> int:
+        """워터마크 이후 검색 기록/저장 레시피를 반영 (반영한 행 수 반환)"""
+        if not self._sync_lock.acquire(blocking=False):
+            return 0
+        try:
+            added = 0
+            for batch in self._read_batches(db):
+                with self._lock:
+                    for source, ingredients in batch:
+                        self._observe(source, ingredients)
+                added += len(batch)
+
+            if added:
+                with self._lock:
+                    for matrix in self.matrices.values():
+                        matrix.compact(len(self._names))
+                    self._prune_sets()
+                    self._dirty = True
+        finally:
+            self._sync_lock.release()
+
+        if added:
+            nnz = sum(m.nnz for m in self.matrices.values())
+            logger.info(f"재료 동시 등장 갱신: +{added}행 (재료 {len(self)}개, 비영 {nnz}개)")
+        return added
+
+    def run(self) -> None:
+        """백그라운드 작업 (앱 시작 시 스레드에서 호출, stop() 전까지 주기 갱신)"""
+        while not self._stop.is_set():
+            db = SessionLocal()
+            try:
+                start = time.monotonic()
+                added = self.sync(db)
+                if added:
+                    logger.info(f"재료 동시 등장 작업: {added}행, {time.monotonic() - start:.1f}초")
+                self.save_snapshot()
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"재료 동시 등장 갱신 실패: {e}")
+            finally:
+                db.close()
+            self._stop.wait(JOB_INTERVAL_SECONDS)
+
+    def stop(self) -> None:
+        """작업 종료 + 스냅샷 저장 (앱 종료 시)"""
+        self._stop.set()
+        self.save_snapshot()
+
+    # ---- 조회 ----
+
+    def top_cooccurring(
+        self, ingredient: str, limit: int = 10, source: str | None = None
+    ) -> list[tuple[str, int]]:
+        """
+        재료와 함께 가장 많이 등장한 재료
+
+        Args:
+            source: "inputs" | "recipes" (None이면 합산)
+
+        Returns:
+            [(재료명, 함께 등장한 횟수), ...] 횟수 내림차순
+        """
+        with self._lock:
+            ingredient_id = self._ids.get(ingredient_key(ingredient))
+            if ingredient_id is None:
+                return []
+            counts = np.zeros(len(self._names), dtype=np.int64)
+            for name in SOURCES if source is None else (source,):
+                cols, data = self.matrices[name].row(ingredient_id)
+                np.add.at(counts, cols, data)
+            counts[ingredient_id] = 0
+
+            nonzero = np.flatnonzero(counts)
+            if len(nonzero) > limit:
+                nonzero = nonzero[np.argpartition(-counts[nonzero], limit - 1)[:limit]]
+            ranked = sorted(nonzero.tolist(), key=lambda i: (-counts[i], i))
+            return [(self._names[i], int(counts[i])) for i in ranked]
+
+    def most_common_sets(self, limit: int = 10, min_size: int = 2) -> list[tuple[list[str], int]]:
+        """사용자가 함께 입력한 재료 조합 상위 (조합 크기 min_size 이상)"""
+        with self._lock:
+            ranked = (item for item in self._sets.most_common() if len(item[0]) >= min_size)
+            return [([self._names[i] for i in ids], count) for ids, count in islice(ranked, limit)]
+
+
+ingredient_cooccurrence = IngredientCooccurrence()
@@ -0,0 +1,96 @@
+"""
+재료명 정규화
+
+레시피/장보기/검색 인덱스/캐시 키가 같은 기준으로 재료를 비교하도록
+분량, 수량, 수식어를 제거하고 동의어를 대표 재료명으로 통일합니다.
+
+- 분량/수식어: 미리 컴파일한 정규식 하나로 한 번에 제거 (수식어는 긴 것부터 매칭)
+- 동의어: `app/data/ingredient_synonyms.py` (달걀 → 계란)
+- 같은 재료 문자열은 반복해서 들어오므로 결과를 메모이즈하고 intern
+"""
+
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+
+from app.data.ingredient_synonyms import INGREDIENT_SYNONYMS
+
+_UNITS = [
+    "개", "g", "kg", "ml", "L", "큰술", "작은술", "컵", "줌", "꼬집", "조각",
+    "장", "쪽", "알", "마리", "근", "톨", "봉지", "팩", "통", "캔", "모", "공기", "스푼",
+    "숟가락", "대", "줄기", "단", "T", "t", "cc",
+]  # fmt: skip
+
+_MODIFIERS = [
+    "신선한", "싱싱한", "잘 익은", "익은", "다진", "썬", "채썬", "굵게 썬", "얇게 썬",
+    "작게 썬", "큼직하게 썬", "곱게 간", "갈아놓은", "삶은", "데친", "냉동", "해동한",
+    "적당량", "약간", "조금", "충분한", "넉넉한",
+]  # fmt: skip
+
+
+def _alternation(words: list[str]) -> str:
+    # 긴 것부터 → "채썬"/"굵게 썬"이 "썬"보다 먼저 매칭되어 조각이 남지 않음
+    return "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+# 1. 분량/수량 (숫자 + 단위, 예: "1개", "2큰술", "100g", "1/2컵", "0.5kg")
+# 2. 흔한 수식어
+_PATTERN = re.compile(rf"\d+(?:[./]\d+)?\s*(?:{_alternation(_UNITS)})?|{_alternation(_MODIFIERS)}")
+# 재료 목록 줄에서 재료를 나누는 기준이 되는 분량 표기
+_QUANTITY = re.compile(
+    rf"\d+(?:[./]\d+)?\s*(?:{_alternation(_UNITS)})?|적당량|약간|조금|한\s*줌|한\s*꼬집"
+)
+
+
+@lru_cache(maxsize=8192)
+def normalize_ingredient(ingredient: str) -> str:
+    """
+    재료명에서 분량, 수량, 수식어를 제거하고 동의어를 통일하여 정규화
+
+    예시:
+        "신선한 계란 1개" -> "계란"
+        "달걀 2개" -> "계란"
+        "김치 100g" -> "김치"
+        "다진 마늘 1큰술" -> "마늘"
+        "채썬 양파" -> "양파"
+    """
+    if not ingredient:
+        return ""
+
+    text = _PATTERN.sub("", unicodedata.normalize("NFC", ingredient))
+    # 앞뒤 공백 제거 및 중간 공백 정리
+    text = " ".join(text.split())
+    text = INGREDIENT_SYNONYMS.get(text, text)
+    return sys.intern(text)
+
+
+@lru_cache(maxsize=8192)
+def ingredient_key(ingredient: str) -> str:
+    """비교/색인용 재료 키 (정규화 + 소문자)"""
+    return sys.intern(normalize_ingredient(ingredient).lower())
+
+
+def split_quantities(text: str) -> list[tuple[str, str | None]]:
+    """
+    재료 목록 한 줄 → (정규화 재료명, 분량 표기) 목록
+
+    분량 뒤에서 재료를 나누므로 쉼표 없이 붙은 목록도 분리됩니다.
+
+    예시:
+        "돼지고기 200g 양파 1/2개" -> [("돼지고기", "200g"), ("양파", "1/2개")]
+        "소금 약간" -> [("소금", "약간")]
+        "후추" -> [("후추", None)]
+    """
+    text = unicodedata.normalize("NFC", text)
+    items: list[tuple[str, str | None]] = []
+    start = 0
+    for match in _QUANTITY.finditer(text):
+        name = normalize_ingredient(text[start : match.start()])
+        if name:
+            items.append((name, match.group().replace(" ", "")))
+            start = match.end()
+    name = normalize_ingredient(text[start:])
+    if name:
+        items.append((name, None))
+    return items
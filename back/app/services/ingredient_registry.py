@@ -0,0 +1,103 @@
+"""
+재료 레지스트리 (정규화 재료명 → 정수 ID)
+
+재료 목록을 정수 비트셋(파이썬 int)으로 표현해
+보유/필요 분리, 커버리지 계산, 장보기 중복 제거를 비트 연산으로 처리합니다.
+
+- ID는 처음 본 순서대로 부여 (프로세스 단위, 저장하지 않음)
+- 새 ID는 색인하는 레시피 재료에만 부여하고, 사용자 입력은 조회만 함 (임의 입력으로 레지스트리가 커지지 않음)
+- 최대 MAX_INGREDIENTS개까지만 등록 (넘으면 새 재료는 ID 없음)
+- 비트셋: ID번째 비트가 1이면 해당 재료 포함
+- 일치 재료 수: `(user_mask & recipe_mask).bit_count()`
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+from app.services.ingredient_normalizer import ingredient_key, normalize_ingredient
+
+logger = logging.getLogger(__name__)
+
+# 등록 가능한 최대 재료 수 (실제 재료 어휘는 수천 개 수준, 비트셋 크기 상한)
+MAX_INGREDIENTS = 50_000
+
+
+def bit_ids(mask: int) -> list[int]:
+    """비트셋 → 켜진 비트 번호(재료 ID) 목록"""
+    ids = []
+    while mask:
+        low = mask & -mask
+        ids.append(low.bit_length() - 1)
+        mask ^= low
+    return ids
+
+
+class IngredientRegistry:
+    """정규화 재료 키 ↔ 정수 ID"""
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []  # ID → 대표 표기 (정규화 이름, 처음 본 표기)
+        self._full = False  # 가득 참 경고를 한 번만 남기기 위한 플래그
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def lookup(self, ingredient: str) -> int | None:
+        """재료 문자열 → 이미 등록된 ID (등록되지 않았으면 None, 새 ID를 만들지 않음)"""
+        key = ingredient_key(ingredient)
+        return self._ids.get(key) if key else None
+
+    def id_of(self, ingredient: str) -> int | None:
+        """
+        재료 문자열 → ID (처음 보는 재료는 새 ID)
+
+        정규화 결과가 비었거나 레지스트리가 가득 차 새 ID를 줄 수 없으면 None
+        """
+        key = ingredient_key(ingredient)
+        if not key:
+            return None
+        ingredient_id = self._ids.get(key)
+        if ingredient_id is None:
+            with self._lock:
+                ingredient_id = self._ids.get(key)
+                if ingredient_id is None:
+                    if len(self._names) >= MAX_INGREDIENTS:
+                        if not self._full:
+                            self._full = True
+                            logger.warning(f"재료 레지스트리 가득 참 ({MAX_INGREDIENTS}개)")
+                        return None
+                    ingredient_id = len(self._names)
+                    self._names.append(normalize_ingredient(ingredient))
+                    self._ids[key] = ingredient_id
+        return ingredient_id
+
+    def name_of(self, ingredient_id: int) -> str:
+        return self._names[ingredient_id]
+
+    def mask(self, ingredients: list[str], register: bool = False) -> int:
+        """
+        재료 목록 → 비트셋
+
+        Args:
+            ingredients: 재료 문자열 목록
+            register: True면 처음 보는 재료에 새 ID 부여 (레시피 색인용),
+                False면 등록된 재료만 비트로 표현 (사용자 입력용)
+        """
+        lookup = self.id_of if register else self.lookup
+        bits = 0
+        for ingredient in ingredients:
+            ingredient_id = lookup(ingredient)
+            if ingredient_id is not None:
+                bits |= 1 << ingredient_id
+        return bits
+
+    def names(self, mask: int) -> list[str]:
+        """비트셋 → 대표 재료명 목록 (ID 순)"""
+        return [self._names[i] for i in bit_ids(mask)]
+
+
+ingredient_registry = IngredientRegistry()
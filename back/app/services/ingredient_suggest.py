@@ -0,0 +1,205 @@
+"""
+재료 자동완성 (접두사 트라이 + 초성 검색)
+
+저장된 레시피에 등장한 재료와 알러지 파생 재료로 트라이를 만들고,
+노드마다 인기순 상위 N개 재료를 미리 들고 있어 키 입력마다 O(질의 길이)로 응답합니다.
+
+- 자모 트라이: 음절을 초성/중성/종성 호환 자모로 풀어(겹모음/겹받침도 분해) 색인
+  → 입력 중인 "곌"(계+ㄹ), "계ㄹ", "계라" 모두 "계란"의 접두사로 매칭
+- 초성 트라이: 질의가 자음 자모로만 이루어지면 초성열로 검색 ("ㄱㄹ" → 계란)
+- 인기도: 저장된 레시피에서 재료가 등장한 횟수 (알러지 파생 재료는 기본 1)
+- 갱신: 앱 시작 시 백그라운드 전체 색인 + 조회 시 `created_at` 워터마크 증분 동기화
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.data.allergen_derivatives import ALLERGEN_DERIVATIVES
+from app.services.ingredient_normalizer import normalize_ingredient
+from app.services.recipe_index import SYNC_INTERVAL_SECONDS, Watermark, iter_stored_recipes
+
+logger = logging.getLogger(__name__)
+
+TOP_N = 10
+MAX_TERM_LENGTH = 20
+
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+]  # fmt: skip
+_JONG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+    "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]  # fmt: skip
+# 단독 입력된 겹모음/겹받침 호환 자모 → 분해
+_COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}  # fmt: skip
+_CONSONANTS = set(_CHO)
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절 → 호환 자모열 (그 외 문자는 소문자 그대로)"""
+    out = []
+    for ch in text.lower():
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(_CHO[code // 588])
+            out.append(_JUNG[(code % 588) // 28])
+            out.append(_JONG[code % 28])
+        else:
+            out.append(_COMPOUND_JAMO.get(ch, ch))
+    return "".join(out)
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절 → 초성열 (공백 제외, 그 외 문자는 그대로)"""
+    out = []
+    for ch in text.lower():
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(_CHO[code // 588])
+        elif not ch.isspace():
+            out.append(ch)
+    return "".join(out)
+
+
+def is_chosung_query(query: str) -> bool:
+    """자음 자모로만 이루어진 질의인지 (공백 무시)"""
+    chars = [c for c in query if not c.isspace()]
+    return bool(chars) and all(c in _CONSONANTS for c in chars)
+
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        self.top: list[str] = []  # 인기순 상위 TOP_N 재료
+
+
+class PrefixTrie:
+    """노드별 인기 상위 N개를 유지하는 트라이"""
+
+    def __init__(self, counts: dict[str, int]):
+        self._root = _Node()
+        self._counts = counts  # 재료 → 인기도 (IngredientSuggester와 공유)
+
+    def _rank(self, term: str) -> tuple[int, int, str]:
+        return (-self._counts.get(term, 0), len(term), term)
+
+    def insert(self, key: str, term: str) -> None:
+        """term을 key 경로에 색인 (인기도가 바뀐 뒤 다시 호출하면 순위 갱신)"""
+        node = self._root
+        for ch in key:
+            node = node.children.setdefault(ch, _Node())
+            top = node.top
+            if term in top:
+                top.sort(key=self._rank)
+            elif len(top) < TOP_N:
+                top.append(term)
+                top.sort(key=self._rank)
+            elif self._rank(term) < self._rank(top[-1]):
+                top[-1] = term
+                top.sort(key=self._rank)
+
+    def lookup(self, prefix: str) -> list[str]:
+        """접두사 → 인기순 재료 (복사본 - 노드 목록은 insert가 제자리에서 정렬/교체함)"""
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        return list(node.top)
+
+
+class IngredientSuggester:
+    """재료 자동완성 인덱스"""
+
+    def __init__(self):
+        self._counts: dict[str, int] = {}
+        self._jamo = PrefixTrie(self._counts)
+        self._chosung = PrefixTrie(self._counts)
+        self._watermark = Watermark()
+        self._last_sync = 0.0
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+        for base, derivatives in ALLERGEN_DERIVATIVES.items():
+            for term in (base, *derivatives):
+                self.add(term, count=0)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, ingredient: str, count: int = 1) -> None:
+        """재료 등장 반영 (정규화 후 인기도 +count, 새 재료는 최소 1)"""
+        term = normalize_ingredient(ingredient)
+        if not term or len(term) > MAX_TERM_LENGTH:
+            return
+        with self._lock:
+            self._counts[term] = max(self._counts.get(term, 0) + count, 1)
+            self._jamo.insert(to_jamo(term), term)
+            self._chosung.insert(to_chosung(term), term)
+
+    def sync(self, db: Session, force: bool = False) -> int:
+        """워터마크 이후 저장된 레시피 재료를 증분 반영 (반영된 레시피 수 반환)"""
+        now = time.monotonic()
+        if not force and now - self._last_sync < SYNC_INTERVAL_SECONDS:
+            return 0
+        if not self._sync_lock.acquire(blocking=False):
+            return 0
+        try:
+            self._last_sync = now
+            added = 0
+            for stored in iter_stored_recipes(db, since=self._watermark):
+                for ingredient in set(stored.recipe.ingredients_total):
+                    self.add(ingredient)
+                added += 1
+        finally:
+            self._sync_lock.release()
+
+        if added:
+            logger.info(f"재료 자동완성 동기화: 레시피 +{added}개 (재료 {len(self)}개)")
+        return added
+
+    def warm_up(self) -> None:
+        """앱 시작 시 전체 색인 (백그라운드 스레드에서 호출)"""
+        db = SessionLocal()
+        try:
+            start = time.monotonic()
+            added = self.sync(db, force=True)
+            logger.info(
+                f"재료 자동완성 초기화: 레시피 {added}개, 재료 {len(self)}개, "
+                f"{time.monotonic() - start:.1f}초"
+            )
+        except Exception as e:
+            logger.warning(f"재료 자동완성 초기화 실패: {e}")
+        finally:
+            db.close()
+
+    def suggest(self, query: str, limit: int = TOP_N) -> list[str]:
+        """접두사/초성 질의 → 인기순 재료 목록"""
+        query = query.strip()
+        if not query:
+            return []
+        trie, key = (
+            (self._chosung, to_chosung(query))
+            if is_chosung_query(query)
+            else (self._jamo, to_jamo(query))
+        )
+        # add()의 삽입/정렬과 겹치지 않도록 같은 잠금 안에서 복사
+        with self._lock:
+            return trie.lookup(key)[:limit]
+
+
+ingredient_suggester = IngredientSuggester()
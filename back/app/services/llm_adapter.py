@@ -4,19 +4,70 @@ LLM 어댑터 - Claude API를 사용한 레시피 생성
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from anthropic import Anthropic
 
 from app.core.config import settings
 from app.data.allergen_derivatives import expand_exclusions
+from app.models.meal_plan import MealPlanCreate
 from app.models.recommendation import Recipe, RecommendationCreate
+from app.services.llm_scheduler import LLMTenant, llm_scheduler
+from app.services.model_router import RoutingDecision, model_router
+from app.services.preference_service import UserPreferences
+from app.services.recipe_corpus import RecipeCorpus, get_local_corpus
+from app.services.recipe_index import RERANK_POOL_SIZE
+from app.services.usage_ledger import UsageMeter
 
 logger = logging.getLogger(__name__)
 
 
+def cached_system_prompt(*blocks: str) -> list[dict]:
+    """
+    시스템 프롬프트를 Anthropic 프롬프트 캐싱 블록으로 변환
+
+    첫 번째 블록(정적 프리픽스)에 cache_control을 지정해, 매 호출마다 동일한
+    긴 시스템 프롬프트를 공급자 측 캐시에서 재사용합니다 (TTFT/입력 토큰 비용 절감).
+    뒤 블록은 캐시 프리픽스 뒤에 붙는 가변 부분입니다.
+    최소 캐시 길이(Sonnet 1024 / Haiku 2048 토큰)보다 짧은 프롬프트에는 쓰지 않습니다
+    (캐시되지 않고 cache_control만 붙음).
+    """
+    system: list[dict] = [
+        {"type": "text", "text": blocks[0], "cache_control": {"type": "ephemeral"}}
+    ]
+    system.extend({"type": "text", "text": b} for b in blocks[1:])
+    return system
+
+
+def stable_seed(payload: RecommendationCreate) -> str:
+    """캐시 키가 없을 때 사용할 요청 내용 기반 시드"""
+    return hashlib.sha256(payload.model_dump_json().encode()).hexdigest()
+
+
+# 배치 생성 시 시스템 프롬프트 뒤에 붙는 출력 형식 재정의
+BATCH_SYSTEM_SUFFIX = """배치 모드:
+여러 요청이 "=== 요청 N ===" 형태로 함께 주어질 수 있습니다.
+이 경우 각 요청을 완전히 독립적으로 처리하고, 요청 번호(문자열)를 키로,
+해당 요청의 레시피 3개 JSON 배열을 값으로 하는 JSON 객체 하나만 출력하세요.
+예: {"0": [레시피, 레시피, 레시피], "1": [레시피, 레시피, 레시피]}"""
+
+MEAL_PLAN_SYSTEM_SUFFIX = """식단 모드:
+여러 날 식단 중 일부 일차 요청("=== 식단 요청 ===")이 주어지면 규칙 1의 레시피 개수 대신
+요청한 일차 수 × 하루 끼니 수만큼 레시피를 생성합니다.
+- 사용자 재료를 여러 날에 나눠 쓰고, 추가로 사는 재료는 다른 날에도 쓰기 쉬운 흔한 재료로 선택
+- 일차별로 지정한 요리 스타일을 따라 날마다 다른 요리로 구성
+요청한 일차(문자열 "1", "2", ...)를 키로, 그날 레시피 JSON 배열을 값으로 하는 JSON 객체 하나만 출력하세요.
+예: {"3": [레시피], "4": [레시피]}"""
+
+# 식단 하나를 나눠 생성할 호출 수 (고정) - 각 호출은 일반 테넌트 슬롯을 받으므로
+# 테넌트 동시 호출 상한(기본 2) 안에서만 동시에 실행
+MEAL_PLAN_CALLS = 2
+
+
 class RecipeLLMAdapter:
     """Claude API를 사용한 레시피 생성 어댑터"""
 
@@ -47,22 +98,36 @@ class RecipeLLMAdapter:
         "밥 요리 중심",
     ]
 
-    def __init__(self):
-        if not settings.anthropic_api_key:
+    def __init__(self, client: Anthropic | None = None):
+        if client is None and not settings.anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY가 설정되지 않았습니다")
 
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+        # client 주입은 벤치마크/테스트용 (Anthropic 호환 messages.create 인터페이스)
+        self.client = client or Anthropic(api_key=settings.anthropic_api_key)
         self.model = settings.llm_model
         self.temperature = settings.llm_temperature
         self.max_tokens = settings.llm_max_tokens
 
-    def generate_recipes(self, payload: RecommendationCreate, max_retries: int = 2) -> list[Recipe]:
+    def generate_recipes(
+        self,
+        payload: RecommendationCreate,
+        max_retries: int = 2,
+        tenant: LLMTenant | None = None,
+        seed: str | None = None,
+        usage: UsageMeter | None = None,
+        model: str | None = None,
+    ) -> list[Recipe]:
         """
         사용자 재료와 제약사항으로 3개 레시피 생성 (재시도 로직 포함)
 
         Args:
             payload: 사용자 입력 (재료, 제약사항)
             max_retries: 최대 재시도 횟수
+            tenant: 호출 주체 (LLM 스케줄러 공정 큐잉용)
+            seed: 스타일 힌트 선택용 시드 (보통 캐시 키, 없으면 요청 내용 해시)
+            usage: 요청 사용량 수집기 (재시도 포함 모든 호출의 실제 토큰 기록)
+            model: 고정 모델 (일일 예산 초과 시 Haiku, None이면 모델 라우터가 선택하고
+                실패 시 품질 모델로 승격)
 
         Returns:
             List[Recipe]: 3개의 레시피 (ingredients_total만 포함, have/need는 별도 처리)
@@ -70,21 +135,36 @@ class RecipeLLMAdapter:
         Raises:
             ValueError: API 호출 실패 또는 파싱 실패
         """
+        # 요청 복잡도/모델 상태/클라이언트 힌트로 모델 선택 (고정 모델이면 라우팅/승격 없음)
+        if model is not None:
+            decision = RoutingDecision(model, "fixed", model_router.complexity(payload))
+        else:
+            decision = model_router.choose(payload)
+
         for attempt in range(max_retries):
+            call_started: float | None = None
+            response = None
             try:
                 # 1. 프롬프트 구성
-                system_prompt = self._build_system_prompt()
-                user_prompt = self._build_user_prompt(payload)
+                system_prompt = cached_system_prompt(self._build_system_prompt())
+                user_prompt = self._build_user_prompt(payload, seed)
 
-                # 2. Claude API 호출
-                logger.info(f"LLM 레시피 생성 시도 {attempt + 1}/{max_retries}")
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                    system=system_prompt,
-                    messages=[{"role": "user", "content": user_prompt}],
+                # 2. Claude API 호출 (스케줄러 슬롯 확보 후)
+                logger.info(
+                    f"LLM 레시피 생성 시도 {attempt + 1}/{max_retries} "
+                    f"(model={decision.model}, reason={decision.reason})"
                 )
+                with llm_scheduler.slot(tenant):
+                    call_started = time.monotonic()
+                    response = self.client.messages.create(
+                        model=decision.model,
+                        max_tokens=self.max_tokens,
+                        temperature=self.temperature,
+                        system=system_prompt,
+                        messages=[{"role": "user", "content": user_prompt}],
+                    )
+                if usage:
+                    usage.record_message("anthropic", decision.model, "recipe_generation", response)
 
                 # 3. 응답 파싱
                 content = response.content[0].text
@@ -92,43 +172,293 @@ class RecipeLLMAdapter:
                 recipes_data = self._parse_response(content)
 
                 # 4. Pydantic 모델로 변환 (기본값으로 빈 리스트 제공)
-                recipes = []
-                for r in recipes_data:
-                    # ingredients_have, ingredients_need는 나중에 설정
-                    # 여기서는 일단 빈 리스트로 초기화
-                    recipe = Recipe(
-                        title=r.get("title", "제목 없음"),
-                        time_min=r.get("time_min", 15),
-                        servings=r.get("servings", payload.constraints.servings),
-                        summary=r.get("summary", ""),
-                        image_url=None,  # 나중에 설정
-                        ingredients_total=r.get("ingredients_total", []),
-                        ingredients_have=[],  # 나중에 설정
-                        ingredients_need=[],  # 나중에 설정
-                        steps=r.get("steps", []),
-                        tips=r.get("tips", []),
-                        warnings=r.get("warnings", []),
-                    )
-                    recipes.append(recipe)
+                recipes = self._to_recipes(recipes_data, payload)
 
                 # 5. 레시피 개수 검증
                 if len(recipes) != 3:
                     raise ValueError(f"레시피 개수 오류: {len(recipes)}개 생성됨 (3개 필요)")
 
+                model_router.record(decision.model, time.monotonic() - call_started, ok=True)
                 logger.info(f"LLM 레시피 생성 성공: {len(recipes)}개")
                 return recipes
 
             except Exception as e:
                 logger.warning(f"LLM 생성 실패 (시도 {attempt + 1}/{max_retries}): {str(e)}")
+                # 슬롯 대기 타임아웃은 모델 상태와 무관하므로 통계에서 제외
+                if call_started is not None:
+                    model_router.record(decision.model, time.monotonic() - call_started, ok=False)
+                    if usage and response is None:
+                        usage.record_failure("anthropic", decision.model, "recipe_generation")
+                if model is None:
+                    decision = model_router.escalate(decision)
                 if attempt == max_retries - 1:
-                    # 최종 실패 시 더미 데이터 폴백
-                    logger.error(f"LLM 생성 최종 실패, 더미 레시피 반환: {str(e)}")
-                    return self._fallback_dummy_recipes(payload)
+                    # 최종 실패는 호출자에게 알림 (폴백 레시피는 호출자가 골라 생성 여부를 표시)
+                    raise ValueError(f"LLM 레시피 생성 최종 실패: {e}") from e
                 # 재시도
                 continue
 
-        # 여기까지 오면 안 되지만, 안전을 위해 더미 반환
-        return self._fallback_dummy_recipes(payload)
+        raise ValueError("LLM 레시피 생성 실패: 재시도 횟수가 0입니다")
+
+    def generate_recipe_batch(
+        self,
+        payloads: list[RecommendationCreate],
+        tenant: LLMTenant | None = None,
+        seeds: list[str | None] | None = None,
+        usages: list[UsageMeter | None] | None = None,
+    ) -> list[list[Recipe] | None]:
+        """
+        여러 요청의 레시피를 한 번의 API 호출로 생성 (마이크로 배칭용)
+
+        시스템 프롬프트(few-shot 예시 포함)를 요청마다 반복하지 않고 한 번만 보냅니다.
+        응답은 요청 번호별로 분리하며, 파싱/검증에 실패한 요청은 None으로 반환하므로
+        호출 측에서 해당 요청만 개별 생성으로 폴백해야 합니다.
+
+        Args:
+            payloads: 사용자 입력 목록
+            tenant: 호출 주체 (배치 내 가중치가 가장 높은 테넌트)
+            seeds: 요청별 스타일 힌트 시드 (보통 캐시 키)
+            usages: 요청별 사용량 수집기 (배치 토큰을 요청 수로 나눠 기록)
+
+        Returns:
+            요청 순서대로 3개 레시피 목록 또는 None (해당 요청 실패)
+
+        Raises:
+            Exception: API 호출 자체가 실패한 경우 (전체 요청 폴백 필요)
+        """
+        # 한 요청이라도 품질 모델이 필요하면 배치 전체를 품질 모델로 처리
+        decisions = [model_router.choose(p) for p in payloads]
+        model = next(
+            (d.model for d in decisions if d.model == model_router.quality_model),
+            decisions[0].model,
+        )
+
+        # 단일 요청과 동일한 정적 프리픽스를 캐시 블록으로 공유하고 배치 지시만 뒤에 붙임
+        system_prompt = cached_system_prompt(self._build_system_prompt(), BATCH_SYSTEM_SUFFIX)
+        seeds = seeds or [None] * len(payloads)
+        sections = [
+            f"=== 요청 {i} ===\n{self._build_user_prompt(p, seed)}"
+            for i, (p, seed) in enumerate(zip(payloads, seeds, strict=True))
+        ]
+        user_prompt = (
+            f"아래 {len(payloads)}개의 요청 각각에 대해 레시피 3개씩 생성해주세요.\n\n"
+            + "\n\n".join(sections)
+        )
+
+        logger.info(f"LLM 배치 생성: {len(payloads)}개 요청 (model={model})")
+        with llm_scheduler.slot(tenant):
+            call_started = time.monotonic()
+            try:
+                response = self.client.messages.create(
+                    model=model,
+                    max_tokens=min(self.max_tokens * len(payloads), settings.llm_batch_max_tokens),
+                    temperature=self.temperature,
+                    system=system_prompt,
+                    messages=[{"role": "user", "content": user_prompt}],
+                )
+            except Exception:
+                model_router.record(
+                    model, time.monotonic() - call_started, ok=False, task="recommendation_batch"
+                )
+                for usage in usages or []:
+                    if usage:
+                        usage.record_failure("anthropic", model, "recipe_batch")
+                raise
+        model_router.record(
+            model, time.monotonic() - call_started, ok=True, task="recommendation_batch"
+        )
+        for usage in usages or []:
+            if usage:
+                usage.record_message(
+                    "anthropic", model, "recipe_batch", response, share=1 / len(payloads)
+                )
+
+        content = response.content[0].text
+        try:
+            grouped = self._parse_batch_response(content)
+        except ValueError as e:
+            logger.warning(f"배치 응답 파싱 실패, 전체 개별 폴백: {e}")
+            return [None] * len(payloads)
+
+        results: list[list[Recipe] | None] = []
+        for i, payload in enumerate(payloads):
+            try:
+                recipes = self._to_recipes(grouped.get(str(i)) or [], payload)
+                if len(recipes) != 3:
+                    raise ValueError(f"레시피 개수 오류: {len(recipes)}개 (3개 필요)")
+                results.append(recipes)
+            except Exception as e:
+                logger.warning(f"배치 요청 {i} 분리 실패, 개별 폴백 대상: {e}")
+                results.append(None)
+        return results
+
+    def generate_meal_plan(
+        self,
+        plan: MealPlanCreate,
+        max_retries: int = 2,
+        tenant: LLMTenant | None = None,
+        usage: UsageMeter | None = None,
+    ) -> list[list[Recipe]]:
+        """
+        여러 날 식단을 일차 묶음별 호출(최대 MEAL_PLAN_CALLS개)로 생성
+
+        최대 14개 레시피를 한 번에 생성하면 출력 토큰만으로 응답 제한 시간을 넘기므로,
+        일차를 MEAL_PLAN_CALLS개 묶음으로 나눕니다. 각 호출은 일반 테넌트 슬롯을 받으므로
+        테넌트 동시 호출 상한을 넘지 않고, 상한이 더 작으면 차례로 실행됩니다.
+        모든 호출이 같은 정적 시스템 프롬프트(캐시 블록)를 쓰고, 일차별 스타일 힌트로
+        묶음끼리 요리가 겹치지 않게 합니다.
+
+        Returns:
+            일차 순서대로 하루 레시피 목록 (각각 meals_per_day개)
+
+        Raises:
+            ValueError: 재시도 후에도 어느 묶음의 생성/파싱이 실패
+        """
+        per_chunk = -(-plan.days // MEAL_PLAN_CALLS)
+        chunks = [
+            range(start, min(start + per_chunk, plan.days + 1))
+            for start in range(1, plan.days + 1, per_chunk)
+        ]
+        logger.info(f"LLM 식단 생성: {plan.days}일 × {plan.meals_per_day}끼, {len(chunks)}개 호출")
+        with ThreadPoolExecutor(max_workers=len(chunks), thread_name_prefix="meal-plan") as pool:
+            futures = [
+                pool.submit(
+                    self._generate_meal_plan_days,
+                    plan,
+                    days,
+                    max_retries,
+                    tenant,
+                    usage,
+                )
+                for days in chunks
+            ]
+            results = [future.result() for future in futures]
+
+        logger.info(f"LLM 식단 생성 성공: {plan.days}일, 레시피 {plan.days * plan.meals_per_day}개")
+        return [day for chunk in results for day in chunk]
+
+    def _generate_meal_plan_days(
+        self,
+        plan: MealPlanCreate,
+        days: range,
+        max_retries: int,
+        tenant: LLMTenant | None,
+        usage: UsageMeter | None,
+    ) -> list[list[Recipe]]:
+        """식단 일차 묶음 하나 생성 (재시도 포함)"""
+        model = model_router.quality_model
+        system_prompt = cached_system_prompt(self._build_system_prompt(), MEAL_PLAN_SYSTEM_SUFFIX)
+        user_prompt = self._build_meal_plan_prompt(plan, days)
+        payload = RecommendationCreate(ingredients=plan.ingredients, constraints=plan.constraints)
+        count = len(days) * plan.meals_per_day
+
+        last_error: Exception | None = None
+        for attempt in range(max_retries):
+            call_started: float | None = None
+            response = None
+            try:
+                logger.info(
+                    f"LLM 식단 생성 시도 {attempt + 1}/{max_retries} "
+                    f"({days.start}~{days.stop - 1}일차, model={model})"
+                )
+                with llm_scheduler.slot(tenant):
+                    call_started = time.monotonic()
+                    response = self.client.messages.create(
+                        model=model,
+                        max_tokens=min(
+                            self.max_tokens * -(-count // 3), settings.llm_batch_max_tokens
+                        ),
+                        temperature=self.temperature,
+                        system=system_prompt,
+                        messages=[{"role": "user", "content": user_prompt}],
+                    )
+                if usage:
+                    usage.record_message("anthropic", model, "meal_plan", response)
+
+                grouped = self._parse_batch_response(response.content[0].text)
+                result = []
+                for day in days:
+                    recipes = self._to_recipes(grouped.get(str(day)) or [], payload)
+                    if len(recipes) != plan.meals_per_day:
+                        raise ValueError(
+                            f"{day}일차 레시피 개수 오류: {len(recipes)}개 "
+                            f"({plan.meals_per_day}개 필요)"
+                        )
+                    result.append(recipes)
+
+                model_router.record(
+                    model, time.monotonic() - call_started, ok=True, task="meal_plan"
+                )
+                return result
+
+            except Exception as e:
+                last_error = e
+                logger.warning(
+                    f"LLM 식단 생성 실패 ({days.start}~{days.stop - 1}일차, "
+                    f"시도 {attempt + 1}/{max_retries}): {e}"
+                )
+                if call_started is not None:
+                    model_router.record(
+                        model, time.monotonic() - call_started, ok=False, task="meal_plan"
+                    )
+                    if usage and response is None:
+                        usage.record_failure("anthropic", model, "meal_plan")
+
+        raise ValueError(f"식단 생성 실패 ({days.start}~{days.stop - 1}일차): {last_error}")
+
+    def _build_meal_plan_prompt(self, plan: MealPlanCreate, days: range) -> str:
+        """식단 일차 묶음 사용자 프롬프트 생성 (일차별 스타일 힌트 포함)"""
+        constraints = plan.constraints
+        tools_str = ", ".join(constraints.tools) if constraints.tools else "모든 도구 가능"
+        expanded_exclude = expand_exclusions(constraints.exclude)
+        exclude_str = ", ".join(sorted(expanded_exclude)) if expanded_exclude else "없음"
+        seed = stable_seed(
+            RecommendationCreate(ingredients=plan.ingredients, constraints=constraints)
+        )
+        styles = "\n".join(
+            f"- {day}일차: {', '.join(self._pick_style_hint(f'{seed}:{day}'))}" for day in days
+        )
+        day_keys = ", ".join(f'"{day}"' for day in days)
+
+        return f"""=== 식단 요청 ===
+{plan.days}일 식단 중 {days.start}~{days.stop - 1}일차, 하루 {plan.meals_per_day}끼 \
+(총 {len(days) * plan.meals_per_day}개)의 한국 가정 요리 레시피를 만들어주세요.
+
+보유 재료: {", ".join(plan.ingredients)}
+끼니별 조리 시간 제한: {constraints.time_limit_min}분 이내
+인분: {constraints.servings}인분
+사용 가능 도구: {tools_str}
+제외 재료 (파생 재료 포함): {exclude_str}
+
+일차별 스타일:
+{styles}
+
+요구사항:
+1. 보유 재료를 최대한 활용 (다른 일차도 같은 재료를 나눠 씀)
+2. 새로 사야 하는 재료는 적게, 여러 요리에 두루 쓰는 흔한 재료로
+3. 일차별 스타일에 맞춰 날마다 다른 요리 종류와 조리법
+4. 반드시 한 끼 식사로 먹을 수 있는 실제 요리만 (양념/소스만 만드는 레시피 금지)
+5. 위 제외 재료는 어떤 형태로도 절대 사용하지 말 것
+
+{day_keys}를 키로 하는 JSON 객체 형식으로만 응답하세요."""
+
+    def _to_recipes(self, recipes_data: list[dict], payload: RecommendationCreate) -> list[Recipe]:
+        """파싱된 레시피 dict 목록을 Recipe 모델로 변환 (have/need/이미지는 나중에 설정)"""
+        return [
+            Recipe(
+                title=r.get("title", "제목 없음"),
+                time_min=r.get("time_min", 15),
+                servings=r.get("servings", payload.constraints.servings),
+                summary=r.get("summary", ""),
+                image_url=None,
+                ingredients_total=r.get("ingredients_total", []),
+                ingredients_have=[],
+                ingredients_need=[],
+                steps=r.get("steps", []),
+                tips=r.get("tips", []),
+                warnings=r.get("warnings", []),
+            )
+            for r in recipes_data
+        ]
 
     def _build_system_prompt(self) -> str:
         """시스템 프롬프트 생성"""
@@ -212,8 +542,20 @@ JSON 배열로 3개의 레시피를 반환합니다. 각 레시피는 다음 필
 
 중요: JSON 배열만 출력하고, 다른 설명이나 마크다운은 포함하지 마세요."""
 
-    def _build_user_prompt(self, payload: RecommendationCreate) -> str:
-        """사용자 프롬프트 생성 (랜덤 스타일 힌트 포함)"""
+    def _pick_style_hint(self, seed: str) -> tuple[str, str]:
+        """
+        시드(캐시 키)에서 스타일/조리법 힌트를 결정적으로 선택
+
+        서로 다른 재료 조합끼리는 다양한 스타일이 나오면서도, 동일한 요청은 항상
+        같은 프롬프트가 되어 재현 가능하고 공급자 측 캐시에도 적중합니다.
+        """
+        digest = hashlib.sha256(seed.encode()).digest()
+        style = self.COOKING_STYLES[digest[0] % len(self.COOKING_STYLES)]
+        method = self.COOKING_METHODS[digest[1] % len(self.COOKING_METHODS)]
+        return style, method
+
+    def _build_user_prompt(self, payload: RecommendationCreate, seed: str | None = None) -> str:
+        """사용자 프롬프트 생성 (시드 기반 스타일 힌트 포함)"""
         ingredients_str = ", ".join(payload.ingredients)
         tools_str = (
             ", ".join(payload.constraints.tools) if payload.constraints.tools else "모든 도구 가능"
@@ -223,9 +565,8 @@ JSON 배열로 3개의 레시피를 반환합니다. 각 레시피는 다음 필
         expanded_exclude = expand_exclusions(payload.constraints.exclude)
         exclude_str = ", ".join(sorted(expanded_exclude)) if expanded_exclude else "없음"
 
-        # 랜덤 스타일 선택 (다양성 증가)
-        style = random.choice(self.COOKING_STYLES)
-        method = random.choice(self.COOKING_METHODS)
+        # 스타일 선택 (요청마다 다양하되 동일 요청에는 동일 힌트)
+        style, method = self._pick_style_hint(seed or stable_seed(payload))
 
         return f"""다음 조건으로 3개의 한국 가정 요리 레시피를 생성해주세요:
 
@@ -280,65 +621,58 @@ JSON 배열 형식으로만 응답하세요."""
             logger.error(f"JSON 파싱 실패: {str(e)}\n응답 내용: {content[:500]}")
             raise ValueError(f"JSON 파싱 실패: {str(e)}") from e
 
-    def _fallback_dummy_recipes(self, payload: RecommendationCreate) -> list[Recipe]:
-        """API 실패 시 더미 레시피 반환"""
-        logger.warning("폴백 더미 레시피 생성")
-        return [
-            Recipe(
-                title="간단 계란볶음밥",
-                time_min=10,
-                servings=payload.constraints.servings,
-                summary="냉장고 재료로 빠르게 만드는 볶음밥",
-                image_url=None,
-                ingredients_total=["밥", "계란", "간장", "참기름"],
-                ingredients_have=[],
-                ingredients_need=[],
-                steps=[
-                    "팬에 기름을 두르고 계란을 볶는다",
-                    "밥을 넣고 볶는다",
-                    "간장과 참기름으로 간한다",
-                    "그릇에 담아 완성",
-                ],
-                tips=["계란은 스크램블 형태로 먼저 볶으면 좋아요"],
-                warnings=[],
-            ),
-            Recipe(
-                title="간단 달걀국",
-                time_min=8,
-                servings=payload.constraints.servings,
-                summary="속 편한 국물 한 그릇",
-                image_url=None,
-                ingredients_total=["계란", "소금", "물"],
-                ingredients_have=[],
-                ingredients_need=[],
-                steps=[
-                    "물을 끓인다",
-                    "소금으로 간한다",
-                    "계란을 풀어 넣는다",
-                    "30초 두었다가 가볍게 저어 완성",
-                ],
-                tips=["다진마늘을 넣어도 좋아요"],
-                warnings=[],
-            ),
-            Recipe(
-                title="간단 김치볶음",
-                time_min=7,
-                servings=payload.constraints.servings,
-                summary="김치만 있으면 OK",
-                image_url=None,
-                ingredients_total=["김치", "참기름"],
-                ingredients_have=[],
-                ingredients_need=[],
-                steps=[
-                    "김치를 먹기 좋게 자른다",
-                    "팬에 참기름을 두른다",
-                    "김치를 넣고 볶는다",
-                    "간을 맞춰 완성",
-                ],
-                tips=["돼지고기를 추가하면 더 맛있어요"],
-                warnings=[],
-            ),
-        ]
+    def _parse_batch_response(self, content: str) -> dict[str, list[dict]]:
+        """배치 응답(요청 번호 → 레시피 배열 JSON 객체) 파싱"""
+        content = content.strip()
+        if "```" in content:
+            start = content.find("\n", content.find("```")) + 1
+            end = content.find("```", start)
+            content = content[start:end].strip()
+
+        try:
+            grouped = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON 파싱 실패: {str(e)}") from e
+
+        if not isinstance(grouped, dict):
+            raise ValueError("배치 응답이 객체 형태가 아닙니다")
+        return {str(k): v for k, v in grouped.items() if isinstance(v, list)}
+
+
+class LocalRecipeAdapter:
+    """번들 레시피 코퍼스(mmap) 검색 어댑터 (네트워크/비용 없음)"""
+
+    def __init__(self, corpus: RecipeCorpus | None = None):
+        self.corpus = corpus or get_local_corpus()
+        if self.corpus is None:
+            raise ValueError(
+                "로컬 레시피 코퍼스가 없습니다. "
+                "python -m app.services.recipe_corpus build 로 생성하세요."
+            )
+
+    def generate_recipes(
+        self, payload: RecommendationCreate, preferences: UserPreferences | None = None
+    ) -> list[Recipe]:
+        """재료 커버리지 상위 3개 레시피 반환 (3개 미만이면 ValueError)"""
+        if preferences:
+            results = preferences.rerank(self.corpus.search(payload, limit=RERANK_POOL_SIZE))
+        else:
+            results = self.corpus.search(payload, limit=3)
+        if len(results) < 3:
+            raise ValueError(f"로컬 코퍼스 검색 결과 부족: {len(results)}/3")
+        logger.info(f"로컬 코퍼스 레시피 반환: scores={[r.score for r in results]}")
+        return [r.recipe for r in results]
+
+
+def offline_recipes(
+    payload: RecommendationCreate, preferences: UserPreferences | None = None
+) -> list[Recipe]:
+    """외부 공급자를 쓸 수 없을 때의 레시피 (로컬 코퍼스 → Mock 순)"""
+    try:
+        return LocalRecipeAdapter().generate_recipes(payload, preferences=preferences)
+    except Exception as e:
+        logger.warning(f"로컬 코퍼스 사용 불가, 더미 레시피 반환: {e}")
+        return MockRecipeLLMAdapter().generate_recipes(payload)
 
 
 class MockRecipeLLMAdapter:
@@ -0,0 +1,224 @@
+"""
+LLM 호출 스케줄러 - 테넌트별 가중 공정 큐잉 (Weighted Fair Queueing)
+
+Anthropic(Sonnet/Haiku) 호출 용량이 포화됐을 때 게스트 IP 하나가 요청을 쏟아내도
+로그인 사용자의 대기 시간이 늘어나지 않도록 외부 LLM 호출 순서를 조정합니다.
+
+- 테넌트: 로그인 사용자(user id) 또는 게스트(IP)
+- 테넌트별 대기열 + 가상 종료 시각(virtual finish time) 기반 WFQ
+- 로그인 사용자는 더 높은 가중치 → 같은 부하에서 더 자주 슬롯 배정
+- 전체 동시 호출 상한 + 테넌트별 동시 호출 상한
+
+Anthropic SDK 호출은 동기 방식이므로 스케줄러도 스레드 기반으로 동작합니다.
+이벤트 루프에서는 `run_llm_call`로 전용 스레드 풀에서 호출해야 합니다.
+슬롯 대기 스레드는 `Condition.wait`로 막혀 있으므로, `asyncio.to_thread`(기본 실행기)로
+감싸면 포화 시 대기 스레드가 기본 실행기를 다 차지해 DB/이미지 등 다른 스레드 작업까지 멈춥니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import ParamSpec, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class LLMTenant:
+    """LLM 호출 주체 (스케줄링 단위)"""
+
+    key: str
+    weight: float
+
+    @classmethod
+    def for_user(cls, user_id: object) -> LLMTenant:
+        return cls(key=f"user:{user_id}", weight=settings.llm_user_weight)
+
+    @classmethod
+    def for_guest(cls, ip_address: str) -> LLMTenant:
+        return cls(key=f"guest:{ip_address}", weight=settings.llm_guest_weight)
+
+
+# 테넌트 정보 없이 들어온 호출 (스크립트, 배치 작업 등)
+SYSTEM_TENANT = LLMTenant(key="system", weight=1.0)
+
+
+class SchedulerTimeoutError(RuntimeError):
+    """대기열에서 제한 시간 내에 슬롯을 받지 못함"""
+
+
+@dataclass
+class _Ticket:
+    tenant: LLMTenant
+    finish_tag: float
+    seq: int
+    granted: bool = field(default=False)
+
+
+class FairLLMScheduler:
+    """
+    가중 공정 큐잉 스케줄러
+
+    각 요청은 도착 시점에 가상 종료 시각
+    `max(V, 테넌트의 직전 종료 시각) + 1 / weight`를 부여받고,
+    슬롯이 비면 테넌트별 대기열의 맨 앞 요청 중 종료 시각이 가장 작은 요청부터 실행됩니다.
+    테넌트별 동시 호출 상한에 걸린 테넌트는 건너뜁니다.
+    """
+
+    def __init__(self, max_concurrency: int, per_tenant_concurrency: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_tenant_concurrency = max(1, per_tenant_concurrency)
+
+        self._cond = threading.Condition()
+        self._queues: dict[str, deque[_Ticket]] = {}
+        self._last_finish: dict[str, float] = {}
+        self._active: dict[str, int] = {}
+        self._active_total = 0
+        self._virtual_time = 0.0
+        self._seq = itertools.count()
+
+    @contextmanager
+    def slot(self, tenant: LLMTenant | None, timeout: float | None = None) -> Iterator[None]:
+        """
+        LLM 호출 슬롯 획득 (컨텍스트 매니저)
+
+        Args:
+            tenant: 호출 주체 (None이면 SYSTEM_TENANT)
+            timeout: 최대 대기 시간 (초, None이면 settings.llm_queue_timeout)
+
+        Raises:
+            SchedulerTimeoutError: 제한 시간 내에 슬롯을 받지 못한 경우
+        """
+        tenant = tenant or SYSTEM_TENANT
+        timeout = settings.llm_queue_timeout if timeout is None else timeout
+        ticket = self._acquire(tenant, timeout)
+        try:
+            yield
+        finally:
+            self._release(ticket)
+
+    def _acquire(self, tenant: LLMTenant, timeout: float) -> _Ticket:
+        enqueued_at = time.monotonic()
+        deadline = enqueued_at + timeout
+
+        with self._cond:
+            start_tag = max(self._virtual_time, self._last_finish.get(tenant.key, 0.0))
+            ticket = _Ticket(
+                tenant=tenant,
+                finish_tag=start_tag + 1.0 / max(tenant.weight, 1e-6),
+                seq=next(self._seq),
+            )
+            self._last_finish[tenant.key] = ticket.finish_tag
+            self._queues.setdefault(tenant.key, deque()).append(ticket)
+            self._dispatch()
+
+            while not ticket.granted:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._queues[tenant.key].remove(ticket)
+                    self._cleanup(tenant.key)
+                    raise SchedulerTimeoutError(
+                        f"LLM 대기열 타임아웃 ({timeout:.1f}초, tenant={tenant.key})"
+                    )
+                self._cond.wait(remaining)
+
+        waited = time.monotonic() - enqueued_at
+        if waited > 0.5:
+            logger.info(f"LLM 슬롯 대기: {waited:.2f}초 (tenant={tenant.key})")
+        return ticket
+
+    def _release(self, ticket: _Ticket) -> None:
+        key = ticket.tenant.key
+        with self._cond:
+            self._active[key] -= 1
+            self._active_total -= 1
+            self._cleanup(key)
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """빈 슬롯에 대기 중인 요청 배정 (락 보유 상태에서 호출)"""
+        granted_any = False
+        while self._active_total < self.max_concurrency:
+            best: _Ticket | None = None
+            for key, queue in self._queues.items():
+                if not queue or self._active.get(key, 0) >= self.per_tenant_concurrency:
+                    continue
+                head = queue[0]
+                if best is None or (head.finish_tag, head.seq) < (best.finish_tag, best.seq):
+                    best = head
+            if best is None:
+                break
+
+            key = best.tenant.key
+            self._queues[key].popleft()
+            self._active[key] = self._active.get(key, 0) + 1
+            self._active_total += 1
+            self._virtual_time = max(self._virtual_time, best.finish_tag - 1.0 / best.tenant.weight)
+            best.granted = True
+            granted_any = True
+
+        if granted_any:
+            self._cond.notify_all()
+
+    def _cleanup(self, key: str) -> None:
+        """유휴 테넌트 상태 정리 (메모리 누수 방지)"""
+        if not self._queues.get(key) and not self._active.get(key):
+            self._queues.pop(key, None)
+            self._active.pop(key, None)
+            # 유휴 테넌트가 과거 종료 시각으로 우선권을 얻지 않도록 가상 시각 이전 값은 버림
+            if self._last_finish.get(key, 0.0) <= self._virtual_time:
+                self._last_finish.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """스케줄러 상태 (모니터링용)"""
+        with self._cond:
+            return {
+                "active_total": self._active_total,
+                "max_concurrency": self.max_concurrency,
+                "queued": sum(len(q) for q in self._queues.values()),
+                "tenants": len(self._queues),
+            }
+
+
+llm_scheduler = FairLLMScheduler(
+    max_concurrency=settings.llm_max_concurrency,
+    per_tenant_concurrency=settings.llm_tenant_concurrency,
+)
+
+# LLM 호출(슬롯 대기 포함) 전용 스레드 풀 - 기본 실행기와 분리
+_llm_executor = ThreadPoolExecutor(
+    max_workers=settings.llm_executor_threads, thread_name_prefix="llm-call"
+)
+
+
+async def run_llm_call(func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    동기 LLM 호출을 전용 스레드 풀에서 실행 (`asyncio.to_thread` 대체)
+
+    슬롯을 기다리는 스레드가 기본 실행기를 점유하지 않도록 별도 풀을 사용합니다.
+    컨텍스트 변수는 `asyncio.to_thread`와 같이 호출 스레드로 복사합니다.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(_llm_executor, call)
+
+
+def shutdown_llm_executor() -> None:
+    """앱 종료 시 전용 스레드 풀 정리 (진행 중인 호출은 기다리지 않음)"""
+    _llm_executor.shutdown(wait=False, cancel_futures=True)
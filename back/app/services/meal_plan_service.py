@@ -0,0 +1,173 @@
+"""
+Meal plan service
+
+- N일 식단을 일차 묶음별 LLM 호출(고정 2개, 일반 테넌트 슬롯)로 생성 (응답 제한 시간 안에 끝나도록)
+- 전체 레시피 이미지를 한 번의 병렬 단계로 검색
+- 기간 전체 필요 재료를 하나의 장보기 리스트로 통합
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import UTC, datetime
+from itertools import cycle, islice
+from uuid import UUID, uuid4
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.meal_plan import MealPlanCreate, MealPlanDay, MealPlanRecord, MealPlanResponse
+from app.models.recommendation import Recipe, RecommendationCreate
+from app.services.exclusion_matcher import get_exclusion_matcher
+from app.services.llm_adapter import MockRecipeLLMAdapter, RecipeLLMAdapter
+from app.services.llm_scheduler import LLMTenant, run_llm_call
+from app.services.recipe_corpus import get_local_corpus
+from app.services.recommendation_service import build_shopping_list, finalize_recipes
+from app.services.usage_ledger import UsageLedgerService, UsageMeter
+from app.services.validation import validate_recipe
+
+logger = logging.getLogger(__name__)
+
+
+def _split_days(recipes: list[Recipe], plan: MealPlanCreate) -> list[list[Recipe]]:
+    """평탄한 레시피 목록 → 일차별 목록"""
+    size = plan.meals_per_day
+    return [recipes[i : i + size] for i in range(0, plan.days * size, size)]
+
+
+def _local_meal_plan(plan: MealPlanCreate) -> list[list[Recipe]]:
+    """로컬 코퍼스 커버리지 상위 레시피로 식단 구성 (부족하면 ValueError)"""
+    corpus = get_local_corpus()
+    if corpus is None:
+        raise ValueError("로컬 레시피 코퍼스가 없습니다")
+
+    total = plan.days * plan.meals_per_day
+    payload = RecommendationCreate(ingredients=plan.ingredients, constraints=plan.constraints)
+    results = corpus.search(payload, limit=total)
+    if len(results) < total:
+        raise ValueError(f"로컬 코퍼스 검색 결과 부족: {len(results)}/{total}")
+    return _split_days([r.recipe for r in results], plan)
+
+
+def _mock_meal_plan(plan: MealPlanCreate) -> list[list[Recipe]]:
+    """더미 레시피를 돌려가며 식단 구성 (개발용)"""
+    payload = RecommendationCreate(ingredients=plan.ingredients, constraints=plan.constraints)
+    recipes = MockRecipeLLMAdapter().generate_recipes(payload)
+    return _split_days(list(islice(cycle(recipes), plan.days * plan.meals_per_day)), plan)
+
+
+async def create_meal_plan(
+    plan: MealPlanCreate,
+    db: Session,
+    tenant: LLMTenant | None = None,
+    user_id: UUID | None = None,
+) -> MealPlanResponse:
+    """
+    여러 날 식단 생성 (일차 묶음별 LLM 호출 + 이미지 일괄 검색)
+
+    Args:
+        plan: 식단 요청 (재료, 끼니별 제약, 일수, 하루 끼니 수)
+        tenant: 요청 주체 - LLM 호출 공정 스케줄링용
+        user_id: 로그인 사용자 ID
+
+    Returns:
+        MealPlanResponse: 일차별 레시피 + 통합 장보기 리스트
+
+    Raises:
+        ValueError: 생성/검증 실패 시
+    """
+    total = plan.days * plan.meals_per_day
+    logger.info(f"식단 생성 요청: {plan.days}일 × {plan.meals_per_day}끼, 재료={plan.ingredients}")
+    start_time = time.monotonic()
+
+    usage = UsageMeter()
+    ledger = UsageLedgerService(db)
+    budget_exceeded = ledger.is_over_daily_budget()
+
+    plan_id: str | None = None
+    try:
+        # 1. 식단 생성 (mock → local → anthropic, 예산 초과 시 로컬 코퍼스 우선)
+        provider = settings.recipe_provider
+        if provider == "mock":
+            days = _mock_meal_plan(plan)
+        elif provider == "local" or budget_exceeded:
+            try:
+                days = _local_meal_plan(plan)
+            except ValueError as e:
+                if provider == "local":
+                    raise
+                logger.warning(f"예산 초과 모드 로컬 식단 실패, LLM 생성: {e}")
+                days = await run_llm_call(
+                    RecipeLLMAdapter().generate_meal_plan, plan, tenant=tenant, usage=usage
+                )
+        else:
+            try:
+                days = await run_llm_call(
+                    RecipeLLMAdapter().generate_meal_plan, plan, tenant=tenant, usage=usage
+                )
+            except Exception as e:
+                logger.error(f"LLM 식단 생성 실패, 로컬 코퍼스 시도: {e}")
+                try:
+                    days = _local_meal_plan(plan)
+                except ValueError:
+                    raise ValueError(f"식단 생성 실패: {e}") from e
+
+        llm_elapsed = time.monotonic() - start_time
+        logger.info(f"식단 레시피 생성 완료: {total}개, {llm_elapsed:.1f}초 (provider={provider})")
+
+        # 2. 전체 레시피 이미지 일괄 검색 + 보유/필요 재료 분리
+        final_recipes = await finalize_recipes(
+            [recipe for day in days for recipe in day],
+            plan.ingredients,
+            usage=usage,
+            cache_only=budget_exceeded,
+            timeout=max(28 - llm_elapsed, 5),
+        )
+
+        # 3. 검증 (끼니별 규칙은 추천과 동일)
+        matcher = get_exclusion_matcher(plan.constraints.exclude)
+        for recipe in final_recipes:
+            validate_recipe(recipe, plan.constraints, matcher)
+
+        # 4. 응답 생성 (기간 전체 통합 장보기 리스트)
+        response = MealPlanResponse(
+            id=f"plan_{uuid4().hex[:10]}",
+            created_at=datetime.now(UTC),
+            days=[
+                MealPlanDay(day=index + 1, recipes=recipes)
+                for index, recipes in enumerate(_split_days(final_recipes, plan))
+            ],
+            shopping_list=build_shopping_list(final_recipes),
+        )
+
+        # 5. DB 저장
+        record = MealPlanRecord(
+            id=response.id,
+            user_id=user_id,
+            created_at=response.created_at,
+            data=response.model_dump(mode="json"),
+        )
+        db.add(record)
+        db.commit()
+        plan_id = response.id
+    except Exception:
+        db.rollback()  # 실패한 트랜잭션 정리 후 사용량만 저장
+        raise
+    finally:
+        # 6. 사용량 원장 저장 (검증/저장이 실패해도 이미 쓴 비용은 기록)
+        ledger.save_quietly(usage, recommendation_id=plan_id)
+        elapsed = time.monotonic() - start_time
+        logger.info(
+            f"💰 Cost: Total=${usage.cost():.4f} (meal plan {plan_id or 'failed'}, "
+            f"{usage.summary()}, budget_mode={budget_exceeded}, {elapsed:.1f}s)"
+        )
+    return response
+
+
+def get_meal_plan(plan_id: str, db: Session) -> MealPlanResponse | None:
+    """DB에서 식단 조회"""
+    record = db.get(MealPlanRecord, plan_id)
+    if not record:
+        return None
+    return MealPlanResponse.model_validate(record.data)
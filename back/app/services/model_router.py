@@ -0,0 +1,198 @@
+"""
+모델 라우터 - 요청별 Haiku/Sonnet 자동 선택
+
+"계란, 밥"처럼 단순한 요청까지 Sonnet의 긴 지연을 감수할 필요가 없으므로
+요청마다 아래 기준으로 모델을 고릅니다.
+
+- 입력 복잡도: 재료 수, 제외 재료(파생 포함) 수, 시간 제한, 인분, 도구 제약
+- 모델별 실시간 통계: 지연 시간/에러율 지수이동평균(EWMA)
+- 클라이언트 힌트: `fast`(응답 속도 우선) / `quality`(품질 우선)
+
+모든 결정은 `app.model_routing` 로거에 JSON 한 줄로 남겨 오프라인 분석에 사용합니다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.data.allergen_derivatives import expand_exclusions
+from app.models.recommendation import RecommendationCreate
+
+logger = logging.getLogger(__name__)
+decision_logger = logging.getLogger("app.model_routing")
+
+# 통계가 이 개수 이상 쌓인 뒤에만 에러율/지연 기반 우회 적용
+MIN_SAMPLES = 5
+EWMA_ALPHA = 0.2
+# 우회 중인 모델은 새 표본이 없으므로, 오래된 통계는 무시하고 다시 시도해 회복 여부 확인
+STATS_TTL_SECONDS = 120.0
+# 라우팅 판단에 쓰는 작업 (번역/영상 구조화처럼 입출력 크기가 다른 호출은 따로 집계)
+ROUTED_TASK = "recommendation"
+
+
+@dataclass
+class ModelStats:
+    """모델별 실시간 호출 통계 (EWMA)"""
+
+    latency: float = 0.0
+    error_rate: float = 0.0
+    samples: int = 0
+    updated_at: float = 0.0
+
+    def update(self, latency: float, ok: bool) -> None:
+        if self.samples == 0:
+            self.latency = latency
+            self.error_rate = 0.0 if ok else 1.0
+        else:
+            self.latency += EWMA_ALPHA * (latency - self.latency)
+            self.error_rate += EWMA_ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+        self.samples += 1
+        self.updated_at = time.monotonic()
+
+    @property
+    def warmed_up(self) -> bool:
+        fresh = time.monotonic() - self.updated_at < STATS_TTL_SECONDS
+        return self.samples >= MIN_SAMPLES and fresh
+
+
+@dataclass(frozen=True)
+class RoutingDecision:
+    """모델 선택 결과"""
+
+    model: str
+    reason: str
+    complexity: float
+
+
+class ModelRouter:
+    """요청 복잡도 + 실시간 통계 + 클라이언트 힌트 기반 모델 라우터"""
+
+    def __init__(self, fast_model: str, quality_model: str):
+        self.fast_model = fast_model
+        self.quality_model = quality_model
+        self._stats: dict[tuple[str, str], ModelStats] = {}  # (작업, 모델) → 통계
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def complexity(payload: RecommendationCreate) -> float:
+        """
+        입력 복잡도 점수 (높을수록 Sonnet이 유리)
+
+        예: "계란, 밥" + 기본 제약 → 2.0 / 재료 6개 + 알러지 2종 + 30분 → 10점 이상
+        """
+        constraints = payload.constraints
+        score = float(len(payload.ingredients))
+        # 제외 재료는 파생까지 지켜야 하므로 가중치를 더 줌
+        score += 1.5 * len(constraints.exclude)
+        score += 0.1 * len(expand_exclusions(constraints.exclude))
+        # 시간 여유가 많을수록 요리가 복잡해짐
+        if constraints.time_limit_min >= 30:
+            score += 1.0
+        if constraints.servings >= 3:
+            score += 0.5
+        if constraints.tools:
+            score += 0.5
+        return round(score, 2)
+
+    def choose(self, payload: RecommendationCreate) -> RoutingDecision:
+        """요청에 사용할 모델 결정 (결정 내역 로깅 포함)"""
+        complexity = self.complexity(payload)
+        hint = payload.latency_hint
+
+        if not settings.llm_routing_enabled:
+            decision = RoutingDecision(settings.llm_model, "routing_disabled", complexity)
+        elif hint == "fast":
+            decision = RoutingDecision(self.fast_model, "hint_fast", complexity)
+        elif hint == "quality":
+            decision = RoutingDecision(self.quality_model, "hint_quality", complexity)
+        elif complexity < settings.llm_routing_complexity_threshold:
+            decision = RoutingDecision(self.fast_model, "simple_input", complexity)
+        else:
+            decision = RoutingDecision(self.quality_model, "complex_input", complexity)
+
+        if settings.llm_routing_enabled:
+            decision = self._apply_health(decision)
+
+        self._log_decision(payload, decision)
+        return decision
+
+    def _apply_health(self, decision: RoutingDecision) -> RoutingDecision:
+        """선택된 모델이 불안정하거나 느리면 다른 모델로 우회"""
+        other = self.fast_model if decision.model == self.quality_model else self.quality_model
+        with self._lock:
+            chosen = self._stats.get((ROUTED_TASK, decision.model), ModelStats())
+            alternative = self._stats.get((ROUTED_TASK, other), ModelStats())
+
+        threshold = settings.llm_routing_error_threshold
+        if (
+            chosen.warmed_up
+            and chosen.error_rate > threshold
+            and (not alternative.warmed_up or alternative.error_rate < chosen.error_rate)
+        ):
+            return RoutingDecision(other, f"{decision.reason}+unhealthy", decision.complexity)
+
+        # 품질 모델 지연이 예산을 넘으면 명시적 quality 힌트가 아닌 한 빠른 모델 사용
+        if (
+            decision.model == self.quality_model
+            and decision.reason != "hint_quality"
+            and chosen.warmed_up
+            and chosen.latency > settings.llm_routing_latency_budget
+        ):
+            return RoutingDecision(self.fast_model, f"{decision.reason}+slow", decision.complexity)
+
+        return decision
+
+    def escalate(self, decision: RoutingDecision) -> RoutingDecision:
+        """빠른 모델로 실패한 요청의 재시도용 (품질 모델로 승격)"""
+        if decision.model == self.fast_model and settings.llm_routing_enabled:
+            return RoutingDecision(self.quality_model, "retry_escalation", decision.complexity)
+        return decision
+
+    def record(self, model: str, latency: float, ok: bool, task: str = ROUTED_TASK) -> None:
+        """
+        호출 결과를 작업/모델별 통계에 반영
+
+        짧은 번역/구조화 호출이 추천 호출과 같은 EWMA에 섞이면 Haiku 지연이 실제보다 낮게
+        잡히므로, 라우팅은 ROUTED_TASK 통계만 봅니다.
+        """
+        with self._lock:
+            self._stats.setdefault((task, model), ModelStats()).update(latency, ok)
+
+    def get_stats(self) -> dict[str, dict[str, dict]]:
+        """작업 → 모델별 통계 스냅샷 (모니터링용)"""
+        snapshot: dict[str, dict[str, dict]] = {}
+        with self._lock:
+            for (task, model), s in self._stats.items():
+                snapshot.setdefault(task, {})[model] = {
+                    "latency": round(s.latency, 3),
+                    "error_rate": round(s.error_rate, 3),
+                    "samples": s.samples,
+                }
+        return snapshot
+
+    def _log_decision(self, payload: RecommendationCreate, decision: RoutingDecision) -> None:
+        stats = self.get_stats()
+        decision_logger.info(
+            json.dumps(
+                {
+                    "event": "model_routing",
+                    "model": decision.model,
+                    "reason": decision.reason,
+                    "complexity": decision.complexity,
+                    "hint": payload.latency_hint,
+                    "ingredients": len(payload.ingredients),
+                    "exclude": len(payload.constraints.exclude),
+                    "time_limit_min": payload.constraints.time_limit_min,
+                    "stats": stats,
+                },
+                ensure_ascii=False,
+            )
+        )
+
+
+model_router = ModelRouter(fast_model=settings.haiku_model, quality_model=settings.llm_model)
@@ -0,0 +1,130 @@
+"""
+로컬 영양 성분 추정 (LLM 호출 없음)
+
+번들 영양표(`app/data/nutrition_table.py`)를 재료 × 영양소 행렬로 한 번만 만들어 두고,
+레시피 여러 개의 1인분 재료 사용량(g)을 레시피 × 재료 행렬로 채워
+행렬 곱 한 번으로 칼로리/탄단지를 계산합니다.
+
+- 재료 매칭: 정규화 키 정확 일치 → 영양표 재료명 중 포함되는 가장 긴 이름
+  (한 글자 재료명은 단어 끝에 올 때만: "실파" → 파, "파인애플"/"해물"은 매칭 안 함)
+- 사용량: 분량 표기("100g", "2큰술", "계란 2개")는 인분으로 나누고, 없으면 1인분 기본량
+- 영양표에 없는 재료는 0으로 계산하고 `matched_ratio`로 신뢰도를 함께 제공
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from app.data.nutrition_table import NUTRITION_TABLE, PIECE_UNITS, UNIT_GRAMS
+from app.models.recommendation import Nutrition, Recipe
+from app.services.ingredient_normalizer import ingredient_key
+
+_NAMES = list(NUTRITION_TABLE)
+_INDEX = {name: i for i, name in enumerate(_NAMES)}
+# 부분 일치 시 긴 이름 우선 ("참기름"이 "기름"보다, "양파"가 "파"보다 먼저)
+_NAMES_BY_LENGTH = sorted(_NAMES, key=len, reverse=True)
+# 한 글자 재료명으로 끝나지만 그 재료가 아닌 단어 (확인된 오탐만 추가)
+_SHORT_NAME_EXCEPTIONS: tuple[str, ...] = ("해물", "나물", "국물", "튀김")
+
+# (재료 수, 4): 100g당 kcal, 단백질, 지방, 탄수화물
+_NUTRIENTS = np.array(
+    [[e.kcal, e.protein, e.fat, e.carbs] for e in NUTRITION_TABLE.values()], dtype=np.float32
+)
+
+_QUANTITY_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)(?:/(\d+))?\s*("
+    + "|".join(sorted([*UNIT_GRAMS, *PIECE_UNITS], key=len, reverse=True))
+    + ")?",
+    re.IGNORECASE,
+)
+
+
+def _match(key: str) -> int | None:
+    if key in _INDEX:
+        return _INDEX[key]
+    tokens = key.split()
+    for name in _NAMES_BY_LENGTH:
+        if len(name) >= 2:
+            if name in key:
+                return _INDEX[name]
+        elif any(t.endswith(name) and not t.endswith(_SHORT_NAME_EXCEPTIONS) for t in tokens):
+            return _INDEX[name]
+    return None
+
+
+def _recipe_grams(raw: str, index: int) -> float | None:
+    """분량 표기 → 레시피 전체 사용량 (g), 해석할 수 없으면 None"""
+    m = _QUANTITY_PATTERN.search(raw)
+    if not m:
+        return None
+    amount = float(m.group(1)) / (float(m.group(2)) if m.group(2) else 1.0)
+    unit = (m.group(3) or "").lower()
+    if unit in UNIT_GRAMS:
+        return amount * UNIT_GRAMS[unit]
+    # 단위 없음/개수 단위 → 재료 1개 무게
+    piece_g = NUTRITION_TABLE[_NAMES[index]].piece_g
+    return amount * piece_g if piece_g else None
+
+
+@lru_cache(maxsize=4096)
+def lookup(raw: str) -> tuple[int, float | None] | None:
+    """
+    재료 문자열 → (영양표 인덱스, 레시피 전체 사용량 g 또는 None)
+
+    Returns:
+        영양표에 없는 재료면 None
+    """
+    index = _match(ingredient_key(raw))
+    if index is None:
+        return None
+    return index, _recipe_grams(raw, index)
+
+
+def estimate_nutrition(recipes: list[Recipe]) -> list[Nutrition | None]:
+    """
+    레시피 목록의 1인분 영양 성분을 행렬 곱 한 번으로 추정
+
+    Returns:
+        레시피 순서대로 추정값 (영양표와 일치하는 재료가 하나도 없으면 None)
+    """
+    if not recipes:
+        return []
+
+    grams = np.zeros((len(recipes), len(_NAMES)), dtype=np.float32)
+    matched = np.zeros(len(recipes), dtype=np.int32)
+    for row, recipe in enumerate(recipes):
+        servings = max(recipe.servings, 1)
+        for raw in recipe.ingredients_total:
+            found = lookup(raw)
+            if found is None:
+                continue
+            index, total_g = found
+            per_serving = (
+                total_g / servings
+                if total_g is not None
+                else NUTRITION_TABLE[_NAMES[index]].serving_g
+            )
+            grams[row, index] += per_serving
+            matched[row] += 1
+
+    totals = grams @ _NUTRIENTS / 100.0  # (레시피 수, 4)
+
+    results: list[Nutrition | None] = []
+    for row, recipe in enumerate(recipes):
+        if matched[row] == 0:
+            results.append(None)
+            continue
+        kcal, protein, fat, carbs = totals[row].tolist()
+        results.append(
+            Nutrition(
+                calories_kcal=round(kcal),
+                protein_g=round(protein, 1),
+                fat_g=round(fat, 1),
+                carbs_g=round(carbs, 1),
+                matched_ratio=round(int(matched[row]) / len(recipe.ingredients_total), 2),
+            )
+        )
+    return results
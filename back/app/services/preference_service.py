@@ -0,0 +1,192 @@
+"""
+Preference service
+
+- 즐겨찾기 기반 취향 프로필 (재료/요리 스타일/조리 시간 가중치)
+- 즐겨찾기 추가/삭제 시 증분 갱신 (전체 재계산 없음)
+- 후보 레시피가 3개보다 많을 때 사용자별 재정렬 (LLM 호출 없이 로컬 계산)
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.favorite import Favorite
+from app.models.preference_profile import PreferenceProfile
+from app.models.recommendation import Recipe, RecommendationRecord
+from app.services.ingredient_normalizer import ingredient_key
+from app.services.recipe_index import ScoredRecipe
+
+logger = logging.getLogger(__name__)
+
+# 제목에서 찾는 요리 스타일 (긴 것부터 검사해 "볶음밥"이 "볶음"보다 우선)
+STYLE_KEYWORDS = sorted(
+    [
+        "볶음밥",
+        "덮밥",
+        "비빔밥",
+        "김밥",
+        "볶음",
+        "찌개",
+        "전골",
+        "국",
+        "탕",
+        "조림",
+        "구이",
+        "전",
+        "찜",
+        "무침",
+        "국수",
+        "라면",
+        "파스타",
+        "샐러드",
+        "샌드위치",
+        "토스트",
+        "죽",
+        "말이",
+    ],
+    key=len,
+    reverse=True,
+)
+QUICK_TIME_MIN = 10
+
+# 재정렬 시 취향 점수 반영 비율 (기존 커버리지 점수 0~1에 더함)
+PREFERENCE_WEIGHT = 0.3
+
+
+def recipe_features(recipe: Recipe) -> set[str]:
+    """레시피 → 취향 특징 집합 (재료 키, 요리 스타일, 빠른 조리 여부)"""
+    features = {f"ing:{k}" for k in map(ingredient_key, recipe.ingredients_total) if k}
+    for style in STYLE_KEYWORDS:
+        if style in recipe.title:
+            features.add(f"style:{style}")
+            break
+    if recipe.time_min <= QUICK_TIME_MIN:
+        features.add("time:quick")
+    return features
+
+
+@dataclass
+class UserPreferences:
+    """메모리상의 취향 프로필 (특징별 즐겨찾기 수)"""
+
+    weights: dict[str, float] = field(default_factory=dict)
+    favorite_count: int = 0
+
+    def score(self, recipe: Recipe) -> float:
+        """레시피 취향 점수 (0~1: 특징마다 모든 즐겨찾기에 등장하면 1)"""
+        if self.favorite_count <= 0:
+            return 0.0
+        features = recipe_features(recipe)
+        if not features:
+            return 0.0
+        total = sum(max(self.weights.get(f, 0.0), 0.0) for f in features)
+        return min(total / (len(features) * self.favorite_count), 1.0)
+
+    def rerank(self, candidates: list[ScoredRecipe], limit: int = 3) -> list[ScoredRecipe]:
+        """후보를 커버리지 점수 + 취향 점수로 재정렬 (후보가 limit 이하면 그대로)"""
+        if len(candidates) <= limit or self.favorite_count <= 0:
+            return candidates[:limit]
+        ranked = sorted(
+            candidates,
+            key=lambda c: c.score + PREFERENCE_WEIGHT * self.score(c.recipe),
+            reverse=True,
+        )
+        return ranked[:limit]
+
+
+class PreferenceService:
+    """취향 프로필 서비스"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_preferences(self, user_id: UUID) -> UserPreferences | None:
+        """저장된 취향 프로필 조회 (즐겨찾기가 없으면 None)"""
+        profile = self.db.get(PreferenceProfile, user_id)
+        if not profile or profile.favorite_count <= 0:
+            return None
+        return UserPreferences(
+            weights=dict(profile.weights or {}), favorite_count=profile.favorite_count
+        )
+
+    def _load_recipe(self, recommendation_id: str, recipe_index: int) -> Recipe | None:
+        record = self.db.get(RecommendationRecord, recommendation_id)
+        if not record:
+            return None
+        recipes = (record.data or {}).get("recipes", [])
+        if not 0 <= recipe_index < len(recipes):
+            return None
+        return Recipe.model_validate(recipes[recipe_index])
+
+    def apply_favorite(
+        self, user_id: UUID, recommendation_id: str, recipe_index: int, delta: int
+    ) -> None:
+        """
+        즐겨찾기 1건 추가(+1)/삭제(-1)를 프로필에 증분 반영
+
+        레시피 특징마다 즐겨찾기 수를 더하거나 빼므로 전체 재계산이 필요 없습니다.
+        즐겨찾기 변경이 커밋된 뒤에 호출해야 합니다.
+        """
+        recipe = self._load_recipe(recommendation_id, recipe_index)
+        # 같은 사용자의 동시 즐겨찾기 변경이 서로의 증분을 덮어쓰지 않도록 행 잠금 후 읽기-수정-쓰기
+        profile = self.db.get(PreferenceProfile, user_id, with_for_update=True)
+        if profile is None:
+            # 프로필 도입 전 즐겨찾기가 있을 수 있으므로 처음 한 번은 전체 계산
+            self.rebuild(user_id)
+            return
+
+        if recipe is None:
+            self.db.rollback()  # 행 잠금 해제
+            logger.info(f"취향 프로필 갱신 생략 (레시피 없음): {recommendation_id}#{recipe_index}")
+            return
+
+        weights = dict(profile.weights or {})
+        for feature in recipe_features(recipe):
+            value = weights.get(feature, 0.0) + delta
+            if value > 0:
+                weights[feature] = value
+            else:
+                weights.pop(feature, None)
+
+        # JSON 컬럼은 새 dict를 할당해야 변경이 감지됨
+        profile.weights = weights
+        profile.favorite_count = max((profile.favorite_count or 0) + delta, 0)
+        profile.updated_at = datetime.utcnow()
+        self.db.commit()
+
+    def rebuild(self, user_id: UUID) -> UserPreferences:
+        """즐겨찾기 전체로 프로필 재계산 (증분 갱신이 어긋났을 때 복구용)"""
+        favorites = (
+            self.db.query(Favorite.recommendation_id, Favorite.recipe_index)
+            .filter(Favorite.user_id == user_id)
+            .all()
+        )
+        records = {
+            r.id: r
+            for r in self.db.query(RecommendationRecord).filter(
+                RecommendationRecord.id.in_({f.recommendation_id for f in favorites})
+            )
+        }
+
+        preferences = UserPreferences()
+        for rec_id, index in favorites:
+            record = records.get(rec_id)
+            recipes = (record.data or {}).get("recipes", []) if record else []
+            if not 0 <= index < len(recipes):
+                continue
+            for feature in recipe_features(Recipe.model_validate(recipes[index])):
+                preferences.weights[feature] = preferences.weights.get(feature, 0.0) + 1
+            preferences.favorite_count += 1
+
+        profile = self.db.get(PreferenceProfile, user_id) or PreferenceProfile(user_id=user_id)
+        profile.weights = preferences.weights
+        profile.favorite_count = preferences.favorite_count
+        profile.updated_at = datetime.utcnow()
+        self.db.merge(profile)
+        self.db.commit()
+        return preferences
@@ -0,0 +1,172 @@
+"""
+요청 간 레시피 마이크로 배처
+
+피크 시간에는 서로 다른 재료 조합 요청이 같은 순간에 몰리는데, 요청마다
+`_build_system_prompt`의 긴 few-shot 예시를 매번 다시 보내게 됩니다.
+배처는 최대 N ms 동안 요청을 모아 한 번의 API 호출로 요청별 레시피 3개씩을 생성하고,
+응답을 요청별로 분리합니다. 분리/파싱에 실패한 요청만 개별 호출로 폴백합니다.
+
+`settings.llm_batch_enabled=True`일 때만 사용됩니다 (opt-in).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.models.recommendation import Recipe, RecommendationCreate
+from app.services.llm_adapter import RecipeLLMAdapter
+from app.services.llm_scheduler import LLMTenant, run_llm_call
+from app.services.usage_ledger import UsageMeter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingRequest:
+    payload: RecommendationCreate
+    tenant: LLMTenant | None
+    seed: str | None
+    usage: UsageMeter | None
+    future: asyncio.Future
+
+
+class RecipeMicroBatcher:
+    """수집 창(window) 동안 들어온 요청을 묶어 한 번에 생성"""
+
+    def __init__(
+        self,
+        adapter_factory: Callable[[], RecipeLLMAdapter] = RecipeLLMAdapter,
+        window_ms: int | None = None,
+        max_batch_size: int | None = None,
+    ):
+        self.adapter_factory = adapter_factory
+        self.window = (settings.llm_batch_window_ms if window_ms is None else window_ms) / 1000
+        self.max_batch_size = max(1, max_batch_size or settings.llm_batch_max_size)
+
+        self._pending: list[_PendingRequest] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        # 벤치마크/모니터링용 카운터
+        self.outbound_calls = 0
+        self.fallback_calls = 0
+        self.requests = 0
+
+    async def submit(
+        self,
+        payload: RecommendationCreate,
+        tenant: LLMTenant | None = None,
+        seed: str | None = None,
+        usage: UsageMeter | None = None,
+    ) -> list[Recipe]:
+        """요청을 현재 배치에 추가하고 해당 요청의 레시피 3개를 기다림"""
+        loop = asyncio.get_running_loop()
+        request = _PendingRequest(
+            payload=payload, tenant=tenant, seed=seed, usage=usage, future=loop.create_future()
+        )
+        self._pending.append(request)
+        self.requests += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await request.future
+
+    def _flush(self) -> None:
+        """대기 중인 요청을 하나의 배치로 떼어내 실행"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        # 태스크가 GC되지 않도록 참조 유지
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[_PendingRequest]) -> None:
+        try:
+            adapter = self.adapter_factory()
+        except Exception as e:
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        # 요청이 하나뿐이면 배치 프롬프트 없이 기존 경로 사용
+        if len(batch) == 1:
+            await self._run_single(adapter, batch[0])
+            return
+
+        # 가장 낮은 가중치의 테넌트로 슬롯을 받아 배치가 게스트 요청을 우선순위 높게 실어 나르지 않음
+        tenants = [r.tenant for r in batch if r.tenant is not None]
+        tenant = min(tenants, key=lambda t: t.weight) if tenants else None
+
+        try:
+            self.outbound_calls += 1
+            results = await run_llm_call(
+                adapter.generate_recipe_batch,
+                [r.payload for r in batch],
+                tenant,
+                [r.seed for r in batch],
+                [r.usage for r in batch],
+            )
+        except Exception as e:
+            logger.warning(f"배치 호출 실패, {len(batch)}개 요청 개별 폴백: {e}")
+            results = [None] * len(batch)
+
+        fallbacks = []
+        for request, recipes in zip(batch, results, strict=True):
+            if recipes is None:
+                fallbacks.append(self._run_single(adapter, request))
+            elif not request.future.done():
+                request.future.set_result(recipes)
+
+        if fallbacks:
+            self.fallback_calls += len(fallbacks)
+            await asyncio.gather(*fallbacks)
+
+        logger.info(
+            f"마이크로 배치 완료: {len(batch)}개 요청, 개별 폴백 {len(fallbacks)}개 "
+            f"(누적 요청/호출={self.requests_per_call:.2f})"
+        )
+
+    async def _run_single(self, adapter: RecipeLLMAdapter, request: _PendingRequest) -> None:
+        self.outbound_calls += 1
+        try:
+            recipes = await run_llm_call(
+                adapter.generate_recipes,
+                request.payload,
+                tenant=request.tenant,
+                seed=request.seed,
+                usage=request.usage,
+            )
+        except Exception as e:
+            if not request.future.done():
+                request.future.set_exception(e)
+            return
+        if not request.future.done():
+            request.future.set_result(recipes)
+
+    @property
+    def requests_per_call(self) -> float:
+        return self.requests / self.outbound_calls if self.outbound_calls else 0.0
+
+
+_batcher: RecipeMicroBatcher | None = None
+
+
+def get_recipe_batcher() -> RecipeMicroBatcher:
+    global _batcher
+    if _batcher is None:
+        _batcher = RecipeMicroBatcher()
+    return _batcher
@@ -0,0 +1,418 @@
+"""
+메모리 맵 레시피 코퍼스 (오프라인 local provider용)
+
+수만 개 레시피를 컬럼 형태의 단일 바이너리 파일로 저장하고 `mmap`으로 읽습니다.
+파일 페이지는 OS 페이지 캐시에 올라가므로 gunicorn 워커들이 같은 메모리를 공유하고,
+로드는 헤더만 읽어 시작 비용이 거의 없습니다.
+
+파일 구조 (리틀 엔디언, 섹션은 8바이트 정렬):
+    헤더: 매직, 버전, 문자열/레시피/재료키 개수, 섹션 수
+    섹션 테이블: (offset, length) × 섹션 수
+    str_offsets/str_data: 문자열 테이블 (제목, 요약, 재료, 단계, 팁 모두 ID로 참조)
+    title, summary, time_min, servings, key_count: 레시피별 컬럼 (u32)
+    ing_offsets/ing_sids/ing_keys: 레시피별 재료 문자열 ID + 정규화 재료 키 ID
+    step_offsets/step_sids, tip_offsets/tip_sids: 레시피별 단계/팁
+    key_sids: 정렬된 재료 키 문자열 ID (이진 탐색)
+    post_offsets/post_recipes: 재료 키 → 레시피 ID 포스팅
+
+Usage:
+    python -m app.services.recipe_corpus build recipes.ndjson -o data/recipes.corpus
+    python -m app.services.recipe_corpus info data/recipes.corpus
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from app.core.config import settings
+from app.models.recommendation import Recipe, RecommendationCreate
+from app.services.exclusion_matcher import get_exclusion_matcher
+from app.services.ingredient_normalizer import ingredient_key
+from app.services.recipe_index import ScoredRecipe, coverage_score, recipe_text
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"FRCORP01"
+VERSION = 1
+HEADER = struct.Struct("<8sIIIII")  # magic, version, n_strings, n_recipes, n_keys, n_sections
+SECTION = struct.Struct("<QQ")  # offset, byte length
+NO_KEY = 0xFFFFFFFF
+MAX_U32 = 0xFFFFFFFF
+
+SECTIONS = (
+    "str_offsets",
+    "str_data",
+    "title",
+    "summary",
+    "time_min",
+    "servings",
+    "key_count",
+    "ing_offsets",
+    "ing_sids",
+    "ing_keys",
+    "step_offsets",
+    "step_sids",
+    "tip_offsets",
+    "tip_sids",
+    "key_sids",
+    "post_offsets",
+    "post_recipes",
+)
+
+DEFAULT_CORPUS_PATH = Path(__file__).parent.parent.parent / "data" / "recipes.corpus"
+
+
+class CorpusFormatError(ValueError):
+    """코퍼스 파일 형식 오류"""
+
+
+# ---------------------------------------------------------------------------
+# Builder
+# ---------------------------------------------------------------------------
+
+
+def iter_source_records(path: Path) -> Iterator[dict]:
+    """
+    JSON/NDJSON 입력에서 레시피 dict 순회
+
+    지원 형식: 레시피 배열, {"recipes": [...]}, 줄 단위 레시피 또는 추천 결과(NDJSON)
+    """
+    with open(path, encoding="utf-8") as f:
+        if path.suffix in (".ndjson", ".jsonl"):
+            items: Iterable = (json.loads(line) for line in f if line.strip())
+        else:
+            data = json.load(f)
+            items = data if isinstance(data, list) else [data]
+
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            # 추천 결과(RecommendationResponse) 형태면 안의 레시피들을 펼침
+            if isinstance(item.get("recipes"), list):
+                yield from (r for r in item["recipes"] if isinstance(r, dict))
+            else:
+                yield item
+
+
+def build_corpus(records: Iterable[dict], output: Path) -> int:
+    """
+    레시피 dict 목록으로 코퍼스 파일 생성
+
+    Returns:
+        저장된 레시피 수 (필수 필드가 없거나 중복인 레코드는 건너뜀)
+    """
+    strings: dict[str, int] = {}
+
+    def sid(text: str) -> int:
+        return strings.setdefault(text, len(strings))
+
+    columns = {name: array("I") for name in SECTIONS if name != "str_data"}
+    for name in ("ing_offsets", "step_offsets", "tip_offsets"):
+        columns[name].append(0)
+
+    recipe_keys: list[list[str]] = []
+    seen: set[tuple[str, tuple[str, ...]]] = set()
+
+    for record in records:
+        title = str(record.get("title") or "").strip()
+        ingredients = [
+            str(i).strip()
+            for i in record.get("ingredients_total") or record.get("ingredients") or []
+            if str(i).strip()
+        ]
+        steps = [str(s).strip() for s in record.get("steps") or [] if str(s).strip()]
+        if not title or not ingredients or not steps:
+            continue
+
+        try:
+            time_min = int(record.get("time_min") or 0)
+            servings = int(record.get("servings") or 1)
+        except (TypeError, ValueError):
+            continue
+        # u32 컬럼에 넣을 수 없는 값(음수, 범위 초과)은 잘못된 레코드로 보고 건너뜀
+        if not (0 <= time_min <= MAX_U32 and 0 < servings <= MAX_U32):
+            continue
+
+        # 중복 검사는 검증 뒤에 (건너뛴 레코드가 뒤의 정상 중복 레코드를 막지 않도록)
+        keys = [ingredient_key(i) for i in ingredients]
+        signature = (title, tuple(sorted(set(filter(None, keys)))))
+        if signature in seen:
+            continue
+        seen.add(signature)
+
+        columns["title"].append(sid(title))
+        columns["summary"].append(sid(str(record.get("summary") or "")))
+        columns["time_min"].append(time_min)
+        columns["servings"].append(servings)
+        columns["key_count"].append(len(signature[1]))
+
+        columns["ing_sids"].extend(sid(i) for i in ingredients)
+        columns["ing_offsets"].append(len(columns["ing_sids"]))
+        columns["step_sids"].extend(sid(s) for s in steps)
+        columns["step_offsets"].append(len(columns["step_sids"]))
+        columns["tip_sids"].extend(sid(str(t)) for t in record.get("tips") or [] if t)
+        columns["tip_offsets"].append(len(columns["tip_sids"]))
+        recipe_keys.append(keys)
+
+    # 재료 키 사전 (정렬 → 로더에서 이진 탐색)
+    vocabulary = sorted({k for keys in recipe_keys for k in keys if k})
+    key_ids = {k: i for i, k in enumerate(vocabulary)}
+    columns["key_sids"].extend(sid(k) for k in vocabulary)
+
+    postings: list[list[int]] = [[] for _ in vocabulary]
+    for recipe_id, keys in enumerate(recipe_keys):
+        columns["ing_keys"].extend(key_ids[k] if k else NO_KEY for k in keys)
+        for key_id in sorted({key_ids[k] for k in keys if k}):
+            postings[key_id].append(recipe_id)
+
+    columns["post_offsets"].append(0)
+    for recipe_ids in postings:
+        columns["post_recipes"].extend(recipe_ids)
+        columns["post_offsets"].append(len(columns["post_recipes"]))
+
+    # 문자열 테이블
+    str_data = bytearray()
+    columns["str_offsets"].append(0)
+    for text in strings:  # dict는 삽입 순서 = ID 순서
+        str_data += text.encode("utf-8")
+        columns["str_offsets"].append(len(str_data))
+
+    payloads: list[bytes] = []
+    for name in SECTIONS:
+        if name == "str_data":
+            payloads.append(bytes(str_data))
+            continue
+        column = columns[name]
+        if sys.byteorder != "little":
+            column.byteswap()
+        payloads.append(column.tobytes())
+
+    # 헤더 + 섹션 테이블 뒤에 8바이트 정렬로 섹션 배치
+    offset = HEADER.size + SECTION.size * len(SECTIONS)
+    table: list[tuple[int, int]] = []
+    for payload in payloads:
+        offset += -offset % 8
+        table.append((offset, len(payload)))
+        offset += len(payload)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_suffix(output.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(
+            HEADER.pack(
+                MAGIC, VERSION, len(strings), len(recipe_keys), len(vocabulary), len(SECTIONS)
+            )
+        )
+        for entry in table:
+            f.write(SECTION.pack(*entry))
+        for (section_offset, _), payload in zip(table, payloads, strict=True):
+            f.write(b"\0" * (section_offset - f.tell()))
+            f.write(payload)
+    # 실행 중인 워커가 매핑한 기존 파일은 그대로 두고 원자적으로 교체
+    tmp.replace(output)
+    return len(recipe_keys)
+
+
+# ---------------------------------------------------------------------------
+# Loader
+# ---------------------------------------------------------------------------
+
+
+class _KeyTable:
+    """정렬된 재료 키 시퀀스 (bisect용, 필요한 항목만 디코딩)"""
+
+    def __init__(self, corpus: RecipeCorpus):
+        self._corpus = corpus
+
+    def __len__(self) -> int:
+        return self._corpus.n_keys
+
+    def __getitem__(self, index: int) -> str:
+        return self._corpus.string(self._corpus._col["key_sids"][index])
+
+
+class RecipeCorpus:
+    """읽기 전용 mmap 코퍼스 (헤더만 읽고, 나머지는 접근 시 페이지 단위로 로드)"""
+
+    def __init__(self, path: str | Path):
+        if sys.byteorder != "little":
+            raise CorpusFormatError("빅 엔디언 플랫폼은 지원하지 않습니다")
+
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self._mmap)
+
+        if len(buf) < HEADER.size:
+            raise CorpusFormatError(f"코퍼스 파일이 너무 작습니다: {self.path}")
+        magic, version, n_strings, n_recipes, n_keys, n_sections = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION or n_sections != len(SECTIONS):
+            raise CorpusFormatError(f"지원하지 않는 코퍼스 형식: {self.path}")
+
+        self.n_strings = n_strings
+        self.n_recipes = n_recipes
+        self.n_keys = n_keys
+
+        self._col: dict[str, memoryview] = {}
+        for i, name in enumerate(SECTIONS):
+            offset, length = SECTION.unpack_from(buf, HEADER.size + i * SECTION.size)
+            if offset + length > len(buf):
+                raise CorpusFormatError(f"섹션 범위 오류 ({name}): {self.path}")
+            view = buf[offset : offset + length]
+            self._col[name] = view if name == "str_data" else view.cast("I")
+
+        self._keys = _KeyTable(self)
+
+    def __len__(self) -> int:
+        return self.n_recipes
+
+    def string(self, sid: int) -> str:
+        offsets = self._col["str_offsets"]
+        return bytes(self._col["str_data"][offsets[sid] : offsets[sid + 1]]).decode("utf-8")
+
+    def _strings(self, offsets: str, sids: str, recipe_id: int) -> list[str]:
+        start, end = self._col[offsets][recipe_id], self._col[offsets][recipe_id + 1]
+        return [self.string(s) for s in self._col[sids][start:end]]
+
+    def key_id(self, key: str) -> int | None:
+        """정규화 재료 키 → 키 ID (이진 탐색)"""
+        index = bisect_left(self._keys, key)
+        if index < self.n_keys and self._keys[index] == key:
+            return index
+        return None
+
+    def postings(self, key_id: int) -> memoryview:
+        offsets = self._col["post_offsets"]
+        return self._col["post_recipes"][offsets[key_id] : offsets[key_id + 1]]
+
+    def recipe(self, recipe_id: int, servings: int | None = None) -> Recipe:
+        """레시피 하나 디코딩"""
+        col = self._col
+        return Recipe(
+            title=self.string(col["title"][recipe_id]),
+            time_min=col["time_min"][recipe_id],
+            servings=servings or col["servings"][recipe_id],
+            summary=self.string(col["summary"][recipe_id]),
+            image_url=None,
+            ingredients_total=self._strings("ing_offsets", "ing_sids", recipe_id),
+            ingredients_have=[],
+            ingredients_need=[],
+            steps=self._strings("step_offsets", "step_sids", recipe_id),
+            tips=self._strings("tip_offsets", "tip_sids", recipe_id),
+            warnings=[],
+        )
+
+    def search(
+        self, payload: RecommendationCreate, limit: int = 3, min_score: float = 0.0
+    ) -> list[ScoredRecipe]:
+        """
+        사용자 재료 커버리지로 레시피 검색 (RecipeIndex.search와 같은 점수/필터)
+
+        점수와 시간 제한은 컬럼만으로 계산하고, 상위 후보만 디코딩해 제외 재료를 검사합니다.
+        """
+        user_keys = {k for k in map(ingredient_key, payload.ingredients) if k}
+        key_ids = [kid for kid in map(self.key_id, user_keys) if kid is not None]
+        if not key_ids:
+            return []
+
+        matched: Counter[int] = Counter()
+        for kid in key_ids:
+            matched.update(self.postings(kid))
+
+        constraints = payload.constraints
+        time_col, key_count = self._col["time_min"], self._col["key_count"]
+        candidates = []
+        for recipe_id, count in matched.items():
+            if time_col[recipe_id] > constraints.time_limit_min:
+                continue
+            score, coverage, completeness = coverage_score(
+                count, len(user_keys), key_count[recipe_id]
+            )
+            if score >= min_score:
+                candidates.append((score, completeness, coverage, recipe_id))
+        candidates.sort(reverse=True)
+
+        matcher = get_exclusion_matcher(constraints.exclude)
+        picked: list[ScoredRecipe] = []
+        seen_titles: set[str] = set()
+        for score, completeness, coverage, recipe_id in candidates:
+            title = self.string(self._col["title"][recipe_id])
+            if title in seen_titles:
+                continue
+            recipe = self.recipe(recipe_id, servings=constraints.servings)
+            if matcher.first(recipe_text(recipe)):
+                continue
+            seen_titles.add(title)
+            picked.append(ScoredRecipe(recipe, round(score, 4), coverage, completeness))
+            if len(picked) >= limit:
+                break
+        return picked
+
+
+_corpus: RecipeCorpus | None = None
+_corpus_checked = False
+
+
+def get_local_corpus() -> RecipeCorpus | None:
+    """설정된 코퍼스를 한 번만 연다 (파일이 없거나 손상되면 None)"""
+    global _corpus, _corpus_checked
+    if not _corpus_checked:
+        _corpus_checked = True
+        path = (
+            Path(settings.local_corpus_path) if settings.local_corpus_path else DEFAULT_CORPUS_PATH
+        )
+        if path.exists():
+            try:
+                _corpus = RecipeCorpus(path)
+                logger.info(f"로컬 레시피 코퍼스 로드: {len(_corpus)}개 ({path})")
+            except (OSError, CorpusFormatError) as e:
+                logger.error(f"로컬 레시피 코퍼스 로드 실패: {e}")
+        else:
+            logger.info(f"로컬 레시피 코퍼스 없음: {path}")
+    return _corpus
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="레시피 코퍼스 빌드/조회")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="JSON/NDJSON에서 코퍼스 생성")
+    build.add_argument("inputs", nargs="+", type=Path)
+    build.add_argument("-o", "--output", type=Path, default=DEFAULT_CORPUS_PATH)
+
+    info = sub.add_parser("info", help="코퍼스 정보 출력")
+    info.add_argument("path", type=Path, nargs="?", default=DEFAULT_CORPUS_PATH)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        records = (r for path in args.inputs for r in iter_source_records(path))
+        count = build_corpus(records, args.output)
+        size = args.output.stat().st_size
+        print(f"코퍼스 생성 완료: {count}개 레시피, {size / 1024:.1f}KB → {args.output}")
+    else:
+        corpus = RecipeCorpus(args.path)
+        size = args.path.stat().st_size
+        print(
+            f"{args.path}: 레시피 {len(corpus)}개, 재료 키 {corpus.n_keys}개, "
+            f"문자열 {corpus.n_strings}개, {size / 1024:.1f}KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+"""
+생성된 레시피 검색 인덱스 (retrieval-first 추천)
+
+지금까지 생성된 레시피는 모두 `RecommendationRecord.data`에 쌓여 있지만
+캐시 키가 정확히 일치하지 않으면 재사용되지 않습니다.
+이 모듈은 정규화 재료명 → 레시피 ID 역색인을 메모리에 유지하고,
+사용자 재료 커버리지로 레시피를 점수화해 LLM 호출 없이 즉시 응답합니다.
+
+- 색인: 앱 시작 시 백그라운드 전체 색인 + `created_at` 워터마크 기준 증분 동기화 (+ 생성 직후 `add_response`)
+  요청 경로의 증분 동기화는 한 번에 SYNC_BATCH_SIZE개 레코드까지만 읽음
+- LLM이 생성하지 않은 폴백 응답(더미/오프라인 레시피)은 색인하지 않음
+- 하드 필터: 제외 재료(파생 포함), `time_limit_min`
+- 점수: 사용자 재료 커버리지와 레시피 재료 충족률의 평균 (재료 ID 비트셋 AND + popcount)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, NamedTuple
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.recommendation import (
+    Recipe,
+    RecommendationCreate,
+    RecommendationRecord,
+    RecommendationResponse,
+)
+from app.services.exclusion_matcher import get_exclusion_matcher
+from app.services.ingredient_normalizer import ingredient_key
+from app.services.ingredient_registry import bit_ids, ingredient_registry
+
+if TYPE_CHECKING:
+    from app.services.preference_service import UserPreferences
+
+logger = logging.getLogger(__name__)
+
+# 증분 동기화 최소 간격 (요청마다 DB를 훑지 않도록)
+SYNC_INTERVAL_SECONDS = 30.0
+# 초기 로드 시 한 번에 읽을 레코드 수
+SYNC_BATCH_SIZE = 500
+# 취향 재정렬용 후보 풀 크기 (3개보다 많아야 재정렬 의미가 있음)
+RERANK_POOL_SIZE = 12
+
+
+class StoredRecipe(NamedTuple):
+    """DB에 저장된 추천 결과 안의 레시피 하나"""
+
+    created_at: datetime
+    recommendation_id: str
+    recipe_index: int
+    recipe: Recipe
+
+
+class Watermark:
+    """
+    증분 동기화 위치
+
+    같은 시각의 행이 워터마크 갱신 뒤에 커밋될 수 있으므로 `>=`로 다시 읽고,
+    그 시각에 이미 반영한 행 ID로 중복을 거릅니다.
+    """
+
+    def __init__(self, at: datetime | None = None, seen: set[str] | None = None):
+        self.at = at
+        self.seen: set[str] = seen or set()  # at 시각에 이미 반영한 행 ID
+
+    def __bool__(self) -> bool:
+        return self.at is not None
+
+    def is_new(self, row_id: str, at: datetime) -> bool:
+        return self.at is None or at > self.at or (at == self.at and row_id not in self.seen)
+
+    def advance(self, row_id: str, at: datetime) -> None:
+        if self.at is None or at > self.at:
+            self.at, self.seen = at, {row_id}
+        else:
+            self.seen.add(row_id)
+
+
+def iter_stored_recipes(
+    db: Session, since: Watermark | None = None, limit: int | None = None
+) -> Iterator[StoredRecipe]:
+    """
+    저장된 추천 결과에서 레시피를 생성 시각 순으로 순회
+
+    워터마크는 레코드를 끝까지 순회한 뒤에 전진시키므로, 호출자가 도중에 멈추면
+    그 레코드는 다음 동기화에서 다시 읽습니다. 폴백 응답(`generated: false`)은 건너뜁니다.
+
+    Args:
+        since: 이 워터마크 이후(같은 시각의 미반영 행 포함) 레코드만, 순회하며 전진 (None이면 전체)
+        limit: 최대 레코드 수 (None이면 전부)
+    """
+    query = db.query(
+        RecommendationRecord.id, RecommendationRecord.created_at, RecommendationRecord.data
+    )
+    if since:
+        query = query.filter(RecommendationRecord.created_at >= since.at)
+    query = query.order_by(RecommendationRecord.created_at, RecommendationRecord.id)
+    if limit is not None:
+        query = query.limit(limit + len(since.seen) if since else limit)
+
+    remaining = limit
+    for rec_id, created_at, data in query.yield_per(SYNC_BATCH_SIZE):
+        if since is not None and not since.is_new(rec_id, created_at):
+            continue
+        if remaining is not None:
+            if remaining <= 0:
+                return
+            remaining -= 1
+        data = data or {}
+        if data.get("generated") is False:
+            if since is not None:
+                since.advance(rec_id, created_at)
+            continue
+        for index, recipe_data in enumerate(data.get("recipes", [])):
+            try:
+                recipe = Recipe.model_validate(recipe_data)
+            except ValidationError:
+                continue
+            yield StoredRecipe(created_at, rec_id, index, recipe)
+        if since is not None:
+            since.advance(rec_id, created_at)
+
+
+def recipe_text(recipe: Recipe) -> str:
+    """제외 재료 검사용 소문자 텍스트 (validate_response와 같은 범위)"""
+    return " ".join(
+        [
+            recipe.title,
+            recipe.summary,
+            " ".join(recipe.ingredients_total),
+            " ".join(recipe.steps),
+        ]
+    ).lower()
+
+
+def coverage_score(matched: int, user_count: int, recipe_count: int) -> tuple[float, float, float]:
+    """
+    커버리지 점수 계산
+
+    Returns:
+        (점수, 사용자 재료 커버리지, 레시피 재료 충족률)
+    """
+    coverage = matched / user_count
+    completeness = matched / recipe_count
+    return (coverage + completeness) / 2, coverage, completeness
+
+
+@dataclass(frozen=True)
+class IndexedRecipe:
+    """색인된 레시피 + 재료 ID 비트셋"""
+
+    recipe: Recipe
+    mask: int  # ingredient_registry 재료 ID 비트셋
+    size: int  # 서로 다른 정규화 재료 수
+    text: str  # 제외 재료 검사용 소문자 텍스트 (validate_response와 같은 범위)
+
+
+@dataclass(frozen=True)
+class ScoredRecipe:
+    """검색 결과"""
+
+    recipe: Recipe
+    score: float
+    coverage: float  # 사용자 재료 중 레시피에 쓰이는 비율
+    completeness: float  # 레시피 재료 중 사용자가 가진 비율
+
+
+class RecipeIndex:
+    """정규화 재료명 → 레시피 역색인"""
+
+    def __init__(self):
+        self._entries: list[IndexedRecipe] = []
+        self._postings: dict[int, list[int]] = {}  # 재료 ID → 레시피 번호
+        # 캐시 히트 클론 등으로 같은 레시피가 여러 번 저장되므로 제목+재료로 중복 제거
+        self._signatures: set[tuple[str, int]] = set()
+        self._watermark = Watermark()
+        self._last_sync = 0.0
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, recipe: Recipe) -> bool:
+        """레시피 하나를 색인 (중복이면 False)"""
+        mask = ingredient_registry.mask(recipe.ingredients_total, register=True)
+        signature = (recipe.title.strip(), mask)
+        if not mask:
+            return False
+        ids = bit_ids(mask)
+
+        text = recipe_text(recipe)
+
+        with self._lock:
+            if signature in self._signatures:
+                return False
+            self._signatures.add(signature)
+            recipe_id = len(self._entries)
+            # 사용자별 have/need는 요청마다 다시 계산하므로 색인에는 비워서 보관
+            self._entries.append(
+                IndexedRecipe(
+                    recipe=recipe.model_copy(
+                        update={"ingredients_have": [], "ingredients_need": []}
+                    ),
+                    mask=mask,
+                    size=len(ids),
+                    text=text,
+                )
+            )
+            for ingredient_id in ids:
+                self._postings.setdefault(ingredient_id, []).append(recipe_id)
+        return True
+
+    def add_response(self, response: RecommendationResponse) -> None:
+        """방금 생성된 추천 결과를 즉시 색인 (다음 동기화를 기다리지 않음)"""
+        for recipe in response.recipes:
+            self.add(recipe)
+
+    def sync(self, db: Session, force: bool = False, limit: int | None = None) -> int:
+        """
+        워터마크 이후 저장된 추천 결과를 증분 색인
+
+        Args:
+            limit: 이번에 읽을 최대 레코드 수 (요청 경로용, 남은 레코드는 다음 동기화에서)
+
+        Returns:
+            새로 색인된 레시피 수
+        """
+        now = time.monotonic()
+        if not force and now - self._last_sync < SYNC_INTERVAL_SECONDS:
+            return 0
+        # 초기 색인이 진행 중이면 요청 경로는 기다리지 않고 기존 색인으로 검색
+        if not self._sync_lock.acquire(blocking=False):
+            return 0
+        try:
+            self._last_sync = now
+            added = 0
+            for stored in iter_stored_recipes(db, since=self._watermark, limit=limit):
+                if self.add(stored.recipe):
+                    added += 1
+        finally:
+            self._sync_lock.release()
+
+        if added:
+            logger.info(f"레시피 인덱스 동기화: +{added}개 (총 {len(self)}개)")
+        return added
+
+    def warm_up(self) -> None:
+        """앱 시작 시 전체 색인 (백그라운드 스레드에서 호출)"""
+        db = SessionLocal()
+        try:
+            start = time.monotonic()
+            added = self.sync(db, force=True)
+            logger.info(f"레시피 인덱스 초기화: {added}개, {time.monotonic() - start:.1f}초")
+        except Exception as e:
+            logger.warning(f"레시피 인덱스 초기화 실패: {e}")
+        finally:
+            db.close()
+
+    def search(
+        self, payload: RecommendationCreate, limit: int = 3, min_score: float = 0.0
+    ) -> list[ScoredRecipe]:
+        """
+        사용자 재료 커버리지로 레시피 검색
+
+        Args:
+            payload: 사용자 입력 (재료 + 제약조건)
+            limit: 최대 결과 수
+            min_score: 이 점수 미만은 제외
+
+        Returns:
+            점수 내림차순 결과 (제목 중복 없음)
+        """
+        user_mask = ingredient_registry.mask(payload.ingredients)
+        if not user_mask:
+            return []
+        # 등록되지 않은 사용자 재료도 커버리지 분모에 포함 (어떤 레시피에도 없는 재료)
+        user_count = len({key for key in map(ingredient_key, payload.ingredients) if key})
+
+        with self._lock:
+            # 역색인 포스팅 합집합 = 재료가 하나라도 겹치는 후보 레시피
+            candidates: set[int] = set()
+            for ingredient_id in bit_ids(user_mask):
+                candidates.update(self._postings.get(ingredient_id, ()))
+            entries = self._entries
+
+        constraints = payload.constraints
+        matcher = get_exclusion_matcher(constraints.exclude)
+
+        results: list[ScoredRecipe] = []
+        for recipe_id in candidates:
+            entry = entries[recipe_id]
+            # 하드 필터: 시간 제한, 제외 재료
+            if entry.recipe.time_min > constraints.time_limit_min:
+                continue
+            if matcher.first(entry.text):
+                continue
+
+            matched = (user_mask & entry.mask).bit_count()
+            score, coverage, completeness = coverage_score(matched, user_count, entry.size)
+            if score >= min_score:
+                results.append(ScoredRecipe(entry.recipe, round(score, 4), coverage, completeness))
+
+        results.sort(key=lambda r: (r.score, r.completeness), reverse=True)
+
+        picked: list[ScoredRecipe] = []
+        seen_titles: set[str] = set()
+        for result in results:
+            title = result.recipe.title.strip()
+            if title in seen_titles:
+                continue
+            seen_titles.add(title)
+            picked.append(result)
+            if len(picked) >= limit:
+                break
+        return picked
+
+    def retrieve(
+        self,
+        payload: RecommendationCreate,
+        db: Session,
+        preferences: UserPreferences | None = None,
+    ) -> list[Recipe] | None:
+        """
+        조건을 만족하는 레시피 3개를 찾으면 반환, 부족하면 None (LLM 생성으로 전환)
+
+        Args:
+            preferences: 로그인 사용자 취향 (있으면 더 큰 후보 풀을 취향으로 재정렬)
+        """
+        try:
+            self.sync(db, limit=SYNC_BATCH_SIZE)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"레시피 인덱스 동기화 실패 (기존 색인으로 검색): {e}")
+
+        start = time.monotonic()
+        pool_size = RERANK_POOL_SIZE if preferences else 3
+        results = self.search(payload, limit=pool_size, min_score=settings.retrieval_min_score)
+        if preferences:
+            results = preferences.rerank(results)
+        elapsed_ms = (time.monotonic() - start) * 1000
+
+        if len(results) < 3:
+            logger.info(
+                f"검색 결과 부족 ({len(results)}/3, 색인 {len(self)}개, {elapsed_ms:.1f}ms)"
+            )
+            return None
+
+        logger.info(
+            f"검색으로 레시피 반환: scores={[r.score for r in results]} "
+            f"(색인 {len(self)}개, {elapsed_ms:.1f}ms)"
+        )
+        return [r.recipe for r in results]
+
+    def get_stats(self) -> dict:
+        """색인 통계 (모니터링용)"""
+        with self._lock:
+            return {
+                "recipes": len(self._entries),
+                "ingredients": len(self._postings),
+                "watermark": self._watermark.at.isoformat() if self._watermark else None,
+            }
+
+
+recipe_index = RecipeIndex()
@@ -0,0 +1,205 @@
+"""
+레시피 의미 검색 - 문자 n-gram 해싱 벡터 (NumPy)
+
+한국어 형태소 분석기 없이도 동작하도록 제목/요약/재료 텍스트의 문자 1~3-gram을
+고정 차원으로 해싱(feature hashing)해 벡터화합니다.
+
+- 벡터: crc32(n-gram) → 2^20차원 인덱스 + 부호, L2 정규화 (내적 = 코사인 유사도)
+  레시피당 0이 아닌 차원은 수백 개뿐이므로 희소 벡터(차원 → 값)로 다룸
+- 저장: 차원별 역색인 (레시피 행 번호 uint32 + 값 float32 배열)
+- 검색: 쿼리 n-gram 차원의 역색인만 읽어 `bincount`로 점수 합산 + `argpartition` top-k,
+  MIN_SCORE 미만(짧은 공통 n-gram 하나만 겹치는 결과)은 제외
+- 갱신: `created_at` 워터마크 증분 동기화 + 추천 저장 직후 `add_response`
+
+차원이 충분히 커서 해시 충돌이 드물고, 검색 비용은 전체 레시피 수가 아니라
+쿼리 n-gram을 포함한 레시피 수에 비례합니다. 10만 레시피 기준 역색인 약 100MB.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import unicodedata
+import zlib
+from array import array
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.recommendation import Recipe, RecommendationResponse
+from app.services.recipe_index import SYNC_INTERVAL_SECONDS, Watermark, iter_stored_recipes
+
+logger = logging.getLogger(__name__)
+
+DIM = 1 << 20
+NGRAM_SIZES = (2, 3)  # + 공백 제외 1-gram (한 글자 재료명: 밥, 무, 파)
+TITLE_WEIGHT = 2.0
+MIN_SCORE = 0.1  # 코사인 유사도 하한
+
+
+def _ngrams(text: str) -> list[str]:
+    """공백을 단어 경계로 남긴 문자 n-gram"""
+    text = " ".join(unicodedata.normalize("NFC", text).lower().split())
+    if not text:
+        return []
+    padded = f" {text} "
+    grams = [c for c in text if not c.isspace()]
+    for n in NGRAM_SIZES:
+        grams.extend(padded[i : i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+def _accumulate(vector: dict[int, float], text: str, weight: float) -> None:
+    for gram in _ngrams(text):
+        h = zlib.crc32(gram.encode("utf-8"))
+        # 최상위 비트로 부호를 정해 해시 충돌이 한쪽으로 쌓이지 않게 함
+        dim = h % DIM
+        vector[dim] = vector.get(dim, 0.0) + (-weight if h & 0x80000000 else weight)
+
+
+def vectorize(title: str, body: str = "") -> dict[int, float]:
+    """텍스트 → L2 정규화된 희소 해싱 벡터 (차원 → 값, 제목 가중치 2배)"""
+    vector: dict[int, float] = {}
+    _accumulate(vector, title, TITLE_WEIGHT)
+    if body:
+        _accumulate(vector, body, 1.0)
+    norm = sum(v * v for v in vector.values()) ** 0.5
+    if norm == 0:
+        return {}
+    return {dim: v / norm for dim, v in vector.items() if v != 0}
+
+
+@dataclass(frozen=True)
+class SearchEntry:
+    """검색 결과로 돌려줄 레시피 위치 + 본문"""
+
+    recommendation_id: str
+    recipe_index: int
+    recipe: Recipe
+
+
+class RecipeSearchIndex:
+    """n-gram 해싱 희소 벡터 역색인 기반 레시피 검색 인덱스"""
+
+    def __init__(self):
+        # 차원 → (레시피 행 번호, 값) - array는 추가가 O(1)이고 원소당 4바이트
+        self._postings: dict[int, tuple[array, array]] = {}
+        self._size = 0
+        self._entries: list[SearchEntry] = []
+        self._signatures: set[tuple[str, tuple[str, ...]]] = set()
+        self._watermark = Watermark()
+        self._last_sync = 0.0
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, recommendation_id: str, recipe_index: int, recipe: Recipe) -> bool:
+        """레시피 하나를 색인 (제목+재료가 같은 중복은 False)"""
+        signature = (recipe.title.strip(), tuple(sorted(recipe.ingredients_total)))
+        body = " ".join([recipe.summary, " ".join(recipe.ingredients_total)])
+        vector = vectorize(recipe.title, body)
+
+        with self._lock:
+            if signature in self._signatures:
+                return False
+            self._signatures.add(signature)
+
+            for dim, value in vector.items():
+                posting = self._postings.get(dim)
+                if posting is None:
+                    posting = self._postings[dim] = (array("I"), array("f"))
+                posting[0].append(self._size)
+                posting[1].append(value)
+            self._entries.append(SearchEntry(recommendation_id, recipe_index, recipe))
+            self._size += 1
+        return True
+
+    def add_response(self, response: RecommendationResponse) -> None:
+        """방금 저장된 추천 결과를 즉시 색인"""
+        for index, recipe in enumerate(response.recipes):
+            self.add(response.id, index, recipe)
+
+    def sync(self, db: Session, force: bool = False, limit: int | None = None) -> int:
+        """
+        워터마크 이후 저장된 추천 결과를 증분 색인
+
+        Args:
+            limit: 이번에 읽을 최대 레코드 수 (요청 경로용, 남은 레코드는 다음 동기화에서)
+
+        Returns:
+            새로 색인된 레시피 수
+        """
+        now = time.monotonic()
+        if not force and now - self._last_sync < SYNC_INTERVAL_SECONDS:
+            return 0
+        # 동시에 여러 요청이 같은 구간을 다시 읽지 않도록 한 번에 하나만 동기화
+        if not self._sync_lock.acquire(blocking=False):
+            return 0
+        try:
+            self._last_sync = now
+            added = 0
+            for stored in iter_stored_recipes(db, since=self._watermark, limit=limit):
+                if self.add(stored.recommendation_id, stored.recipe_index, stored.recipe):
+                    added += 1
+        finally:
+            self._sync_lock.release()
+
+        if added:
+            logger.info(f"레시피 검색 인덱스 동기화: +{added}개 (총 {len(self)}개)")
+        return added
+
+    def warm_up(self) -> None:
+        """앱 시작 시 전체 색인 (백그라운드 스레드에서 호출)"""
+        db = SessionLocal()
+        try:
+            start = time.monotonic()
+            added = self.sync(db, force=True)
+            logger.info(f"레시피 검색 인덱스 초기화: {added}개, {time.monotonic() - start:.1f}초")
+        except Exception as e:
+            logger.warning(f"레시피 검색 인덱스 초기화 실패: {e}")
+        finally:
+            db.close()
+
+    def search_many(
+        self, queries: list[str], limit: int = 10, min_score: float = MIN_SCORE
+    ) -> list[list[tuple[SearchEntry, float]]]:
+        """
+        여러 쿼리 검색
+
+        Returns:
+            쿼리별 (레시피, 코사인 유사도) 목록 (유사도 내림차순, min_score 미만 제외)
+        """
+        return [self.search(query, limit=limit, min_score=min_score) for query in queries]
+
+    def search(
+        self, query: str, limit: int = 10, min_score: float = MIN_SCORE
+    ) -> list[tuple[SearchEntry, float]]:
+        """단일 쿼리 검색 (쿼리 n-gram 차원의 역색인만 읽음)"""
+        vector = vectorize(query)
+        rows: list[np.ndarray] = []
+        weights: list[np.ndarray] = []
+        with self._lock:
+            size, entries = self._size, self._entries
+            # 추가 중인 array가 재할당될 수 있으므로 락 안에서 복사
+            for dim, value in vector.items():
+                posting = self._postings.get(dim)
+                if posting is not None:
+                    rows.append(np.array(posting[0], dtype=np.intp))
+                    weights.append(np.array(posting[1], dtype=np.float32) * value)
+        if not rows:
+            return []
+
+        scores = np.bincount(np.concatenate(rows), weights=np.concatenate(weights), minlength=size)
+        candidates = np.flatnonzero(scores >= max(min_score, 1e-6))
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(entries[i], float(scores[i])) for i in order]
+
+
+recipe_search_index = RecipeSearchIndex()
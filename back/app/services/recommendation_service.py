@@ -4,10 +4,9 @@ import asyncio
 import hashlib
 import json
 import logging
-import re
 import time
 from datetime import UTC, datetime, timedelta
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
 
@@ -22,7 +21,22 @@ from app.models.recommendation import (
 )
 from app.services.coupang_service import CoupangLinkService
 from app.services.image_search_service import ImageSearchService
-from app.services.llm_adapter import MockRecipeLLMAdapter, RecipeLLMAdapter
+from app.services.ingredient_normalizer import ingredient_key
+from app.services.ingredient_registry import ingredient_registry
+from app.services.llm_adapter import (
+    LocalRecipeAdapter,
+    MockRecipeLLMAdapter,
+    RecipeLLMAdapter,
+    offline_recipes,
+)
+from app.services.llm_scheduler import LLMTenant, run_llm_call
+from app.services.nutrition_estimator import estimate_nutrition
+from app.services.preference_service import PreferenceService, UserPreferences
+from app.services.recipe_batcher import get_recipe_batcher
+from app.services.recipe_index import recipe_index
+from app.services.recipe_search import recipe_search_index
+from app.services.trending import trending_service
+from app.services.usage_ledger import UsageLedgerService, UsageMeter
 from app.services.validation import validate_response
 from app.services.youtube_adapter import YouTubeRecipeAdapter
 
@@ -32,12 +46,12 @@ CACHE_EXPIRY_DAYS = 7
 
 
 def build_cache_key(payload: RecommendationCreate) -> str:
-    """재료 + 제약조건으로 캐시 키 생성 (SHA256)"""
+    """재료 + 제약조건으로 캐시 키 생성 (SHA256, 재료는 정규화 키 기준 → "달걀 2개" == "계란")"""
     parts = {
-        "ingredients": sorted(i.strip().lower() for i in payload.ingredients),
+        "ingredients": sorted({k for k in map(ingredient_key, payload.ingredients) if k}),
         "time_limit": payload.constraints.time_limit_min,
         "servings": payload.constraints.servings,
-        "exclude": sorted(e.strip().lower() for e in payload.constraints.exclude),
+        "exclude": sorted({k for k in map(ingredient_key, payload.constraints.exclude) if k}),
     }
     raw = json.dumps(parts, sort_keys=True, ensure_ascii=False)
     return hashlib.sha256(raw.encode()).hexdigest()
@@ -75,63 +89,6 @@ def save_cache(cache_key: str, response: RecommendationResponse, db: Session) ->
     logger.info(f"캐시 저장: key={cache_key[:12]}...")
 
 
-def normalize_ingredient(ingredient: str) -> str:
-    """
-    재료명에서 분량, 수량, 수식어를 제거하여 정규화
-
-    예시:
-        "신선한 계란 1개" -> "계란"
-        "계란 2개" -> "계란"
-        "김치 100g" -> "김치"
-        "다진 마늘 1큰술" -> "마늘"
-    """
-    if not ingredient:
-        return ""
-
-    text = ingredient.strip()
-
-    # 1. 분량/수량 패턴 제거 (숫자 + 단위)
-    # 예: "1개", "2큰술", "100g", "1/2컵" 등
-    text = re.sub(
-        r"\d+(/\d+)?\s*(개|g|kg|ml|L|큰술|작은술|컵|줌|꼬집|조각|장|쪽|알|마리|근|톨|봉지|팩|통|캔)?",
-        "",
-        text,
-    )
-
-    # 2. 흔한 수식어 제거
-    modifiers = [
-        "신선한",
-        "싱싱한",
-        "잘 익은",
-        "익은",
-        "다진",
-        "썬",
-        "채썬",
-        "굵게 썬",
-        "얇게 썬",
-        "작게 썬",
-        "큼직하게 썬",
-        "곱게 간",
-        "갈아놓은",
-        "삶은",
-        "데친",
-        "냉동",
-        "해동한",
-        "적당량",
-        "약간",
-        "조금",
-        "충분한",
-        "넉넉한",
-    ]
-    for mod in modifiers:
-        text = text.replace(mod, "")
-
-    # 3. 앞뒤 공백 제거 및 중간 공백 정리
-    text = " ".join(text.split()).strip()
-
-    return text
-
-
 def deduplicate_shopping_list(ingredients: set[str]) -> list[str]:
     """
     장보기 리스트에서 중복 재료 제거 (정규화 후 비교)
@@ -142,20 +99,13 @@ def deduplicate_shopping_list(ingredients: set[str]) -> list[str]:
     Returns:
         중복 제거된 재료 리스트 (정렬됨)
     """
-    # 정규화된 재료명 -> 원본 재료명 매핑 (첫 번째 것 유지)
-    normalized_map: dict[str, str] = {}
-
-    for ing in ingredients:
-        normalized = normalize_ingredient(ing)
-        if normalized and normalized not in normalized_map:
-            # 정규화된 이름을 저장 (분량 없는 깔끔한 이름)
-            normalized_map[normalized] = normalized
-
-    return sorted(normalized_map.values())
+    # 재료 ID 비트셋으로 합치면 같은 정규화 재료는 한 비트 (분량 없는 대표 이름으로 복원)
+    mask = ingredient_registry.mask(list(ingredients), register=True)
+    return sorted(ingredient_registry.names(mask))
 
 
 def split_have_need(
-    user_ingredients: list[str], recipe_ingredients: list[str]
+    user_ingredients: list[str], recipe_ingredients: list[str], user_mask: int | None = None
 ) -> tuple[list[str], list[str]]:
     """
     사용자 재료와 레시피 재료를 비교하여 보유/필요 재료 분리
@@ -163,36 +113,147 @@ def split_have_need(
     Args:
         user_ingredients: 사용자가 보유한 재료 목록
         recipe_ingredients: 레시피에 필요한 재료 목록
+        user_mask: 사용자 재료 비트셋 (여러 레시피를 처리할 때 한 번만 계산해 전달)
 
     Returns:
-        (보유 재료, 필요 재료) 튜플
+        (보유 재료, 필요 재료) 튜플 - 레시피 원본 표기, 같은 재료는 첫 번째 표기만
+    """
+    # 정규화 재료 ID 비트셋으로 비교 ("다진 마늘 1큰술", "달걀" → "마늘", "계란")
+    # 레시피 재료를 먼저 등록해야 조회 전용인 사용자 비트셋에 같은 재료가 잡힘
+    recipe_ids = [ingredient_registry.id_of(ingredient) for ingredient in recipe_ingredients]
+    if user_mask is None:
+        user_mask = ingredient_registry.mask(user_ingredients)
+
+    have: list[str] = []
+    need: list[str] = []
+    seen = 0
+    for ingredient, ingredient_id in zip(recipe_ingredients, recipe_ids, strict=True):
+        if ingredient_id is None:
+            # 레지스트리가 가득 차 ID가 없는 재료는 중복 제거 없이 필요 재료로
+            if ingredient_key(ingredient):
+                need.append(ingredient.strip())
+            continue
+        bit = 1 << ingredient_id
+        if seen & bit:
+            continue
+        seen |= bit
+        (have if user_mask & bit else need).append(ingredient.strip())
+
+    return sorted(have), sorted(need)
+
+
+async def _existing_image(url: str) -> str:
+    return url
+
+
+async def finalize_recipes(
+    recipes_raw: list[Recipe],
+    user_ingredients: list[str],
+    usage: UsageMeter | None = None,
+    cache_only: bool = False,
+    timeout: float = 28,
+) -> list[Recipe]:
     """
-    # 정규화: 공백 제거 + 소문자 변환
-    user_set = {i.strip().lower() for i in user_ingredients if i and i.strip()}
-    recipe_set = {i.strip().lower() for i in recipe_ingredients if i and i.strip()}
+    레시피 목록 전체의 이미지를 한 번에 병렬 검색하고 보유/필요 재료를 분리
 
-    # 원본 대소문자 유지를 위해 매핑 생성
-    recipe_map = {i.strip().lower(): i.strip() for i in recipe_ingredients if i and i.strip()}
+    Args:
+        recipes_raw: 생성/검색된 레시피 (have/need 비어 있음)
+        user_ingredients: 사용자 보유 재료
+        usage: 요청 사용량 수집기 (이미지 공급자 호출 기록)
+        cache_only: True면 캐시된 이미지만 사용 (일일 예산 초과 시)
+        timeout: 이미지 단계 전체 타임아웃 (초)
+    """
+    image_service = ImageSearchService()
 
-    # 보유 재료: 사용자가 가진 것 중 레시피에 필요한 것
-    have_keys = user_set & recipe_set
-    have = sorted([recipe_map[k] for k in have_keys])
+    logger.info(f"이미지 검색 시작: {len(recipes_raw)}개 레시피 (타임아웃: {timeout:.1f}초)")
+    # 검색으로 재사용한 레시피는 기존 이미지 URL을 그대로 사용
+    image_tasks = [
+        _existing_image(recipe.image_url)
+        if recipe.image_url
+        else image_service.get_image(recipe.title, usage=usage, cache_only=cache_only)
+        for recipe in recipes_raw
+    ]
+    try:
+        image_results = await asyncio.wait_for(
+            asyncio.gather(*image_tasks, return_exceptions=True),
+            timeout=timeout,
+        )
+    except TimeoutError:
+        logger.warning(f"이미지 생성 타임아웃 ({timeout:.1f}초 초과), 이미지 없이 진행")
+        image_results = [None] * len(recipes_raw)
 
-    # 필요 재료: 레시피에 필요한 것 중 사용자가 없는 것
-    need_keys = recipe_set - user_set
-    need = sorted([recipe_map[k] for k in need_keys])
+    # 영양 성분은 전체 레시피를 한 번의 행렬 곱으로 추정 (LLM 호출 없음)
+    nutrition = estimate_nutrition(recipes_raw)
 
-    return have, need
+    # 사용자 비트셋은 조회 전용이므로 이번 레시피 재료를 먼저 등록
+    for recipe in recipes_raw:
+        ingredient_registry.mask(recipe.ingredients_total, register=True)
+    user_mask = ingredient_registry.mask(user_ingredients)
+    final_recipes = []
+    for recipe, img_result, recipe_nutrition in zip(
+        recipes_raw, image_results, nutrition, strict=False
+    ):
+        have, need = split_have_need(user_ingredients, recipe.ingredients_total, user_mask)
+
+        # 이미지 검색 실패 처리
+        if isinstance(img_result, Exception):
+            logger.error(f"이미지 검색 실패 ({recipe.title}): {img_result}")
+            img_url = None
+        else:
+            img_url = img_result
+
+        # Recipe 객체 재생성 (have/need 필드 + 이미지 URL 업데이트)
+        final_recipe = Recipe(
+            title=recipe.title,
+            time_min=recipe.time_min,
+            servings=recipe.servings,
+            summary=recipe.summary,
+            image_url=img_url,  # Google/Unsplash/Mock 이미지
+            ingredients_total=recipe.ingredients_total,
+            ingredients_have=have,
+            ingredients_need=need,
+            steps=recipe.steps,
+            tips=recipe.tips or [],
+            warnings=recipe.warnings or [],
+            nutrition=recipe_nutrition,
+        )
+        final_recipes.append(final_recipe)
+
+    logger.info(f"이미지 검색 완료: {sum(1 for r in final_recipes if r.image_url)}개 성공")
+    return final_recipes
+
+
+def build_shopping_list(recipes: list[Recipe]) -> list[ShoppingItem]:
+    """모든 레시피의 필요 재료를 정규화/중복 제거한 장보기 리스트 (쿠팡 링크 포함)"""
+    all_need: set[str] = set()
+    for r in recipes:
+        all_need |= {x for x in r.ingredients_need if x}
+    return shopping_items(all_need)
+
+
+def shopping_items(need: set[str]) -> list[ShoppingItem]:
+    """필요 재료 집합 → 장보기 아이템 (정규화 재료당 쿠팡 링크 1개)"""
+    # 정규화하여 중복 제거 (예: "계란 1개", "계란 2개" → "계란")
+    deduplicated = deduplicate_shopping_list(need)
+
+    # 쿠팡 파트너스 링크 생성
+    coupang = CoupangLinkService()
+    return [ShoppingItem(item=i, purchase_url=coupang.generate_search_url(i)) for i in deduplicated]
 
 
 async def create_recommendation(
-    payload: RecommendationCreate, db: Session
+    payload: RecommendationCreate,
+    db: Session,
+    tenant: LLMTenant | None = None,
+    user_id: UUID | None = None,
 ) -> RecommendationResponse:
     """
     사용자 재료로 레시피 추천 생성 (LLM 통합 + 이미지 검색)
 
     Args:
         payload: 사용자 입력 (재료, 제약사항)
+        tenant: 요청 주체 (로그인 사용자/게스트 IP) - LLM 호출 공정 스케줄링용
+        user_id: 로그인 사용자 ID - 검색/로컬 후보를 즐겨찾기 취향으로 재정렬
 
     Returns:
         RecommendationResponse: 3개 레시피 + 장보기 리스트
@@ -215,97 +276,179 @@ async def create_recommendation(
         )
         db.add(record)
         db.commit()
-        elapsed = time.monotonic() - start_time
-        logger.info(
-            f"💰 Cost: LLM=$0.000, Image=$0.000, Total=$0.000 "
-            f"(cache hit, {elapsed:.1f}s)"
+        trending_service.record_recommendation(
+            payload.ingredients, [r.title for r in cloned.recipes]
         )
+        elapsed = time.monotonic() - start_time
+        logger.info(f"💰 Cost: LLM=$0.000, Image=$0.000, Total=$0.000 (cache hit, {elapsed:.1f}s)")
         logger.info(f"캐시에서 레시피 반환: ID={new_id} (캐시키={cache_key[:12]}...)")
         return cloned
 
-    # 1. 레시피 생성 어댑터 선택 (youtube → anthropic → mock)
+    # 1. 레시피 생성 어댑터 선택 (retrieval → local → youtube → anthropic → mock)
     provider = settings.recipe_provider
     logger.info(f"레시피 Provider: {provider}")
 
-    if provider == "mock":
+    # 실제 토큰/이미지 호출 사용량 수집 → 원장 저장 (실패한 요청도 이미 쓴 비용은 저장)
+    usage = UsageMeter()
+    ledger = UsageLedgerService(db)
+    # 일일 예산 초과 시 저비용 모드: 기존 레시피 검색 → 로컬 코퍼스 → Haiku 생성 + 캐시된 이미지만 사용
+    budget_exceeded = ledger.is_over_daily_budget()
+    rec_id: str | None = None
+    try:
+        response = await _generate_recommendation(
+            payload, db, provider, cache_key, usage, budget_exceeded, tenant, user_id, start_time
+        )
+        rec_id = response.id
+    except Exception:
+        db.rollback()  # 실패한 트랜잭션 정리 후 사용량만 저장
+        raise
+    finally:
+        # 9. 사용량 원장 저장 + 실제 비용 로깅 (응답 usage 토큰, 재시도, 이미지 호출 기준)
+        ledger.save_quietly(usage, recommendation_id=rec_id)
+        img_cost = usage.cost("image")
+        llm_cost = usage.cost() - img_cost
+        elapsed = time.monotonic() - start_time
+        logger.info(
+            f"💰 Cost: LLM=${llm_cost:.4f}, Image=${img_cost:.4f}, "
+            f"Total=${llm_cost + img_cost:.4f} "
+            f"(provider={provider}, {usage.summary()}, budget_mode={budget_exceeded}, "
+            f"{'ok' if rec_id else 'failed'}, {elapsed:.1f}s)"
+        )
+
+    logger.info(f"레시피 생성 완료: ID={rec_id}")
+    return response
+
+
+async def _budget_recipes(
+    payload: RecommendationCreate,
+    tenant: LLMTenant | None,
+    cache_key: str,
+    usage: UsageMeter,
+    preferences: UserPreferences | None,
+) -> tuple[list[Recipe], bool]:
+    """
+    일일 예산 초과 시 레시피 (기존 레시피 검색 실패 후): 로컬 코퍼스 → Haiku 생성 → 더미
+
+    Returns:
+        (레시피, LLM이 새로 생성했는지 여부)
+    """
+    try:
+        return LocalRecipeAdapter().generate_recipes(payload, preferences=preferences), False
+    except Exception as e:
+        logger.info(f"예산 초과 모드 로컬 코퍼스 사용 불가, Haiku 생성: {e}")
+    try:
+        recipes = await run_llm_call(
+            RecipeLLMAdapter().generate_recipes,
+            payload,
+            tenant=tenant,
+            seed=cache_key,
+            usage=usage,
+            model=settings.haiku_model,
+        )
+        return recipes, True
+    except Exception as e:
+        logger.error(f"예산 초과 모드 Haiku 생성 실패, 더미 레시피 반환: {e}")
+        return MockRecipeLLMAdapter().generate_recipes(payload), False
+
+
+async def _generate_recommendation(
+    payload: RecommendationCreate,
+    db: Session,
+    provider: str,
+    cache_key: str,
+    usage: UsageMeter,
+    budget_exceeded: bool,
+    tenant: LLMTenant | None,
+    user_id: UUID | None,
+    start_time: float,
+) -> RecommendationResponse:
+    """레시피 생성 → 이미지/장보기 → 검증 → 저장 (사용량은 호출자가 원장에 저장)"""
+    # Anthropic SDK는 동기 호출이고 스케줄러 대기도 블로킹이므로 스레드에서 실행
+    # 캐시 키를 스타일 힌트 시드로 사용 → 동일 요청은 동일 프롬프트 (공급자 캐시 적중)
+    # retrieval: 기존 생성 레시피 중 3개가 조건을 만족하면 즉시 반환, 부족하면 LLM 생성
+    # 예산 초과: 모든 공급자에서 기존 레시피 검색 → 로컬 코퍼스 → Haiku 생성 (더미는 마지막 수단, local은 네트워크 없이 코퍼스만)
+    # 로그인 사용자는 즐겨찾기 취향 프로필로 후보 재정렬 (PK 조회 1회, LLM 호출 없음)
+    offline = budget_exceeded and provider != "mock"
+    preferences = None
+    if user_id and (offline or provider in ("retrieval", "local", "youtube")):
+        try:
+            preferences = PreferenceService(db).get_preferences(user_id)
+        except Exception as e:
+            logger.warning(f"취향 프로필 조회 실패 (무시): {e}")
+
+    retrieved = (
+        recipe_index.retrieve(payload, db, preferences=preferences)
+        if provider == "retrieval" or offline
+        else None
+    )
+    # LLM이 새로 생성한 레시피만 색인/캐시 (검색 재사용·더미·오프라인 폴백 제외)
+    generated = False
+    if retrieved is not None:
+        recipes_raw = retrieved
+    elif provider == "mock":
         recipes_raw = MockRecipeLLMAdapter().generate_recipes(payload)
+    elif provider == "local":
+        # 로컬 코퍼스 검색 (코퍼스가 없거나 결과가 3개 미만이면 더미 레시피)
+        recipes_raw = offline_recipes(payload, preferences=preferences)
+    elif offline:
+        recipes_raw, generated = await _budget_recipes(
+            payload, tenant, cache_key, usage, preferences
+        )
     elif provider == "youtube":
         try:
-            recipes_raw = await YouTubeRecipeAdapter().generate_recipes(payload)
+            recipes_raw = await YouTubeRecipeAdapter().generate_recipes(
+                payload, tenant=tenant, usage=usage, db=db
+            )
+            generated = True
         except Exception as e:
             logger.warning(f"YouTube+Haiku 실패, Sonnet 폴백: {e}")
             try:
-                recipes_raw = RecipeLLMAdapter().generate_recipes(payload)
+                recipes_raw = await run_llm_call(
+                    RecipeLLMAdapter().generate_recipes,
+                    payload,
+                    tenant=tenant,
+                    seed=cache_key,
+                    usage=usage,
+                )
+                generated = True
             except Exception as e2:
-                logger.error(f"Sonnet 폴백도 실패, 더미 레시피 반환: {e2}")
-                recipes_raw = MockRecipeLLMAdapter().generate_recipes(payload)
+                logger.error(f"Sonnet 폴백도 실패, 오프라인 레시피 반환: {e2}")
+                recipes_raw = offline_recipes(payload, preferences=preferences)
     else:
-        # anthropic (기존 동작)
-        recipes_raw = RecipeLLMAdapter().generate_recipes(payload)
+        # anthropic (마이크로 배칭이 켜져 있으면 동시에 들어온 요청과 한 번의 호출로 묶음)
+        # 어댑터는 재시도까지 실패하면 예외를 던지므로 폴백 레시피는 여기서 고르고 생성 아님으로 표시
+        try:
+            if settings.llm_batch_enabled:
+                recipes_raw = await get_recipe_batcher().submit(
+                    payload, tenant=tenant, seed=cache_key, usage=usage
+                )
+            else:
+                recipes_raw = await run_llm_call(
+                    RecipeLLMAdapter().generate_recipes,
+                    payload,
+                    tenant=tenant,
+                    seed=cache_key,
+                    usage=usage,
+                )
+            generated = True
+        except Exception as e:
+            logger.error(f"LLM 생성 실패, 오프라인 레시피 반환: {e}")
+            recipes_raw = offline_recipes(payload, preferences=preferences)
 
     llm_elapsed = time.monotonic() - start_time
     logger.info(f"레시피 생성 완료: {llm_elapsed:.1f}초 (provider={provider})")
 
-    # 3. 이미지 검색 서비스 초기화
-    image_service = ImageSearchService()
-
-    # 4. 이미지 병렬 검색 (API Gateway 30초 제한 대비 동적 타임아웃)
-    image_timeout = max(28 - llm_elapsed, 5)
-    logger.info(f"이미지 검색 시작: {len(recipes_raw)}개 레시피 (타임아웃: {image_timeout:.1f}초)")
-    image_tasks = [image_service.get_image(recipe.title) for recipe in recipes_raw]
-    try:
-        image_results = await asyncio.wait_for(
-            asyncio.gather(*image_tasks, return_exceptions=True),
-            timeout=image_timeout,
-        )
-    except asyncio.TimeoutError:
-        logger.warning(f"이미지 생성 타임아웃 ({image_timeout:.1f}초 초과), 이미지 없이 진행")
-        image_results = [None] * len(recipes_raw)
-
-    # 5. ingredients_have, ingredients_need 분리 + 이미지 URL 추가
-    final_recipes = []
-    for recipe, img_result in zip(recipes_raw, image_results, strict=False):
-        have, need = split_have_need(payload.ingredients, recipe.ingredients_total)
-
-        # 이미지 검색 실패 처리
-        if isinstance(img_result, Exception):
-            logger.error(f"이미지 검색 실패 ({recipe.title}): {img_result}")
-            img_url = None
-        else:
-            img_url = img_result
-
-        # Recipe 객체 재생성 (have/need 필드 + 이미지 URL 업데이트)
-        final_recipe = Recipe(
-            title=recipe.title,
-            time_min=recipe.time_min,
-            servings=recipe.servings,
-            summary=recipe.summary,
-            image_url=img_url,  # Google/Unsplash/Mock 이미지
-            ingredients_total=recipe.ingredients_total,
-            ingredients_have=have,
-            ingredients_need=need,
-            steps=recipe.steps,
-            tips=recipe.tips or [],
-            warnings=recipe.warnings or [],
-        )
-        final_recipes.append(final_recipe)
-
-    logger.info(f"이미지 검색 완료: {sum(1 for r in final_recipes if r.image_url)}개 성공")
+    # 3~5. 이미지 병렬 검색 + 보유/필요 재료 분리 (API Gateway 30초 제한 대비 동적 타임아웃)
+    final_recipes = await finalize_recipes(
+        recipes_raw,
+        payload.ingredients,
+        usage=usage,
+        cache_only=budget_exceeded,
+        timeout=max(28 - llm_elapsed, 5),
+    )
 
     # 4. 장보기 리스트 생성 (모든 레시피의 필요 재료 중복 제거 + 정규화)
-    all_need: set[str] = set()
-    for r in final_recipes:
-        all_need |= {x for x in r.ingredients_need if x}
-
-    # 정규화하여 중복 제거 (예: "계란 1개", "계란 2개" → "계란")
-    deduplicated = deduplicate_shopping_list(all_need)
-
-    # 쿠팡 파트너스 링크 생성
-    coupang = CoupangLinkService()
-    shopping_list = [
-        ShoppingItem(item=i, purchase_url=coupang.generate_search_url(i))
-        for i in deduplicated
-    ]
+    shopping_list = build_shopping_list(final_recipes)
 
     # 5. 응답 객체 생성
     rec_id = f"rec_{uuid4().hex[:10]}"
@@ -316,34 +459,25 @@ async def create_recommendation(
     # 6. 검증 (LLM 출력이 규칙 만족하는지 확인)
     validate_response(response, payload)
 
-    # 7. DB 저장 및 반환
-    record = RecommendationRecord(
-        id=rec_id, created_at=response.created_at, data=response.model_dump(mode="json")
-    )
+    # 7. DB 저장 및 반환 (폴백 응답은 표시해 두고 색인 동기화에서 제외)
+    data = response.model_dump(mode="json")
+    if not generated:
+        data["generated"] = False
+    record = RecommendationRecord(id=rec_id, created_at=response.created_at, data=data)
     db.add(record)
     db.commit()
+    if generated:
+        recipe_index.add_response(response)
+        recipe_search_index.add_response(response)
+    trending_service.record_recommendation(payload.ingredients, [r.title for r in final_recipes])
 
-    # 8. 캐시에 저장 (다음 동일 요청 시 LLM/이미지 비용 절약)
-    try:
-        save_cache(cache_key, response, db)
-    except Exception as e:
-        logger.warning(f"캐시 저장 실패 (무시): {e}")
-
-    # 9. 비용 추정 로깅
-    llm_costs = {"anthropic": 0.015, "youtube": 0.005, "mock": 0.0}
-    image_provider = settings.image_search_provider.lower()
-    img_costs_per = {"gemini": 0.039, "google": 0.005, "unsplash": 0.0, "mock": 0.0}
-    llm_cost = llm_costs.get(provider, 0.015)
-    num_images = sum(1 for r in final_recipes if r.image_url)
-    img_cost = img_costs_per.get(image_provider, 0.0) * num_images
-    total_cost = llm_cost + img_cost
-    elapsed = time.monotonic() - start_time
-    logger.info(
-        f"💰 Cost: LLM=${llm_cost:.3f}, Image=${img_cost:.3f}, Total=${total_cost:.3f} "
-        f"(provider={provider}, image={image_provider}, {elapsed:.1f}s)"
-    )
+    # 8. 캐시에 저장 (다음 동일 요청 시 LLM/이미지 비용 절약, 폴백 응답은 캐시하지 않음)
+    if generated:
+        try:
+            save_cache(cache_key, response, db)
+        except Exception as e:
+            logger.warning(f"캐시 저장 실패 (무시): {e}")
 
-    logger.info(f"레시피 생성 완료: ID={rec_id}")
     return response
 
 
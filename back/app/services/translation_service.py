@@ -0,0 +1,293 @@
+"""
+레시피 지연 번역 (`?lang=en`)
+
+생성 시점에 번역하면 모든 요청의 LLM 지연이 두 배가 되므로,
+영어 조회가 처음 들어온 레시피만 Haiku로 번역하고 결과를 DB에 캐시합니다.
+
+- 캐시 키: 레시피 본문(제목/요약/재료/단계/팁/주의) SHA256 + 언어
+  → 캐시 클론·검색 재사용으로 여러 추천에 들어간 같은 레시피도 한 번만 번역
+- 조회: 응답의 모든 레시피 해시를 IN 조회 1회
+- 미번역 레시피는 한 번의 Haiku 호출로 함께 번역
+- 같은 레시피에 대한 동시 요청은 진행 중인 번역 Future를 함께 기다림 (프로세스 단위)
+- 번역 실패 시 원문(한국어) 그대로 반환, 실패한 레시피는 잠시(FAILURE_TTL_SECONDS) 재시도하지 않음
+- max_tokens는 번역할 본문 길이로 산정 (레시피가 길어도 출력이 잘리지 않도록)
+
+조회 엔드포인트는 동기 함수(스레드풀)이므로 번역도 동기 호출로 처리합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime
+
+from anthropic import Anthropic
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.recipe_translation import RecipeTranslation
+from app.models.recommendation import Recipe, RecommendationResponse
+from app.services.description_parser import estimate_tokens
+from app.services.ingredient_normalizer import normalize_ingredient
+from app.services.llm_scheduler import llm_scheduler
+from app.services.model_router import model_router
+from app.services.usage_ledger import UsageLedgerService, UsageMeter
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_LANGUAGES = {"en": "English"}
+
+# 번역 대상 필드 (have/need는 ingredients_total의 부분집합이라 매핑으로 복원)
+_TEXT_FIELDS = ("title", "summary")
+_LIST_FIELDS = ("ingredients_total", "steps", "tips", "warnings")
+
+TRANSLATION_SYSTEM_PROMPT = """당신은 한국 가정 요리 레시피 전문 번역가입니다.
+JSON 배열로 주어진 레시피를 요청한 언어로 자연스럽게 번역합니다.
+
+규칙:
+1. 입력과 같은 순서, 같은 개수의 JSON 배열만 출력 (설명 금지)
+2. 각 레시피의 목록 필드(ingredients_total, steps, tips, warnings)는 항목 수를 그대로 유지
+3. ingredient_names: ingredients_total 각 항목의 분량 없는 재료명 (같은 순서, 같은 개수)
+4. 분량/단위/시간 숫자는 그대로 유지 (큰술 → tbsp, 작은술 → tsp, 컵 → cup)
+5. 김치, 고추장, 된장처럼 고유한 한국 식재료/요리명은 로마자 표기 후 필요하면 괄호로 짧게 설명
+   예: "gochujang (Korean chili paste)"
+
+출력 형식:
+[{"title": "...", "summary": "...", "ingredients_total": ["..."], "ingredient_names": ["..."],
+  "steps": ["..."], "tips": ["..."], "warnings": ["..."]}]"""
+
+# 출력 토큰 상한 (입력 본문 길이로 산정한 값을 이 범위로 제한)
+MAX_TRANSLATION_TOKENS = 16000
+FAILURE_TTL_SECONDS = 60.0
+
+# 진행 중인 번역 (content_hash, lang) → Future[dict]
+_inflight: dict[tuple[str, str], Future] = {}
+# 최근 실패한 번역 (content_hash, lang) → 재시도 가능 시각 (monotonic)
+_failed: dict[tuple[str, str], float] = {}
+_lock = threading.Lock()
+
+
+def content_hash(recipe: Recipe) -> str:
+    """번역 캐시 키 (이미지/보유 재료처럼 요청마다 달라지는 필드 제외)"""
+    parts = {field: getattr(recipe, field) for field in (*_TEXT_FIELDS, *_LIST_FIELDS)}
+    raw = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def output_token_budget(source_json: str, count: int) -> int:
+    """
+    번역 출력 max_tokens 산정
+
+    영어 출력은 한글 원문보다 토큰이 많아지므로 입력 추정치의 1.5배 +
+    레시피당 ingredient_names/JSON 구조 여유분, 설정값 이상 MAX_TRANSLATION_TOKENS 이하
+    """
+    estimate = estimate_tokens(source_json) * 3 // 2 + 200 * count
+    return max(settings.haiku_max_tokens, min(estimate, MAX_TRANSLATION_TOKENS))
+
+
+def _apply(recipe: Recipe, data: dict) -> Recipe:
+    """번역 결과를 레시피에 적용 (have/need는 원문 → 번역 재료 매핑으로 변환)"""
+    mapping = dict(zip(recipe.ingredients_total, data["ingredients_total"], strict=False))
+    return recipe.model_copy(
+        update={
+            "title": data["title"],
+            "summary": data["summary"],
+            "ingredients_total": data["ingredients_total"],
+            "ingredients_have": [mapping.get(x, x) for x in recipe.ingredients_have],
+            "ingredients_need": [mapping.get(x, x) for x in recipe.ingredients_need],
+            "steps": data["steps"],
+            "tips": data["tips"],
+            "warnings": data["warnings"],
+        }
+    )
+
+
+class RecipeTranslator:
+    """Haiku 레시피 번역기"""
+
+    def __init__(self):
+        self.client = Anthropic(api_key=settings.anthropic_api_key)
+
+    def translate(
+        self, recipes: list[Recipe], lang: str, usage: UsageMeter | None = None
+    ) -> list[dict]:
+        """
+        레시피 여러 개를 한 번의 호출로 번역
+
+        Raises:
+            ValueError: 응답 형식/항목 수 불일치
+        """
+        source = json.dumps(
+            [
+                {field: getattr(r, field) for field in (*_TEXT_FIELDS, *_LIST_FIELDS)}
+                for r in recipes
+            ],
+            ensure_ascii=False,
+        )
+        user_prompt = f"다음 레시피 {len(recipes)}개를 {SUPPORTED_LANGUAGES[lang]}로 번역해주세요.\n\n{source}"
+        max_tokens = output_token_budget(source, len(recipes))
+
+        with llm_scheduler.slot(None):
+            call_started = time.monotonic()
+            try:
+                response = self.client.messages.create(
+                    model=settings.haiku_model,
+                    max_tokens=max_tokens,
+                    temperature=settings.haiku_temperature,
+                    # Haiku 최소 캐시 길이(2048토큰)보다 짧아 cache_control을 붙이지 않음
+                    system=TRANSLATION_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": user_prompt}],
+                )
+            except Exception:
+                model_router.record(
+                    settings.haiku_model,
+                    time.monotonic() - call_started,
+                    ok=False,
+                    task="translation",
+                )
+                if usage:
+                    usage.record_failure("anthropic", settings.haiku_model, "translation")
+                raise
+        model_router.record(
+            settings.haiku_model,
+            time.monotonic() - call_started,
+            ok=True,
+            task="translation",
+        )
+        if usage:
+            usage.record_message("anthropic", settings.haiku_model, "translation", response)
+
+        if response.stop_reason == "max_tokens":
+            raise ValueError(f"번역 출력이 max_tokens({max_tokens})에서 잘림")
+        content = response.content[0].text.strip()
+        if "```" in content:
+            content = content.split("```")[1].removeprefix("json").strip()
+        translated = json.loads(content)
+
+        if not isinstance(translated, list) or len(translated) != len(recipes):
+            raise ValueError(f"번역 결과 개수 불일치: {len(recipes)}개 요청")
+        for original, data in zip(recipes, translated, strict=True):
+            for field in _TEXT_FIELDS:
+                if not isinstance(data.get(field), str):
+                    raise ValueError(f"번역 필드 누락: {field}")
+            for field in (*_LIST_FIELDS, "ingredient_names"):
+                expected = len(
+                    original.ingredients_total
+                    if field == "ingredient_names"
+                    else getattr(original, field)
+                )
+                if not isinstance(data.get(field), list) or len(data[field]) != expected:
+                    raise ValueError(f"번역 항목 수 불일치: {field}")
+        return translated
+
+
+def _translate_missing(
+    recipes: dict[str, Recipe], lang: str, db: Session, recommendation_id: str
+) -> None:
+    """캐시에 없는 레시피를 번역해 저장하고 대기 중인 Future를 완료"""
+    futures = {h: _inflight[(h, lang)] for h in recipes}
+    usage = UsageMeter()
+    try:
+        translated = RecipeTranslator().translate(list(recipes.values()), lang, usage)
+        for h, data in zip(recipes, translated, strict=True):
+            db.merge(
+                RecipeTranslation(
+                    content_hash=h, lang=lang, data=data, created_at=datetime.utcnow()
+                )
+            )
+        db.commit()
+        for h, data in zip(recipes, translated, strict=True):
+            futures[h].set_result(data)
+        logger.info(f"레시피 번역 저장: {len(recipes)}개 (lang={lang}, {usage.summary()})")
+    except Exception as e:
+        db.rollback()
+        retry_at = time.monotonic() + FAILURE_TTL_SECONDS
+        with _lock:
+            for h in recipes:
+                _failed[(h, lang)] = retry_at
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(e)
+    finally:
+        with _lock:
+            for h in recipes:
+                _inflight.pop((h, lang), None)
+
+    UsageLedgerService(db).save_quietly(usage, recommendation_id=recommendation_id)
+
+
+def _recently_failed(key: tuple[str, str], now: float) -> bool:
+    """실패 후 FAILURE_TTL_SECONDS 안이면 True (만료된 항목은 제거, 호출자가 _lock 보유)"""
+    retry_at = _failed.get(key)
+    if retry_at is None:
+        return False
+    if now < retry_at:
+        return True
+    del _failed[key]
+    return False
+
+
+def translate_response(
+    response: RecommendationResponse, lang: str, db: Session
+) -> RecommendationResponse:
+    """
+    추천 결과를 요청 언어로 변환 (캐시 우선, 미번역 레시피만 Haiku 1회 호출)
+
+    번역에 실패한 레시피는 원문 그대로 반환합니다.
+    """
+    if lang not in SUPPORTED_LANGUAGES or not response.recipes:
+        return response
+
+    hashes = [content_hash(r) for r in response.recipes]
+    cached = {
+        row.content_hash: row.data
+        for row in db.query(RecipeTranslation).filter(
+            RecipeTranslation.lang == lang, RecipeTranslation.content_hash.in_(set(hashes))
+        )
+    }
+
+    # 캐시에 없는 레시피: 다른 요청이 번역 중이면 합류, 최근 실패했으면 원문, 아니면 이 요청이 번역 담당
+    owned: dict[str, Recipe] = {}
+    pending: dict[str, Future] = {}
+    now = time.monotonic()
+    with _lock:
+        for h, recipe in zip(hashes, response.recipes, strict=True):
+            key = (h, lang)
+            if h in cached or h in pending or _recently_failed(key, now):
+                continue
+            if key not in _inflight:
+                _inflight[key] = Future()
+                owned[h] = recipe
+            pending[h] = _inflight[key]
+
+    if owned:
+        _translate_missing(owned, lang, db, response.id)
+
+    translations = dict(cached)
+    for h, future in pending.items():
+        try:
+            translations[h] = future.result()
+        except Exception as e:
+            logger.warning(f"레시피 번역 실패, 원문 반환 ({h[:12]}...): {e}")
+
+    # 장보기 항목은 정규화 재료명 → 번역 재료명으로 변환 (구매 링크는 한국어 검색 유지)
+    names: dict[str, str] = {}
+    recipes = []
+    for h, recipe in zip(hashes, response.recipes, strict=True):
+        data = translations.get(h)
+        if data is None:
+            recipes.append(recipe)
+            continue
+        for original, name in zip(recipe.ingredients_total, data["ingredient_names"], strict=False):
+            names.setdefault(normalize_ingredient(original), name)
+        recipes.append(_apply(recipe, data))
+
+    shopping_list = [
+        item.model_copy(update={"item": names.get(item.item, item.item)})
+        for item in response.shopping_list
+    ]
+    return response.model_copy(update={"recipes": recipes, "shopping_list": shopping_list})
@@ -0,0 +1,263 @@
+"""
+요즘 인기 재료/레시피 (스트리밍 heavy-hitter)
+
+페이지 조회마다 search_histories/favorites를 집계하지 않도록
+추천/즐겨찾기 이벤트가 들어올 때 메모리 구조만 갱신하고, 조회는 메모리에서 바로 응답합니다.
+
+- Count-Min Sketch: 항목별 (감쇠된) 빈도 추정, 이벤트당 O(depth)
+- Top-K: 추정 빈도 상위 후보 dict + 지연 삭제 min-heap (이벤트당 O(log k))
+- 시간 감쇠: forward decay - 이벤트 가중치를 exp((t - t0) / τ)로 키워 기존 값은 건드리지 않음
+  (조회 시 exp(-(now - t0) / τ)를 곱해 현재 시점 점수로 변환, 지수가 커지면 전체 재조정)
+- 공유 점수: gunicorn 워커마다 메모리 구조가 따로 있으므로, 워커는 마지막 합산 이후 이벤트만
+  `trending_scores` 테이블 점수에 더하고(감쇠 후 합산) 합산된 전체 점수로 Top-K를 다시 채움
+  (FLUSH_INTERVAL_SECONDS 주기 백그라운드 작업, 재시작/배포 후에도 유지)
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import threading
+import time
+import zlib
+from datetime import UTC, datetime, timedelta
+from operator import itemgetter
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.trending import TrendingScore
+from app.services.ingredient_normalizer import normalize_ingredient
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL_SECONDS = 60.0
+HALF_LIFE_HOURS = 24.0
+TAU_SECONDS = HALF_LIFE_HOURS * 3600 / math.log(2)
+TOP_K = 50
+# 2주간 이벤트가 없는 항목은 점수가 2^-14 이하 → 공유 테이블에서 삭제
+PRUNE_AFTER_DAYS = 14
+KINDS = ("ingredient", "recipe")
+# 즐겨찾기는 단순 추천 노출보다 강한 관심 신호
+FAVORITE_WEIGHT = 3.0
+# forward decay 지수가 이 값을 넘으면 전체 값을 현재 시점 기준으로 재조정 (float 오버플로 방지)
+_MAX_EXPONENT = 50.0
+
+
+class DecayedTopK:
+    """시간 감쇠 Count-Min Sketch + Top-K"""
+
+    def __init__(self, k: int = TOP_K, width: int = 2048, depth: int = 4, t0: float | None = None):
+        self.k = k
+        self.width = width
+        self.depth = depth
+        self._tau = TAU_SECONDS
+        self._t0 = time.time() if t0 is None else t0
+        self._sketch = np.zeros((depth, width), dtype=np.float64)
+        self._top: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    def _buckets(self, key: str) -> list[int]:
+        data = key.encode("utf-8")
+        return [
+            zlib.crc32(data, row * 0x9E3779B1 & 0xFFFFFFFF) % self.width
+            for row in range(self.depth)
+        ]
+
+    def _rescale(self, now: float) -> None:
+        factor = math.exp(-(now - self._t0) / self._tau)
+        self._sketch *= factor
+        self._top = {key: value * factor for key, value in self._top.items()}
+        self._heap = [(value, key) for key, value in self._top.items()]
+        heapq.heapify(self._heap)
+        self._t0 = now
+
+    def add(self, key: str, weight: float = 1.0, now: float | None = None) -> None:
+        """이벤트 1건 반영"""
+        now = time.time() if now is None else now
+        if (now - self._t0) / self._tau > _MAX_EXPONENT:
+            self._rescale(now)
+        scaled = weight * math.exp((now - self._t0) / self._tau)
+        self._add_scaled(key, scaled)
+
+    def _add_scaled(self, key: str, scaled: float) -> None:
+        rows = range(self.depth)
+        cols = self._buckets(key)
+        self._sketch[rows, cols] += scaled
+        estimate = float(self._sketch[rows, cols].min())
+
+        if key in self._top or len(self._top) < self.k:
+            self._top[key] = estimate
+            heapq.heappush(self._heap, (estimate, key))
+            return
+
+        # 최소 후보 찾기 (값이 갱신된 heap 항목은 지연 삭제)
+        while self._heap and self._top.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        if self._heap and estimate > self._heap[0][0]:
+            _, evicted = heapq.heappop(self._heap)
+            del self._top[evicted]
+            self._top[key] = estimate
+            heapq.heappush(self._heap, (estimate, key))
+
+        # 갱신으로 쌓인 오래된 heap 항목 정리
+        if len(self._heap) > 4 * self.k:
+            self._heap = [(value, key) for key, value in self._top.items()]
+            heapq.heapify(self._heap)
+
+    def top(self, limit: int, now: float | None = None) -> list[tuple[str, float]]:
+        """현재 시점 감쇠 점수 상위 항목 (O(k log k), k ≤ 50)"""
+        now = time.time() if now is None else now
+        factor = math.exp(-(now - self._t0) / self._tau)
+        ranked = sorted(self._top.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(key, round(value * factor, 3)) for key, value in ranked]
+
+    @classmethod
+    def from_scores(cls, scores: dict[str, float], now: float, k: int = TOP_K) -> DecayedTopK:
+        """now 시점 점수로 스케치/Top-K 다시 채우기"""
+        tracker = cls(k=k, t0=now)
+        for key, value in sorted(scores.items(), key=itemgetter(1), reverse=True):
+            tracker._add_scaled(key, value)
+        return tracker
+
+
+class TrendingService:
+    """인기 재료/레시피 트래커 (워커별 메모리 Top-K + DB 공유 점수)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.ingredients, self.recipes = DecayedTopK(), DecayedTopK()
+        # 마지막 합산 이후 이벤트: (종류, 키) → _pending_t0 기준 forward decay 가중치
+        self._pending: dict[tuple[str, str], float] = {}
+        self._pending_t0 = time.time()
+
+    def _tracker(self, kind: str) -> DecayedTopK:
+        return self.ingredients if kind == "ingredient" else self.recipes
+
+    def _record(self, kind: str, key: str, weight: float = 1.0) -> None:
+        """이벤트 1건 (호출자가 _lock 보유)"""
+        now = time.time()
+        key = key[:200]
+        self._tracker(kind).add(key, weight, now)
+        scaled = weight * math.exp((now - self._pending_t0) / TAU_SECONDS)
+        self._pending[(kind, key)] = self._pending.get((kind, key), 0.0) + scaled
+
+    def record_recommendation(self, ingredients: list[str], recipe_titles: list[str]) -> None:
+        """추천 1건 (입력 재료 + 추천된 레시피 제목)"""
+        keys = {k for k in map(normalize_ingredient, ingredients) if k}
+        with self._lock:
+            for key in keys:
+                self._record("ingredient", key)
+            for title in recipe_titles:
+                if title.strip():
+                    self._record("recipe", title.strip())
+
+    def record_favorite(self, recipe_title: str) -> None:
+        """즐겨찾기 추가 1건"""
+        if not recipe_title.strip():
+            return
+        with self._lock:
+            self._record("recipe", recipe_title.strip(), weight=FAVORITE_WEIGHT)
+
+    def get_trending(self, limit: int = 10) -> dict[str, list[tuple[str, float]]]:
+        with self._lock:
+            return {
+                "ingredients": self.ingredients.top(limit),
+                "recipes": self.recipes.top(limit),
+            }
+
+    # ---- 공유 점수 합산 ----
+
+    @staticmethod
+    def _decayed(score: float, updated_at: datetime, now: datetime) -> float:
+        return score * math.exp(-max((now - updated_at).total_seconds(), 0.0) / TAU_SECONDS)
+
+    def _merge(self, db: Session, deltas: dict[tuple[str, str], float], now: datetime) -> None:
+        """이 워커의 증분을 공유 점수에 합산 (행 잠금으로 다른 워커와의 동시 갱신 직렬화)"""
+        for kind in KINDS:
+            keys = [key for k, key in deltas if k == kind]
+            if not keys:
+                continue
+            rows = {
+                row.key: row
+                for row in db.query(TrendingScore)
+                .filter(TrendingScore.kind == kind, TrendingScore.key.in_(keys))
+                .with_for_update()
+            }
+            for key in keys:
+                delta = deltas[(kind, key)]
+                row = rows.get(key)
+                if row is None:
+                    db.add(TrendingScore(kind=kind, key=key, score=delta, updated_at=now))
+                else:
+                    row.score = self._decayed(row.score, row.updated_at, now) + delta
+                    row.updated_at = now
+        db.query(TrendingScore).filter(
+            TrendingScore.updated_at < now - timedelta(days=PRUNE_AFTER_DAYS)
+        ).delete(synchronize_session=False)
+        db.commit()
+
+    def _load_scores(self, db: Session, now: datetime) -> dict[str, dict[str, float]]:
+        """공유 점수 → 종류별 현재 시점 상위 TOP_K"""
+        scores: dict[str, dict[str, float]] = {kind: {} for kind in KINDS}
+        for kind, key, score, updated_at in db.query(
+            TrendingScore.kind, TrendingScore.key, TrendingScore.score, TrendingScore.updated_at
+        ):
+            if kind in scores:
+                scores[kind][key] = self._decayed(score, updated_at, now)
+        return {
+            kind: dict(heapq.nlargest(TOP_K, values.items(), key=itemgetter(1)))
+            for kind, values in scores.items()
+        }
+
+    def flush(self) -> None:
+        """마지막 합산 이후 이벤트를 공유 점수에 더하고, 합산된 점수로 메모리 Top-K 재구성"""
+        now = time.time()
+        with self._lock:
+            pending, pending_t0 = self._pending, self._pending_t0
+            self._pending, self._pending_t0 = {}, now
+        factor = math.exp(-(now - pending_t0) / TAU_SECONDS)
+        deltas = {item: value * factor for item, value in pending.items()}
+        updated_at = datetime.fromtimestamp(now, UTC).replace(tzinfo=None)
+
+        db = SessionLocal()
+        try:
+            if deltas:
+                self._merge(db, deltas, updated_at)
+            scores = self._load_scores(db, updated_at)
+        except Exception as e:
+            # 다른 워커가 같은 새 키를 먼저 넣은 경우 등 → 증분을 되돌려 다음 주기에 재시도
+            db.rollback()
+            with self._lock:
+                for item, value in deltas.items():
+                    self._pending[item] = self._pending.get(item, 0.0) + value
+            logger.warning(f"인기 점수 합산 실패 (다음 주기 재시도): {e}")
+            return
+        finally:
+            db.close()
+
+        with self._lock:
+            self.ingredients = DecayedTopK.from_scores(scores["ingredient"], now)
+            self.recipes = DecayedTopK.from_scores(scores["recipe"], now)
+            # 합산 중 들어온 이벤트는 다음 합산 전까지 로컬 Top-K에도 유지 (같은 t0 기준)
+            for (kind, key), value in self._pending.items():
+                self._tracker(kind)._add_scaled(key, value)
+        if deltas:
+            logger.info(f"인기 점수 합산: +{len(deltas)}개 항목")
+
+    def run(self) -> None:
+        """백그라운드 작업 (앱 시작 시 스레드에서 호출, 첫 합산에서 공유 점수 로드)"""
+        while not self._stop.is_set():
+            self.flush()
+            self._stop.wait(FLUSH_INTERVAL_SECONDS)
+
+    def stop(self) -> None:
+        """작업 종료 + 남은 이벤트 합산 (앱 종료 시)"""
+        self._stop.set()
+        self.flush()
+
+
+trending_service = TrendingService()
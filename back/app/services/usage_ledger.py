@@ -0,0 +1,300 @@
+"""
+Usage ledger service
+
+- 요청 단위 사용량 수집 (UsageMeter): 공급자 응답의 실제 usage 토큰, 재시도, 이미지 호출
+- 원장 저장/집계 (UsageLedgerService): 일자/공급자/모델별 롤업
+- 일일 예산 초과 여부 판단 → 초과 시 저비용 모드로 강등
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.usage_ledger import UsageLedgerEntry, UsageRollup
+
+logger = logging.getLogger(__name__)
+
+# 모델별 가격 (USD / 100만 토큰: 입력, 출력) - 모델 ID 접두어로 매칭
+MODEL_PRICES: dict[str, tuple[float, float]] = {
+    "claude-sonnet-4": (3.0, 15.0),
+    "claude-haiku-4": (1.0, 5.0),
+    "claude-3-5-haiku": (0.8, 4.0),
+    "claude-opus-4": (15.0, 75.0),
+}
+DEFAULT_MODEL_PRICE = (3.0, 15.0)
+
+# 프롬프트 캐시 읽기/쓰기 단가 (입력 단가 대비 배수)
+CACHE_READ_MULTIPLIER = 0.1
+CACHE_WRITE_MULTIPLIER = 1.25
+
+# 이미지 공급자별 호출당 비용 (USD)
+IMAGE_PRICES: dict[str, float] = {"gemini": 0.039, "google": 0.005, "unsplash": 0.0, "mock": 0.0}
+
+# 예산 초과 여부 캐시 (요청마다 SUM 쿼리를 하지 않도록)
+BUDGET_CHECK_TTL_SECONDS = 60.0
+
+
+def utc_today() -> date:
+    """원장 일자 기준 (UTC) - 서버 로컬 시간대와 무관하게 일일 예산/롤업 경계를 맞춤"""
+    return datetime.now(UTC).date()
+
+
+def estimate_llm_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_creation_tokens: int = 0,
+) -> float:
+    """토큰 사용량으로 LLM 호출 비용 계산 (USD)"""
+    input_price, output_price = next(
+        (price for prefix, price in MODEL_PRICES.items() if model.startswith(prefix)),
+        DEFAULT_MODEL_PRICE,
+    )
+    cost = (
+        input_tokens * input_price
+        + cache_read_tokens * input_price * CACHE_READ_MULTIPLIER
+        + cache_creation_tokens * input_price * CACHE_WRITE_MULTIPLIER
+        + output_tokens * output_price
+    )
+    return cost / 1_000_000
+
+
+@dataclass
+class UsageRecord:
+    """공급자 호출 1건의 사용량"""
+
+    provider: str
+    model: str
+    operation: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    image_calls: int = 0
+    cost_usd: float = 0.0
+    success: bool = True
+
+
+class UsageMeter:
+    """
+    요청 하나에서 발생한 모든 공급자 호출 사용량 수집기
+
+    어댑터는 API 응답을 받을 때마다 `record_message`를, 실패한 호출(재시도 포함)은
+    `record_failure`를, 이미지 공급자 호출은 `record_images`를 호출합니다.
+    LLM 호출 스레드(run_llm_call)에서 호출될 수 있으므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self):
+        self.records: list[UsageRecord] = []
+        self._lock = threading.Lock()
+
+    def record_message(
+        self,
+        provider: str,
+        model: str,
+        operation: str,
+        response: object,
+        share: float = 1.0,
+    ) -> None:
+        """
+        Anthropic messages 응답의 usage 기록
+
+        Args:
+            share: 배치 호출을 여러 요청이 나눠 쓰는 경우 이 요청의 몫 (0~1)
+        """
+        usage = getattr(response, "usage", None)
+
+        def tokens(name: str) -> int:
+            return round((getattr(usage, name, None) or 0) * share)
+
+        record = UsageRecord(
+            provider=provider,
+            model=model,
+            operation=operation,
+            input_tokens=tokens("input_tokens"),
+            output_tokens=tokens("output_tokens"),
+            cache_read_tokens=tokens("cache_read_input_tokens"),
+            cache_creation_tokens=tokens("cache_creation_input_tokens"),
+        )
+        record.cost_usd = estimate_llm_cost(
+            model,
+            record.input_tokens,
+            record.output_tokens,
+            record.cache_read_tokens,
+            record.cache_creation_tokens,
+        )
+        self._append(record)
+
+    def record_failure(self, provider: str, model: str, operation: str) -> None:
+        """응답을 받지 못한 호출 기록 (재시도 횟수 집계용)"""
+        self._append(
+            UsageRecord(provider=provider, model=model, operation=operation, success=False)
+        )
+
+    def record_images(self, provider: str, calls: int = 1) -> None:
+        """이미지 검색/생성 공급자 호출 기록 (캐시 히트는 기록하지 않음)"""
+        self._append(
+            UsageRecord(
+                provider=provider,
+                model=provider,
+                operation="image",
+                image_calls=calls,
+                cost_usd=IMAGE_PRICES.get(provider, 0.0) * calls,
+            )
+        )
+
+    def _append(self, record: UsageRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def cost(self, operation: str | None = None) -> float:
+        """총 비용 (operation 지정 시 해당 작업만)"""
+        with self._lock:
+            return sum(
+                r.cost_usd for r in self.records if operation is None or r.operation == operation
+            )
+
+    def summary(self) -> str:
+        """로그용 요약 문자열"""
+        with self._lock:
+            records = list(self.records)
+        llm = [r for r in records if r.operation != "image"]
+        return (
+            f"calls={len(llm)} (failed={sum(1 for r in llm if not r.success)}), "
+            f"in={sum(r.input_tokens for r in llm)}, out={sum(r.output_tokens for r in llm)}, "
+            f"cache_read={sum(r.cache_read_tokens for r in llm)}, "
+            f"cache_write={sum(r.cache_creation_tokens for r in llm)}, "
+            f"images={sum(r.image_calls for r in records)}"
+        )
+
+
+class UsageLedgerService:
+    """사용량 원장 서비스"""
+
+    # 프로세스 전역 예산 판단 캐시: (판단 시각, 초과 여부)
+    _budget_cache: tuple[float, bool] | None = None
+    _budget_lock = threading.Lock()
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def save(self, meter: UsageMeter, recommendation_id: str | None = None) -> None:
+        """요청 사용량을 원장에 저장"""
+        if not meter.records:
+            return
+
+        now = datetime.now(UTC)
+        for r in meter.records:
+            self.db.add(
+                UsageLedgerEntry(
+                    created_at=now.replace(tzinfo=None),
+                    usage_date=now.date(),
+                    recommendation_id=recommendation_id,
+                    provider=r.provider,
+                    model=r.model,
+                    operation=r.operation,
+                    input_tokens=r.input_tokens,
+                    output_tokens=r.output_tokens,
+                    cache_read_tokens=r.cache_read_tokens,
+                    cache_creation_tokens=r.cache_creation_tokens,
+                    image_calls=r.image_calls,
+                    cost_usd=r.cost_usd,
+                    success=r.success,
+                )
+            )
+        self.db.commit()
+
+        # 방금 쓴 비용을 반영하도록 예산 판단 캐시 무효화
+        with self._budget_lock:
+            UsageLedgerService._budget_cache = None
+
+    def save_quietly(self, meter: UsageMeter, recommendation_id: str | None = None) -> None:
+        """원장 저장 (실패해도 요청을 막지 않음 - 요청 실패 경로에서도 호출)"""
+        try:
+            self.save(meter, recommendation_id=recommendation_id)
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"사용량 원장 저장 실패 (무시): {e}")
+
+    def rollup(self, days: int = 7) -> list[UsageRollup]:
+        """최근 N일 일자/공급자/모델별 사용량 집계"""
+        since = utc_today() - timedelta(days=days - 1)
+        rows = (
+            self.db.query(
+                UsageLedgerEntry.usage_date,
+                UsageLedgerEntry.provider,
+                UsageLedgerEntry.model,
+                func.count(UsageLedgerEntry.id),
+                func.sum(case((UsageLedgerEntry.success.is_(False), 1), else_=0)),
+                func.sum(UsageLedgerEntry.input_tokens),
+                func.sum(UsageLedgerEntry.output_tokens),
+                func.sum(UsageLedgerEntry.cache_read_tokens),
+                func.sum(UsageLedgerEntry.cache_creation_tokens),
+                func.sum(UsageLedgerEntry.image_calls),
+                func.sum(UsageLedgerEntry.cost_usd),
+            )
+            .filter(UsageLedgerEntry.usage_date >= since)
+            .group_by(
+                UsageLedgerEntry.usage_date, UsageLedgerEntry.provider, UsageLedgerEntry.model
+            )
+            .order_by(UsageLedgerEntry.usage_date.desc(), UsageLedgerEntry.provider)
+            .all()
+        )
+        return [
+            UsageRollup(
+                usage_date=row[0],
+                provider=row[1],
+                model=row[2],
+                calls=row[3],
+                failed_calls=row[4] or 0,
+                input_tokens=row[5] or 0,
+                output_tokens=row[6] or 0,
+                cache_read_tokens=row[7] or 0,
+                cache_creation_tokens=row[8] or 0,
+                image_calls=row[9] or 0,
+                cost_usd=round(row[10] or 0.0, 6),
+            )
+            for row in rows
+        ]
+
+    def spent_on(self, day: date | None = None) -> float:
+        """특정 일자 총 비용 (기본: 오늘)"""
+        total = (
+            self.db.query(func.sum(UsageLedgerEntry.cost_usd))
+            .filter(UsageLedgerEntry.usage_date == (day or utc_today()))
+            .scalar()
+        )
+        return float(total or 0.0)
+
+    def is_over_daily_budget(self) -> bool:
+        """오늘 비용이 일일 예산을 넘었는지 (60초 캐시, 예산 0이면 항상 False)"""
+        budget = settings.daily_cost_budget_usd
+        if budget <= 0:
+            return False
+
+        now = time.monotonic()
+        with self._budget_lock:
+            cached = UsageLedgerService._budget_cache
+            if cached and now - cached[0] < BUDGET_CHECK_TTL_SECONDS:
+                return cached[1]
+
+        try:
+            exceeded = self.spent_on() >= budget
+        except Exception as e:
+            logger.warning(f"일일 예산 조회 실패 (예산 미적용): {e}")
+            return False
+
+        with self._budget_lock:
+            UsageLedgerService._budget_cache = (now, exceeded)
+        if exceeded:
+            logger.warning(f"일일 예산 ${budget:.2f} 초과 → 저비용 모드")
+        return exceeded
@@ -1,7 +1,36 @@
 from __future__ import annotations
 
-from app.data.allergen_derivatives import expand_exclusions
-from app.models.recommendation import RecommendationCreate, RecommendationResponse
+from app.models.recommendation import (
+    Constraints,
+    Recipe,
+    RecommendationCreate,
+    RecommendationResponse,
+)
+from app.services.exclusion_matcher import ExclusionMatcher, get_exclusion_matcher
+
+
+def validate_recipe(r: Recipe, constraints: Constraints, matcher: ExclusionMatcher) -> None:
+    """레시피 1개 규칙 검사 (시간 제한, 제외 재료, 단계 수)"""
+    if r.time_min > constraints.time_limit_min:
+        raise ValueError("time_limit_exceeded")
+
+    # 텍스트 전체를 한 번에 검사 (제외 재료 + 파생 재료 부분 문자열 매칭, 확인된 오탐 단어는 예외)
+    text_blob = " ".join(
+        [
+            r.title,
+            r.summary,
+            " ".join(r.ingredients_have),
+            " ".join(r.ingredients_need),
+            " ".join(r.steps),
+        ]
+    )
+
+    match = matcher.first(text_blob)
+    if match:
+        raise ValueError(f"exclude_ingredient_detected: {match.term}")
+
+    if not (4 <= len(r.steps) <= 8):
+        raise ValueError("steps_length_invalid")
 
 
 def validate_response(resp: RecommendationResponse, req: RecommendationCreate) -> None:
@@ -9,27 +38,7 @@ def validate_response(resp: RecommendationResponse, req: RecommendationCreate) -
     if len(resp.recipes) != 3:
         raise ValueError("recipes_must_be_3")
 
+    # exclude(알레르기/제외 재료) 포함 금지 - 파생 재료까지 확장한 매처를 한 번만 컴파일
+    matcher = get_exclusion_matcher(req.constraints.exclude)
     for r in resp.recipes:
-        if r.time_min > req.constraints.time_limit_min:
-            raise ValueError("time_limit_exceeded")
-
-        # exclude(알레르기/제외 재료) 포함 금지 - 파생 재료까지 확장
-        excl = expand_exclusions(req.constraints.exclude)
-
-        # 텍스트 전체를 소문자로 변환하여 검사
-        text_blob = " ".join(
-            [
-                r.title,
-                r.summary,
-                " ".join(r.ingredients_have),
-                " ".join(r.ingredients_need),
-                " ".join(r.steps),
-            ]
-        ).lower()
-
-        for e in excl:
-            if e and e in text_blob:
-                raise ValueError(f"exclude_ingredient_detected: {e}")
-
-        if not (4 <= len(r.steps) <= 8):
-            raise ValueError("steps_length_invalid")
+        validate_recipe(r, req.constraints, matcher)
@@ -2,27 +2,96 @@
 YouTube 검색 + Haiku 구조화 어댑터
 
 YouTube Data API v3로 인기 레시피 영상을 검색한 뒤,
-Haiku 4.5로 영상 메타데이터에서 레시피 정보를 구조화합니다.
+설명에 재료/조리 순서가 정리된 영상은 규칙 기반으로 바로 레시피를 만들고
+(`description_parser`), 부족한 개수만 Haiku 4.5로 영상 메타데이터에서 구조화합니다.
+
+YouTube 호출 비용 절감:
+- search.list(호출당 할당량 100): 정규화한 쿼리 문자열 기준 TTL 캐시, 캐시에 없는 쿼리만 동시 실행
+  (같은 쿼리를 동시에 요청하면 진행 중인 호출 하나를 공유, 할당량 초과(403)면 남은 쿼리 취소)
+- videos.list: 영상 ID 기준 TTL 캐시 (조회수가 바뀌므로 검색 캐시보다 짧게), 없는 ID만 한 번에 조회
+- HTTP 클라이언트는 프로세스 공유 (연결/TLS 재사용)
+- 조회한 영상은 `youtube_videos`에 저장하고 재료 역색인으로 재사용 (`youtube_video_index`):
+  입력 재료 조합을 충분히 덮으면 search.list/videos.list 없이 로컬 후보 사용
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Generic, TypeVar
 
 import httpx
 from anthropic import Anthropic
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.data.allergen_derivatives import expand_exclusions
 from app.models.recommendation import Recipe, RecommendationCreate
+from app.services.description_parser import (
+    ParsedRecipe,
+    condense_description,
+    estimate_tokens,
+    parse_description,
+)
+from app.services.exclusion_matcher import ExclusionMatcher, get_exclusion_matcher
+from app.services.ingredient_normalizer import ingredient_key
+from app.services.llm_scheduler import LLMTenant, llm_scheduler, run_llm_call
+from app.services.model_router import model_router
+from app.services.usage_ledger import UsageMeter
+from app.services.youtube_video_index import youtube_video_index
 
 logger = logging.getLogger(__name__)
 
 YOUTUBE_SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
 YOUTUBE_VIDEOS_URL = "https://www.googleapis.com/youtube/v3/videos"
 
+SEARCH_CACHE_TTL_SECONDS = 6 * 3600.0
+VIDEO_CACHE_TTL_SECONDS = 3600.0
+SEARCH_CACHE_MAX_ENTRIES = 2000
+VIDEO_CACHE_MAX_ENTRIES = 5000
+MAX_DETAIL_IDS = 15
+
+# Haiku 구조화 시스템 프롬프트 (정적 - 프롬프트 캐싱 대상)
+# 요청마다 달라지는 사용자 조건/영상 정보는 user 메시지로만 전달
+HAIKU_SYSTEM_PROMPT = """당신은 한국 가정 요리 전문가입니다. YouTube 영상 정보를 분석하여 레시피를 구조화합니다.
+
+규칙:
+1. 요청한 개수(기본 3개)만큼 서로 다른 레시피를 생성
+2. 각 레시피는 4-8개의 조리 단계
+3. 모든 텍스트는 한국어
+4. 시간 제한을 반드시 준수
+5. 제외 재료는 어떤 형태로도 사용 금지
+6. 영상 정보를 참고하되, 실제로 실현 가능한 레시피로 구성
+7. 재료명은 분량/수량 없이 재료명만 (예: "계란" O, "계란 2개" X)
+8. 반드시 한 끼 식사(또는 든든한 간식)로 먹을 수 있는 실제 요리만 추천
+   - 양념, 소스, 오일, 드레싱, 조미료만 만드는 레시피는 절대 포함 금지
+   - 예: "마늘 고추기름", "간장 소스", "양념장", "장아찌" 등은 요리가 아닙니다
+   - 재료가 적더라도 볶음밥, 국, 전, 볶음 등 실제 요리를 만들어야 합니다
+   - 사용자 재료가 양념류(마늘, 고추, 파 등)뿐이더라도 밥, 계란, 면 등 기본 식재료를 추가하여
+     실제 식사가 되는 요리를 만드세요
+
+출력: JSON 배열만 반환 (마크다운/설명 없이)
+각 레시피 필드: title, time_min, servings, summary, ingredients_total, steps, tips, warnings
+
+출력 형식:
+[
+  {
+    "title": "레시피 제목 (20자 이내)",
+    "time_min": 조리시간(분),
+    "servings": 인분수,
+    "summary": "한 줄 설명 (50자 이내)",
+    "ingredients_total": ["재료1", "재료2", ...],
+    "steps": ["단계1", "단계2", ...],
+    "tips": ["팁1"],
+    "warnings": ["주의사항1"]
+  },
+  ...
+]"""
+
 
 @dataclass
 class VideoInfo:
@@ -35,6 +104,76 @@ class VideoInfo:
     channel_title: str
 
 
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """만료 시간 + 최대 항목 수(LRU) 캐시"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> T | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: str, value: T) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_search_cache: TTLCache[list[str]] = TTLCache(SEARCH_CACHE_TTL_SECONDS, SEARCH_CACHE_MAX_ENTRIES)
+# 진행 중인 search.list 호출 (쿼리 키 → 태스크, 동시 요청이 같은 호출을 기다림)
+_search_inflight: dict[str, asyncio.Task[list[str]]] = {}
+_video_cache: TTLCache[VideoInfo] = TTLCache(VIDEO_CACHE_TTL_SECONDS, VIDEO_CACHE_MAX_ENTRIES)
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """YouTube API용 공유 클라이언트 (이벤트 루프가 바뀌면 새로 생성)"""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(timeout=10)
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """공유 클라이언트 종료 (앱 종료 시)"""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+def _forget_search(key: str, task: asyncio.Task[list[str]]) -> None:
+    """완료된 search.list 태스크를 진행 중 목록에서 제거 (기다리는 요청이 없어도 예외 회수)"""
+    if _search_inflight.get(key) is task:
+        del _search_inflight[key]
+    if not task.cancelled():
+        task.exception()
+
+
+def _query_key(query: str, max_results: int) -> str:
+    return f"{max_results}:{' '.join(query.lower().split())}"
+
+
 class YouTubeRecipeAdapter:
     """YouTube 검색 + Haiku 구조화로 레시피 생성"""
 
@@ -47,12 +186,21 @@ class YouTubeRecipeAdapter:
         self.youtube_api_key = settings.youtube_api_key
         self.haiku_client = Anthropic(api_key=settings.anthropic_api_key)
 
-    async def generate_recipes(self, payload: RecommendationCreate) -> list[Recipe]:
+    async def generate_recipes(
+        self,
+        payload: RecommendationCreate,
+        tenant: LLMTenant | None = None,
+        usage: UsageMeter | None = None,
+        db: Session | None = None,
+    ) -> list[Recipe]:
         """
-        YouTube 검색 → Haiku 구조화로 레시피 3개 생성
+        YouTube 검색 → 설명 규칙 기반 추출 (+ 부족분 Haiku 구조화)로 레시피 3개 생성
 
         Args:
             payload: 사용자 입력 (재료, 제약사항)
+            tenant: 호출 주체 (LLM 스케줄러 공정 큐잉용)
+            usage: 요청 사용량 수집기 (Haiku 호출 토큰 기록)
+            db: 영상 색인 조회/저장용 세션 (None이면 항상 YouTube 검색)
 
         Returns:
             list[Recipe]: 3개 레시피 (image_url=None, 이미지는 기존 서비스가 처리)
@@ -60,6 +208,77 @@ class YouTubeRecipeAdapter:
         Raises:
             ValueError: 검색 결과 부족 또는 구조화 실패
         """
+        # 1~3. 후보 영상 수집 (영상 색인 → 부족하면 YouTube 검색 + 상세 조회)
+        videos, from_index = await self._collect_videos(payload, db)
+
+        # 4. 필터링 및 랭킹 (색인 후보가 제외 재료 등으로 부족하면 YouTube 검색으로 다시)
+        ranked = self._filter_and_rank(videos, payload)
+        if len(ranked) < 3 and from_index:
+            logger.info(f"색인 후보 필터링 후 {len(ranked)}개, YouTube 검색으로 전환")
+            videos, _ = await self._collect_videos(payload, db, use_index=False)
+            ranked = self._filter_and_rank(videos, payload)
+        if len(ranked) < 3:
+            raise ValueError(f"관련 영상이 부족합니다: {len(ranked)}개 (최소 3개 필요)")
+
+        # 5. 설명에 재료/조리 순서가 정리된 영상은 규칙 기반 추출 (Haiku 호출 없음)
+        candidates = ranked[:8]
+        local_recipes, low_confidence = self._extract_from_descriptions(candidates, payload)
+        if len(local_recipes) >= 3:
+            logger.info(
+                f"설명 추출만으로 레시피 생성 (Haiku 생략): {[r.title for r in local_recipes]}"
+            )
+            return local_recipes
+
+        # 6. 부족한 개수만 Haiku로 구조화 (추출 신뢰도가 낮은 영상 위주)
+        #    동기 SDK 호출 + 스케줄러 대기 → LLM 전용 스레드 풀에서 실행
+        logger.info(f"설명 추출 {len(local_recipes)}개, Haiku로 {3 - len(local_recipes)}개 구조화")
+        haiku_recipes = await run_llm_call(
+            self._structure_with_haiku,
+            low_confidence or candidates,
+            payload,
+            tenant,
+            usage,
+            3 - len(local_recipes),
+            [r.title for r in local_recipes],
+        )
+        return local_recipes + haiku_recipes
+
+    async def _collect_videos(
+        self, payload: RecommendationCreate, db: Session | None, use_index: bool = True
+    ) -> tuple[list[VideoInfo], bool]:
+        """
+        후보 영상 수집
+
+        Returns:
+            (영상 목록, 영상 색인에서 가져왔는지 여부)
+
+        Raises:
+            ValueError: 검색 결과/상세 정보 없음
+        """
+        # 색인 동기화/조회와 저장은 동기 DB 작업이므로 이벤트 루프 밖(스레드)에서 실행
+        if db is not None and use_index:
+            try:
+                rows = await asyncio.to_thread(
+                    youtube_video_index.candidates, db, payload.ingredients
+                )
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"영상 색인 조회 실패 (무시): {e}")
+                rows = None
+            if rows:
+                logger.info(f"영상 색인에서 후보 {len(rows)}개 선택 (YouTube 검색 생략)")
+                videos = [
+                    VideoInfo(
+                        video_id=row.video_id,
+                        title=row.title,
+                        description=row.description,
+                        view_count=row.view_count,
+                        channel_title=row.channel_title,
+                    )
+                    for row in rows
+                ]
+                return videos, True
+
         # 1. 검색 쿼리 생성
         queries = self._build_search_queries(payload)
         logger.info(f"YouTube 검색 쿼리: {queries}")
@@ -69,19 +288,18 @@ class YouTubeRecipeAdapter:
         if not video_ids:
             raise ValueError("YouTube 검색 결과가 없습니다")
 
-        # 3. 영상 상세 정보 조회
+        # 3. 영상 상세 정보 조회 + 색인 저장
         videos = await self._get_video_details(video_ids)
         if not videos:
             raise ValueError("YouTube 영상 상세 정보를 가져올 수 없습니다")
 
-        # 4. 필터링 및 랭킹
-        ranked = self._filter_and_rank(videos, payload)
-        if len(ranked) < 3:
-            raise ValueError(f"관련 영상이 부족합니다: {len(ranked)}개 (최소 3개 필요)")
-
-        # 5. Haiku로 레시피 구조화
-        recipes = self._structure_with_haiku(ranked[:8], payload)
-        return recipes
+        if db is not None:
+            try:
+                await asyncio.to_thread(youtube_video_index.save, db, videos, payload.ingredients)
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"영상 메타데이터 저장 실패 (무시): {e}")
+        return videos, False
 
     def _build_search_queries(self, payload: RecommendationCreate) -> list[str]:
         """재료 기반 YouTube 검색 쿼리 생성"""
@@ -104,94 +322,127 @@ class YouTubeRecipeAdapter:
 
         return queries
 
-    async def _search_youtube(self, queries: list[str], max_results_per_query: int = 5) -> list[str]:
-        """YouTube Data API v3 검색, 중복 제거된 video ID 반환"""
-        seen_ids: set[str] = set()
-        video_ids: list[str] = []
-
-        async with httpx.AsyncClient(timeout=10) as client:
-            for query in queries:
-                try:
-                    resp = await client.get(
-                        YOUTUBE_SEARCH_URL,
-                        params={
-                            "part": "snippet",
-                            "q": query,
-                            "type": "video",
-                            "maxResults": max_results_per_query,
-                            "relevanceLanguage": "ko",
-                            "regionCode": "KR",
-                            "order": "relevance",
-                            "key": self.youtube_api_key,
-                        },
-                    )
-                    resp.raise_for_status()
-                    data = resp.json()
-
-                    for item in data.get("items", []):
-                        vid = item["id"].get("videoId")
-                        if vid and vid not in seen_ids:
-                            seen_ids.add(vid)
-                            video_ids.append(vid)
-
-                except httpx.HTTPStatusError as e:
-                    logger.warning(f"YouTube 검색 실패 (쿼리: {query}): {e.response.status_code}")
-                    if e.response.status_code == 403:
-                        raise ValueError("YouTube API 할당량 초과 또는 API 키 오류") from e
-                except httpx.RequestError as e:
-                    logger.warning(f"YouTube 검색 네트워크 오류 (쿼리: {query}): {e}")
-
-        logger.info(f"YouTube 검색 완료: {len(video_ids)}개 영상 발견")
+    async def _search_one(self, query: str, max_results: int) -> list[str]:
+        """search.list 1회 (캐시 → 진행 중인 같은 쿼리 → 새 호출 순)"""
+        key = _query_key(query, max_results)
+        cached = _search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        task = _search_inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._fetch_search(query, max_results, key))
+            _search_inflight[key] = task
+            task.add_done_callback(lambda t: _forget_search(key, t))
+        # 기다리던 요청 하나가 취소돼도 다른 요청이 공유하는 호출은 계속 진행
+        return await asyncio.shield(task)
+
+    async def _fetch_search(self, query: str, max_results: int, key: str) -> list[str]:
+        """search.list 호출 (실패 시 빈 목록 - 할당량 초과/키 오류는 ValueError)"""
+        try:
+            resp = await get_http_client().get(
+                YOUTUBE_SEARCH_URL,
+                params={
+                    "part": "snippet",
+                    "q": query,
+                    "type": "video",
+                    "maxResults": max_results,
+                    "relevanceLanguage": "ko",
+                    "regionCode": "KR",
+                    "order": "relevance",
+                    "key": self.youtube_api_key,
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
+        except httpx.HTTPStatusError as e:
+            logger.warning(f"YouTube 검색 실패 (쿼리: {query}): {e.response.status_code}")
+            if e.response.status_code == 403:
+                raise ValueError("YouTube API 할당량 초과 또는 API 키 오류") from e
+            return []
+        except httpx.RequestError as e:
+            logger.warning(f"YouTube 검색 네트워크 오류 (쿼리: {query}): {e}")
+            return []
+
+        video_ids = [vid for item in data.get("items", []) if (vid := item["id"].get("videoId"))]
+        _search_cache.set(key, video_ids)
+        return video_ids
+
+    async def _search_youtube(
+        self, queries: list[str], max_results_per_query: int = 5
+    ) -> list[str]:
+        """YouTube Data API v3 검색 (쿼리 동시 실행), 중복 제거된 video ID 반환"""
+        cached = sum(
+            _search_cache.get(_query_key(q, max_results_per_query)) is not None for q in queries
+        )
+        tasks = [
+            asyncio.ensure_future(self._search_one(query, max_results_per_query))
+            for query in queries
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except ValueError:
+            # 할당량 초과/키 오류면 나머지 쿼리 결과를 기다리지 않음
+            for task in tasks:
+                task.cancel()
+            raise
+        video_ids = list(dict.fromkeys(vid for ids in results for vid in ids))
+
+        logger.info(
+            f"YouTube 검색 완료: {len(video_ids)}개 영상 발견 "
+            f"(쿼리 {len(queries)}개 중 캐시 {cached}개)"
+        )
         return video_ids
 
     async def _get_video_details(self, video_ids: list[str]) -> list[VideoInfo]:
-        """videos.list API로 영상 설명, 조회수 등 상세 정보 조회"""
+        """videos.list API로 영상 설명, 조회수 등 상세 정보 조회 (캐시에 없는 ID만 요청)"""
         if not video_ids:
             return []
 
         # API는 최대 50개까지 한 번에 조회 가능
-        ids_str = ",".join(video_ids[:15])
+        video_ids = video_ids[:MAX_DETAIL_IDS]
+        found = {vid: info for vid in video_ids if (info := _video_cache.get(vid)) is not None}
+        missing = [vid for vid in video_ids if vid not in found]
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(
+        if missing:
+            resp = await get_http_client().get(
                 YOUTUBE_VIDEOS_URL,
                 params={
                     "part": "snippet,statistics",
-                    "id": ids_str,
+                    "id": ",".join(missing),
                     "key": self.youtube_api_key,
                 },
             )
             resp.raise_for_status()
             data = resp.json()
 
-        videos = []
-        for item in data.get("items", []):
-            snippet = item.get("snippet", {})
-            stats = item.get("statistics", {})
-
-            videos.append(
-                VideoInfo(
+            for item in data.get("items", []):
+                snippet = item.get("snippet", {})
+                stats = item.get("statistics", {})
+                info = VideoInfo(
                     video_id=item["id"],
                     title=snippet.get("title", ""),
                     description=snippet.get("description", ""),
                     view_count=int(stats.get("viewCount", 0)),
                     channel_title=snippet.get("channelTitle", ""),
                 )
-            )
+                _video_cache.set(info.video_id, info)
+                found[info.video_id] = info
 
-        logger.info(f"YouTube 상세 정보 조회 완료: {len(videos)}개")
+        videos = [found[vid] for vid in video_ids if vid in found]
+        logger.info(
+            f"YouTube 상세 정보 조회 완료: {len(videos)}개 (캐시 {len(video_ids) - len(missing)}개)"
+        )
         return videos
 
     def _filter_and_rank(self, videos: list[VideoInfo], payload: RecommendationCreate) -> list[VideoInfo]:
         """영상을 관련성 + 인기도로 필터링/정렬"""
-        exclude_set = expand_exclusions(payload.constraints.exclude)
+        matcher = get_exclusion_matcher(payload.constraints.exclude)
 
         filtered = []
         for video in videos:
-            title_lower = video.title.lower()
-
             # 제외 재료가 제목에 있으면 스킵
-            if any(e in title_lower for e in exclude_set if e):
+            if matcher.first(video.title):
                 logger.debug(f"제외 재료 포함, 스킵: {video.title}")
                 continue
 
@@ -215,15 +466,102 @@ class YouTubeRecipeAdapter:
         filtered.sort(key=score, reverse=True)
         return filtered
 
-    def _structure_with_haiku(
+    def _extract_from_descriptions(
         self, videos: list[VideoInfo], payload: RecommendationCreate
+    ) -> tuple[list[Recipe], list[VideoInfo]]:
+        """
+        영상 설명에서 레시피 규칙 기반 추출 (최대 3개)
+
+        Returns:
+            (추출된 레시피, Haiku로 넘길 영상 - 신뢰도가 낮거나 조건에 맞지 않은 영상)
+        """
+        matcher = get_exclusion_matcher(payload.constraints.exclude)
+        user_keys = {ingredient_key(i) for i in payload.ingredients}
+        recipes: list[Recipe] = []
+        remaining: list[VideoInfo] = []
+        titles: set[str] = set()
+
+        for video in videos:
+            recipe = None
+            if len(recipes) < 3:
+                parsed = parse_description(video.title, video.description)
+                recipe = self._recipe_from_parsed(parsed, video, payload, matcher, user_keys)
+            if recipe is None or recipe.title in titles:
+                remaining.append(video)
+                continue
+            titles.add(recipe.title)
+            recipes.append(recipe)
+        return recipes, remaining
+
+    def _recipe_from_parsed(
+        self,
+        parsed: ParsedRecipe,
+        video: VideoInfo,
+        payload: RecommendationCreate,
+        matcher: ExclusionMatcher,
+        user_keys: set[str],
+    ) -> Recipe | None:
+        """추출 결과 → Recipe (신뢰도 부족, 보유 재료 미사용, 시간 초과, 제외 재료 포함 시 None)"""
+        if not parsed.is_confident:
+            return None
+        if not user_keys & {ingredient_key(i) for i in parsed.ingredients}:
+            return None
+
+        time_limit = payload.constraints.time_limit_min
+        if parsed.time_min is not None and parsed.time_min > time_limit:
+            return None
+        # 설명에 조리 시간이 없으면 단계당 약 4분으로 추정 (10분 ~ 시간 제한)
+        time_min = parsed.time_min or min(max(4 * len(parsed.steps), 10), time_limit)
+
+        if matcher.first(" ".join([parsed.title, *parsed.ingredients, *parsed.steps])):
+            return None
+
+        tips = []
+        if parsed.quantities:
+            amounts = ", ".join(
+                f"{name} {qty}" for name, qty in list(parsed.quantities.items())[:8]
+            )
+            tips.append(f"영상 기준 분량: {amounts}")
+
+        return Recipe(
+            title=parsed.title,
+            time_min=time_min,
+            servings=parsed.servings or payload.constraints.servings,
+            summary=f"{video.channel_title} 영상 레시피 (조회수 {video.view_count:,}회)"[:50],
+            image_url=None,
+            ingredients_total=parsed.ingredients,
+            ingredients_have=[],
+            ingredients_need=[],
+            steps=parsed.steps,
+            tips=tips,
+            warnings=[],
+        )
+
+    def _structure_with_haiku(
+        self,
+        videos: list[VideoInfo],
+        payload: RecommendationCreate,
+        tenant: LLMTenant | None = None,
+        usage: UsageMeter | None = None,
+        count: int = 3,
+        taken_titles: list[str] | None = None,
     ) -> list[Recipe]:
-        """Haiku 4.5로 영상 메타데이터에서 레시피 구조화"""
+        """
+        Haiku 4.5로 영상 메타데이터에서 레시피 구조화
+
+        Args:
+            count: 생성할 레시피 수 (설명 추출로 채우지 못한 개수)
+            taken_titles: 이미 추출된 레시피 제목 (중복 방지)
+        """
         # 영상 정보를 텍스트로 변환
+        # 설명은 재료/조리 순서 관련 줄만 토큰 예산 안에서 (기존 앞 500자 자르기 대비 절감량 기록)
         video_summaries = []
+        tokens_before = tokens_after = 0
         for i, v in enumerate(videos, 1):
-            # 설명은 500자까지만 (토큰 절약)
-            desc = v.description[:500] if v.description else "(설명 없음)"
+            desc = condense_description(v.description, settings.haiku_description_token_budget)
+            tokens_before += estimate_tokens(v.description[:500])
+            tokens_after += estimate_tokens(desc)
+            desc = desc or "(설명 없음)"
             video_summaries.append(
                 f"[영상 {i}] 제목: {v.title}\n"
                 f"채널: {v.channel_title}\n"
@@ -237,64 +575,66 @@ class YouTubeRecipeAdapter:
         expanded_exclude = expand_exclusions(payload.constraints.exclude)
         exclude_str = ", ".join(sorted(expanded_exclude)) if expanded_exclude else "없음"
 
-        system_prompt = """당신은 한국 가정 요리 전문가입니다. YouTube 영상 정보를 분석하여 레시피를 구조화합니다.
-
-규칙:
-1. 정확히 3개의 서로 다른 레시피를 생성
-2. 각 레시피는 4-8개의 조리 단계
-3. 모든 텍스트는 한국어
-4. 시간 제한을 반드시 준수
-5. 제외 재료는 어떤 형태로도 사용 금지
-6. 영상 정보를 참고하되, 실제로 실현 가능한 레시피로 구성
-7. 재료명은 분량/수량 없이 재료명만 (예: "계란" O, "계란 2개" X)
-8. 반드시 한 끼 식사(또는 든든한 간식)로 먹을 수 있는 실제 요리만 추천
-   - 양념, 소스, 오일, 드레싱, 조미료만 만드는 레시피는 절대 포함 금지
-   - 예: "마늘 고추기름", "간장 소스", "양념장", "장아찌" 등은 요리가 아닙니다
-   - 재료가 적더라도 볶음밥, 국, 전, 볶음 등 실제 요리를 만들어야 합니다
-
-출력: JSON 배열만 반환 (마크다운/설명 없이)
-각 레시피 필드: title, time_min, servings, summary, ingredients_total, steps, tips, warnings"""
-
-        user_prompt = f"""아래 YouTube 영상 정보를 분석하여, 사용자 조건에 맞는 레시피 3개를 JSON으로 구조화해주세요.
+        taken = (
+            f"\n이미 선택된 레시피 (중복 금지): {', '.join(taken_titles)}" if taken_titles else ""
+        )
 
-중요: 반드시 한 끼 식사로 먹을 수 있는 실제 요리만 추천하세요!
-양념/소스/오일/장아찌/조미료 레시피는 절대 포함하지 마세요.
-사용자 재료가 양념류(마늘, 고추, 파 등)뿐이더라도 밥, 계란, 면 등 기본 식재료를 추가하여 실제 식사가 되는 요리를 만드세요.
+        user_prompt = f"""아래 YouTube 영상 정보를 분석하여, 사용자 조건에 맞는 레시피 {count}개를 JSON으로 구조화해주세요.
 
 === 사용자 조건 ===
-보유 재료: {', '.join(payload.ingredients)}
+보유 재료: {", ".join(payload.ingredients)}
 조리 시간 제한: {payload.constraints.time_limit_min}분 이내
 인분: {payload.constraints.servings}인분
-제외 재료 (파생 포함): {exclude_str}
+제외 재료 (파생 포함): {exclude_str}{taken}
 
 === YouTube 영상 정보 ===
 {videos_text}
 
-=== 출력 형식 ===
-[
-  {{
-    "title": "레시피 제목 (20자 이내)",
-    "time_min": 조리시간(분),
-    "servings": 인분수,
-    "summary": "한 줄 설명 (50자 이내)",
-    "ingredients_total": ["재료1", "재료2", ...],
-    "steps": ["단계1", "단계2", ...],
-    "tips": ["팁1"],
-    "warnings": ["주의사항1"]
-  }},
-  ...
-]
-
 JSON 배열만 출력하세요."""
 
-        logger.info("Haiku로 레시피 구조화 시작")
-        response = self.haiku_client.messages.create(
-            model=settings.haiku_model,
-            max_tokens=settings.haiku_max_tokens,
-            temperature=settings.haiku_temperature,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_prompt}],
+        # 설명 토큰 수는 estimate_tokens 근사치 (실제 입력 토큰은 응답 usage로 따로 기록)
+        saved = tokens_before - tokens_after
+        logger.info(
+            f"Haiku로 레시피 구조화 시작 (설명 토큰 추정치 {tokens_before} → {tokens_after}, "
+            f"추정 절감 {saved} ({saved / max(tokens_before, 1):.0%}))"
         )
+        with llm_scheduler.slot(tenant):
+            call_started = time.monotonic()
+            try:
+                response = self.haiku_client.messages.create(
+                    model=settings.haiku_model,
+                    max_tokens=settings.haiku_max_tokens,
+                    temperature=settings.haiku_temperature,
+                    # Haiku 최소 캐시 길이(2048토큰)보다 짧아 cache_control을 붙이지 않음
+                    system=HAIKU_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": user_prompt}],
+                )
+            except Exception:
+                model_router.record(
+                    settings.haiku_model,
+                    time.monotonic() - call_started,
+                    ok=False,
+                    task="youtube_structure",
+                )
+                if usage:
+                    usage.record_failure("anthropic", settings.haiku_model, "haiku_structuring")
+                raise
+        # 구조화 호출 통계는 추천 라우팅과 분리해 집계 (모니터링용)
+        model_router.record(
+            settings.haiku_model,
+            time.monotonic() - call_started,
+            ok=True,
+            task="youtube_structure",
+        )
+        if usage:
+            usage.record_message("anthropic", settings.haiku_model, "haiku_structuring", response)
+        response_usage = getattr(response, "usage", None)
+        if response_usage is not None:
+            logger.info(
+                f"Haiku 구조화 실제 토큰: 입력 {response_usage.input_tokens}, "
+                f"출력 {response_usage.output_tokens} (영상 {len(videos)}개, "
+                f"설명 추정치 {tokens_after})"
+            )
 
         content = response.content[0].text
         logger.debug(f"Haiku 응답: {content[:200]}...")
@@ -320,8 +660,8 @@ JSON 배열만 출력하세요."""
             )
             recipes.append(recipe)
 
-        if len(recipes) != 3:
-            raise ValueError(f"Haiku가 {len(recipes)}개 레시피 생성 (3개 필요)")
+        if len(recipes) != count:
+            raise ValueError(f"Haiku가 {len(recipes)}개 레시피 생성 ({count}개 필요)")
 
         logger.info(f"YouTube+Haiku 레시피 생성 성공: {[r.title for r in recipes]}")
         return recipes
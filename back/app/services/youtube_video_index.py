@@ -0,0 +1,231 @@
+"""
+YouTube 영상 재료 역색인
+
+요청마다 받아 온 영상 메타데이터를 `youtube_videos` 테이블에 쌓고,
+제목/설명에서 뽑은 정규화 재료 키 → 영상 ID 역색인을 메모리에 유지합니다.
+입력 재료를 이미 충분히 덮는 영상이 쌓여 있으면 search.list(호출당 할당량 100) 없이
+로컬에서 후보 영상을 고르고, 처음 보는 재료 조합만 YouTube 검색을 호출합니다.
+
+- 재료 키: 설명 규칙 기반 추출 재료 + 제목/설명에 단어로 등장하는 검색 재료 (조사 제거 후 비교,
+  "파"가 "파인애플"에 매칭되지 않음)
+- 메모리에는 역색인/조회수/수집 시각만 두고 설명 본문은 선택된 후보만 DB에서 읽음
+- 갱신: 저장 즉시 반영 + 앱 시작 시 백그라운드 전체 색인 + `fetched_at` 워터마크 증분 동기화
+  (같은 시각에 늦게 커밋된 행도 읽도록 `>=` + 반영한 영상 ID로 중복 제거)
+- 오래된 영상(MAX_AGE_DAYS 초과)은 후보에서 제외 (다시 검색되면 갱신)
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.youtube_video import YouTubeVideo
+from app.services.description_parser import parse_description
+from app.services.ingredient_normalizer import ingredient_key
+from app.services.recipe_index import SYNC_BATCH_SIZE, SYNC_INTERVAL_SECONDS, Watermark
+
+if TYPE_CHECKING:
+    from app.services.youtube_adapter import VideoInfo
+
+logger = logging.getLogger(__name__)
+
+MAX_AGE_DAYS = 30
+QUERY_INGREDIENTS = 3  # YouTube 검색 쿼리와 같은 기준 (상위 재료 3개)
+MIN_CANDIDATES = 8  # 이만큼 후보가 있어야 search.list 생략
+MIN_PER_INGREDIENT = 3  # 재료마다 최소 영상 수 (새 재료가 섞인 조합은 검색)
+MAX_CANDIDATES = 15
+
+_WORD = re.compile(r"[0-9a-z가-힣]+")
+# 재료명 뒤에 붙는 조사 (긴 것부터 검사)
+_PARTICLES = (
+    "으로", "이랑", "에서", "까지", "부터",
+    "을", "를", "이", "가", "은", "는", "과", "와", "도", "만", "로", "랑", "에", "의",
+)  # fmt: skip
+# 다른 단어 안에 흔히 들어가는 한 글자 재료 키 - 단어로 등장할 때만 매칭
+# (파스타의 파, 김치의 김, 무침의 무, 꿀팁의 꿀, 하면의 면, 한국의 국 등)
+_WHOLE_WORD_KEYS = frozenset(
+    {"파", "무", "배", "김", "콩", "굴", "깨", "꿀", "면", "전", "국", "알", "차", "술"}
+)
+
+
+def _word_keys(text: str) -> set[str]:
+    """텍스트 → 단어별 재료 키 집합 (단어 그대로 + 조사를 뗀 형태, 각각 정규화)"""
+    keys: set[str] = set()
+    for word in _WORD.findall(text.lower()):
+        keys.add(ingredient_key(word))
+        for particle in _PARTICLES:
+            if word.endswith(particle) and len(word) > len(particle):
+                keys.add(ingredient_key(word[: -len(particle)]))
+                break
+    return keys
+
+
+def _mentions(part: str, word_keys: set[str], words: list[str]) -> bool:
+    """재료 키 조각이 단어로, 또는 합성어 일부로 등장하는지 (계란말이, 김치볶음밥)"""
+    if part in word_keys:
+        return True
+    if part in _WHOLE_WORD_KEYS:
+        return False
+    return any(part in word for word in words)
+
+
+def extract_ingredient_keys(video: VideoInfo, hints: list[str]) -> list[str]:
+    """영상 → 재료 키 (설명 추출 재료 + 제목/설명에 등장하는 검색 재료)"""
+    keys = {
+        ingredient_key(i) for i in parse_description(video.title, video.description).ingredients
+    }
+    text = f"{video.title}\n{video.description}"
+    word_keys = _word_keys(text)
+    words = _WORD.findall(text.lower())
+    keys.update(
+        key
+        for key in map(ingredient_key, hints)
+        if key and all(_mentions(part, word_keys, words) for part in key.split())
+    )
+    keys.discard("")
+    return sorted(keys)
+
+
+class YouTubeVideoIndex:
+    """재료 키 → 영상 ID 역색인"""
+
+    def __init__(self):
+        self._postings: dict[str, set[str]] = {}
+        self._keys: dict[str, list[str]] = {}  # 영상 ID → 재료 키 (갱신 시 기존 색인 제거용)
+        self._views: dict[str, int] = {}
+        self._fetched: dict[str, datetime] = {}
+        self._watermark = Watermark()
+        self._last_sync = 0.0
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _index(self, video_id: str, keys: list[str], view_count: int, fetched_at: datetime) -> None:
+        with self._lock:
+            for key in self._keys.get(video_id, []):
+                self._postings.get(key, set()).discard(video_id)
+            for key in keys:
+                self._postings.setdefault(key, set()).add(video_id)
+            self._keys[video_id] = keys
+            self._views[video_id] = view_count
+            self._fetched[video_id] = fetched_at
+
+    def sync(self, db: Session, force: bool = False) -> int:
+        """워터마크 이후 저장/갱신된 영상 반영 (반영된 영상 수 반환)"""
+        now = time.monotonic()
+        if not force and now - self._last_sync < SYNC_INTERVAL_SECONDS:
+            return 0
+        if not self._sync_lock.acquire(blocking=False):
+            return 0
+        try:
+            self._last_sync = now
+            query = db.query(
+                YouTubeVideo.video_id,
+                YouTubeVideo.ingredient_keys,
+                YouTubeVideo.view_count,
+                YouTubeVideo.fetched_at,
+            )
+            if self._watermark:
+                query = query.filter(YouTubeVideo.fetched_at >= self._watermark.at)
+
+            added = 0
+            for video_id, keys, view_count, fetched_at in query.order_by(
+                YouTubeVideo.fetched_at, YouTubeVideo.video_id
+            ).yield_per(SYNC_BATCH_SIZE):
+                if not self._watermark.is_new(video_id, fetched_at):
+                    continue
+                self._index(video_id, keys or [], view_count, fetched_at)
+                self._watermark.advance(video_id, fetched_at)
+                added += 1
+        finally:
+            self._sync_lock.release()
+
+        if added:
+            logger.info(f"YouTube 영상 색인 동기화: +{added}개 (전체 {len(self)}개)")
+        return added
+
+    def warm_up(self) -> None:
+        """앱 시작 시 전체 색인 (백그라운드 스레드에서 호출)"""
+        db = SessionLocal()
+        try:
+            start = time.monotonic()
+            added = self.sync(db, force=True)
+            logger.info(f"YouTube 영상 색인 초기화: {added}개, {time.monotonic() - start:.1f}초")
+        except Exception as e:
+            logger.warning(f"YouTube 영상 색인 초기화 실패: {e}")
+        finally:
+            db.close()
+
+    def save(self, db: Session, videos: list[VideoInfo], hints: list[str]) -> None:
+        """조회한 영상 저장(있으면 갱신) + 즉시 색인"""
+        fetched_at = datetime.utcnow()
+        indexed = []
+        for video in videos:
+            keys = extract_ingredient_keys(video, hints)
+            db.merge(
+                YouTubeVideo(
+                    video_id=video.video_id,
+                    title=video.title[:300],
+                    description=video.description,
+                    view_count=video.view_count,
+                    channel_title=video.channel_title[:200],
+                    ingredient_keys=keys,
+                    fetched_at=fetched_at,
+                )
+            )
+            indexed.append((video.video_id, keys, video.view_count))
+        db.commit()
+        for video_id, keys, view_count in indexed:
+            self._index(video_id, keys, view_count, fetched_at)
+
+    def candidates(self, db: Session, ingredients: list[str]) -> list[YouTubeVideo] | None:
+        """
+        입력 재료로 로컬 후보 영상 선택
+
+        Returns:
+            재료 일치 수 → 조회수 순 영상 (최대 MAX_CANDIDATES개),
+            색인이 이 재료 조합을 충분히 덮지 못하면 None (search.list 필요)
+        """
+        self.sync(db)
+        keys = list(dict.fromkeys(k for k in map(ingredient_key, ingredients) if k))
+        keys = keys[:QUERY_INGREDIENTS]
+        if not keys:
+            return None
+
+        cutoff = datetime.utcnow() - timedelta(days=MAX_AGE_DAYS)
+        with self._lock:
+            postings = [
+                {vid for vid in self._postings.get(key, ()) if self._fetched[vid] >= cutoff}
+                for key in keys
+            ]
+            if any(len(p) < MIN_PER_INGREDIENT for p in postings):
+                return None
+
+            matches: dict[str, int] = {}
+            for posting in postings:
+                for vid in posting:
+                    matches[vid] = matches.get(vid, 0) + 1
+            required = min(2, len(keys))
+            ranked = sorted(
+                (vid for vid, count in matches.items() if count >= required),
+                key=lambda vid: (-matches[vid], -self._views[vid]),
+            )
+        if len(ranked) < MIN_CANDIDATES:
+            return None
+
+        selected = ranked[:MAX_CANDIDATES]
+        rows = db.query(YouTubeVideo).filter(YouTubeVideo.video_id.in_(selected)).all()
+        order = {vid: i for i, vid in enumerate(selected)}
+        return sorted(rows, key=lambda row: order[row.video_id])
+
+
+youtube_video_index = YouTubeVideoIndex()
@@ -0,0 +1,153 @@
+"""
+레시피 마이크로 배처 벤치마크 스크립트
+
+Mock provider 레시피로 응답하는 가짜 Anthropic 클라이언트를 사용해
+배칭 유무에 따른 외부 호출 수와 호출당 처리 요청 수를 비교합니다. (API 키 불필요)
+
+Usage:
+    python bench_recipe_batcher.py
+    python bench_recipe_batcher.py --requests 200 --window-ms 50 --batch-size 4 --latency-ms 800
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config import settings
+from app.models.recommendation import Constraints, RecommendationCreate
+from app.services.llm_adapter import MockRecipeLLMAdapter, RecipeLLMAdapter
+from app.services.llm_scheduler import llm_scheduler
+from app.services.recipe_batcher import RecipeMicroBatcher
+
+INGREDIENT_POOL = ["계란", "김치", "양파", "두부", "밥", "대파", "감자", "참치", "햄", "버섯"]
+
+
+class MockAnthropicClient:
+    """
+    Mock 어댑터 레시피로 응답하는 Anthropic 호환 클라이언트 (호출 수/입력 크기 집계)
+
+    응답 시간은 출력 토큰 생성이 좌우하므로 호출 지연 = 요청당 지연 × 호출에 담긴 요청 수
+    """
+
+    def __init__(self, latency_ms: int):
+        self.latency = latency_ms / 1000
+        self.calls = 0
+        self.input_chars = 0
+        self._lock = threading.Lock()
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, *, system: list[dict], messages: list[dict], **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.input_chars += sum(len(block["text"]) for block in system)
+            self.input_chars += sum(len(m["content"]) for m in messages)
+
+        user_prompt = messages[0]["content"]
+        request_ids = re.findall(r"=== 요청 (\d+) ===", user_prompt)
+        time.sleep(self.latency * max(1, len(request_ids)))
+
+        payload = RecommendationCreate(ingredients=["계란"])
+        recipes = [
+            r.model_dump(
+                include={"title", "time_min", "servings", "summary", "ingredients_total", "steps"}
+            )
+            for r in MockRecipeLLMAdapter().generate_recipes(payload)
+        ]
+        if request_ids:
+            text = json.dumps({rid: recipes for rid in request_ids}, ensure_ascii=False)
+        else:
+            text = json.dumps(recipes, ensure_ascii=False)
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def build_payloads(n: int) -> list[RecommendationCreate]:
+    payloads = []
+    for i in range(n):
+        ingredients = [INGREDIENT_POOL[(i + k) % len(INGREDIENT_POOL)] for k in range(2 + i % 3)]
+        payloads.append(
+            RecommendationCreate(
+                ingredients=ingredients, constraints=Constraints(time_limit_min=15)
+            )
+        )
+    return payloads
+
+
+async def run_unbatched(payloads: list[RecommendationCreate], latency_ms: int) -> dict:
+    client = MockAnthropicClient(latency_ms)
+    adapter = RecipeLLMAdapter(client=client)
+    start = time.monotonic()
+    await asyncio.gather(*(asyncio.to_thread(adapter.generate_recipes, p) for p in payloads))
+    return {"elapsed": time.monotonic() - start, "calls": client.calls, "chars": client.input_chars}
+
+
+async def run_batched(
+    payloads: list[RecommendationCreate], latency_ms: int, window_ms: int, batch_size: int
+) -> dict:
+    client = MockAnthropicClient(latency_ms)
+    batcher = RecipeMicroBatcher(
+        adapter_factory=lambda: RecipeLLMAdapter(client=client),
+        window_ms=window_ms,
+        max_batch_size=batch_size,
+    )
+    start = time.monotonic()
+    await asyncio.gather(*(batcher.submit(p) for p in payloads))
+    return {
+        "elapsed": time.monotonic() - start,
+        "calls": client.calls,
+        "chars": client.input_chars,
+        "fallbacks": batcher.fallback_calls,
+    }
+
+
+def print_result(name: str, n: int, result: dict) -> None:
+    print(f"[{name}]")
+    print(f"  외부 호출 수: {result['calls']}")
+    print(f"  호출당 요청 수: {n / result['calls']:.2f}")
+    print(f"  요청당 입력 문자 수: {result['chars'] / n:,.0f}")
+    print(f"  처리량: {n / result['elapsed']:.1f} req/s ({result['elapsed']:.2f}초)")
+    if "fallbacks" in result:
+        print(f"  개별 폴백: {result['fallbacks']}")
+    print()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="레시피 마이크로 배처 벤치마크")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--window-ms", type=int, default=settings.llm_batch_window_ms)
+    parser.add_argument("--batch-size", type=int, default=settings.llm_batch_max_size)
+    parser.add_argument(
+        "--latency-ms", type=int, default=200, help="가짜 API 요청당 응답 생성 지연"
+    )
+    args = parser.parse_args()
+
+    # 스케줄러 동시 호출 상한이 벤치마크를 제한하지 않도록 충분히 크게 잡음
+    llm_scheduler.max_concurrency = args.requests
+    llm_scheduler.per_tenant_concurrency = args.requests
+
+    payloads = build_payloads(args.requests)
+    print("=" * 60)
+    print(
+        f"마이크로 배처 벤치마크: 요청 {args.requests}개, 창 {args.window_ms}ms, "
+        f"배치 {args.batch_size}개, 요청당 지연 {args.latency_ms}ms"
+    )
+    print("=" * 60)
+
+    print_result("배칭 없음", args.requests, await run_unbatched(payloads, args.latency_ms))
+    print_result(
+        "마이크로 배칭",
+        args.requests,
+        await run_batched(payloads, args.latency_ms, args.window_ms, args.batch_size),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
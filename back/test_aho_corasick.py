@@ -0,0 +1,41 @@
+"""
+Aho-Corasick 다중 패턴 검색 테스트
+
+실행 방법:
+   python -m pytest test_aho_corasick.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.aho_corasick import AhoCorasick
+
+
+def test_overlapping_matches():
+    automaton = AhoCorasick(["볶음밥", "김치볶음밥", "김치"])
+
+    matches = sorted(automaton.finditer("김치볶음밥"))
+
+    assert matches == [(0, 2, "김치"), (0, 5, "김치볶음밥"), (2, 5, "볶음밥")]
+
+
+def test_failure_links_restart_mid_pattern():
+    """접두사가 겹치는 패턴에서 실패 링크를 따라 다음 매칭을 놓치지 않음"""
+    automaton = AhoCorasick(["he", "she", "hers"])
+
+    assert sorted(automaton.finditer("ushers")) == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_repeated_occurrences():
+    automaton = AhoCorasick(["파"])
+
+    assert [start for start, _, _ in automaton.finditer("대파 쪽파")] == [1, 4]
+
+
+def test_no_match_and_empty_patterns():
+    automaton = AhoCorasick(["계란", ""])
+
+    assert list(automaton.finditer("두부 조림")) == []
+    assert len(automaton) == 1
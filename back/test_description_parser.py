@@ -0,0 +1,146 @@
+"""
+YouTube 영상 설명 규칙 기반 추출 테스트
+
+설명만으로 레시피를 만들면 Haiku 호출을 건너뛰므로,
+신뢰도 판단과 재료/단계 분리가 틀리면 잘못된 레시피가 그대로 나갑니다.
+
+실행 방법:
+   python -m pytest test_description_parser.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.description_parser import (
+    clean_title,
+    condense_description,
+    estimate_tokens,
+    parse_description,
+)
+
+KIMCHI_FRIED_RICE = """오늘은 백종원 스타일 김치볶음밥을 만들어 볼게요!
+구독과 좋아요 부탁드려요 ❤️
+
+[재료] (2인분)
+밥 2공기, 김치 1컵, 대파 1/2대
+돼지고기 100g, 설탕 0.5큰술
+0.5큰술 소금
+참기름 약간
+
+[만드는 법]
+1. 대파를 송송 썰어 파기름을 낸다
+2. 돼지고기를 넣고 볶는다
+3. 김치와 설탕을 넣고 충분히 볶는다
+4. 밥을 넣고 골고루 섞어 볶는다
+5. 참기름을 두르고 마무리
+
+조리시간: 15분
+#김치볶음밥 #자취요리
+https://instagram.com/cook
+"""
+
+SCRAMBLED_EGGS = """재료: 계란 3개, 우유 100ml, 소금 약간, 버터 1큰술
+① 계란을 풀고 우유와 소금을 섞어요
+② 팬에 버터를 녹여요
+③ 약불에서 천천히 저어가며 익혀요
+④ 촉촉할 때 불을 끄면 완성
+00:00 인트로
+01:30 재료 소개
+"""
+
+VLOG = """안녕하세요 여러분 오늘도 찾아와 주셔서 감사합니다
+협찬: 쿠팡
+BGM: Music by xxx
+"""
+
+
+def test_sectioned_description():
+    parsed = parse_description("김치볶음밥 황금레시피 | 초간단 자취요리", KIMCHI_FRIED_RICE)
+
+    assert parsed.title == "김치볶음밥"
+    assert parsed.ingredients == ["밥", "김치", "대파", "돼지고기", "설탕", "소금", "참기름"]
+    assert parsed.quantities["대파"] == "1/2대"
+    assert parsed.quantities["설탕"] == "0.5큰술"
+    assert parsed.steps[0] == "대파를 송송 썰어 파기름을 낸다"
+    assert len(parsed.steps) == 5
+    assert parsed.servings == 2
+    assert parsed.time_min == 15
+    assert parsed.is_confident
+
+
+def test_decimal_quantity_is_not_a_step():
+    """소수 분량 줄("0.5큰술 소금")이 "5큰술 소금" 단계가 되어 섹션이 단계로 바뀌면 안 됨"""
+    parsed = parse_description("김치볶음밥", KIMCHI_FRIED_RICE)
+
+    assert all("큰술" not in step for step in parsed.steps)
+    assert "소금" in parsed.ingredients
+    assert "참기름" in parsed.ingredients  # 소수 분량 줄 뒤에도 재료 섹션 유지
+
+
+def test_metadata_line_is_not_a_step():
+    parsed = parse_description("김치볶음밥", KIMCHI_FRIED_RICE)
+
+    assert all("조리시간" not in step for step in parsed.steps)
+
+
+def test_inline_ingredients_and_circled_steps():
+    parsed = parse_description("[EN] 촉촉한 스크램블 에그 만들기 #shorts", SCRAMBLED_EGGS)
+
+    assert parsed.ingredients == ["계란", "우유", "소금", "버터"]
+    assert parsed.quantities == {"계란": "3개", "우유": "100ml", "소금": "약간", "버터": "1큰술"}
+    assert len(parsed.steps) == 4
+    assert parsed.is_confident
+
+
+def test_timestamps_are_not_steps():
+    parsed = parse_description("스크램블 에그", SCRAMBLED_EGGS)
+
+    assert not any("인트로" in step or "재료 소개" in step for step in parsed.steps)
+
+
+def test_description_without_recipe_is_not_confident():
+    parsed = parse_description("브이로그", VLOG)
+
+    assert parsed.ingredients == []
+    assert parsed.steps == []
+    assert not parsed.is_confident
+
+
+def test_too_few_steps_is_not_confident():
+    description = "재료: 계란 2개, 대파 1대, 소금 약간\n1. 계란을 풀어요\n2. 부쳐요"
+    parsed = parse_description("계란말이", description)
+
+    assert len(parsed.ingredients) == 3
+    assert not parsed.is_confident
+
+
+def test_long_step_list_is_merged():
+    steps = "\n".join(f"{i}. 재료를 넣고 {i}분 볶아요" for i in range(1, 13))
+    parsed = parse_description("볶음", f"재료: 양파 1개, 당근 1개, 감자 1개\n{steps}")
+
+    assert len(parsed.steps) == 8
+    assert "1분" in parsed.steps[0]
+    assert "12분" in parsed.steps[-1]
+
+
+def test_clean_title():
+    assert clean_title("[EN] 초간단 김치찌개 황금레시피!! 자취생 필수") == "김치찌개"
+    assert clean_title("🍳 계란말이 | 도시락 반찬") == "계란말이"
+
+
+def test_condense_keeps_recipe_lines():
+    condensed = condense_description(KIMCHI_FRIED_RICE, budget=200)
+
+    assert "밥 2공기, 김치 1컵, 대파 1/2대" in condensed
+    assert "1. 대파를 송송 썰어 파기름을 낸다" in condensed
+    assert "구독" not in condensed
+    assert "instagram" not in condensed
+    assert estimate_tokens(condensed) < estimate_tokens(KIMCHI_FRIED_RICE)
+
+
+def test_condense_respects_budget():
+    condensed = condense_description(KIMCHI_FRIED_RICE, budget=30)
+
+    assert estimate_tokens(condensed) <= 30
@@ -0,0 +1,76 @@
+"""
+제외 재료(알러지) 매처 테스트
+
+실행 방법:
+   python -m pytest test_exclusion_matcher.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.data.allergen_derivatives import expand_exclusions, get_all_derivatives
+from app.services.exclusion_matcher import get_exclusion_matcher
+
+
+@pytest.mark.parametrize(
+    ("exclude", "text"),
+    [
+        ("게", "털게찜"),
+        ("게", "꽃게탕"),
+        ("게", "게살 볶음밥"),
+        ("콩", "강낭콩 조림"),
+        ("콩", "완두콩밥"),
+        ("콩", "콩나물국"),
+        ("밀", "호밀빵"),
+        ("밀", "통밀 파스타"),
+        ("빵", "크림빵"),
+        ("빵", "식빵 토스트"),
+        ("갑각류", "새우젓 약간"),
+        ("우유", "모짜렐라 치즈"),
+    ],
+)
+def test_compounds_are_blocked(exclude, text):
+    assert get_exclusion_matcher([exclude]).first(text) is not None
+
+
+@pytest.mark.parametrize(
+    ("exclude", "text"),
+    [
+        ("게", "맛있게 볶아주세요"),
+        ("게", "양파를 잘게 썰어요"),
+        ("게", "노릇하게 구워주세요"),
+        ("밀", "비밀 레시피"),
+        ("밀", "밀폐 용기에 보관"),
+        ("빵", "빵빵하게 부푼 반죽"),
+    ],
+)
+def test_known_false_positives_are_ignored(exclude, text):
+    assert get_exclusion_matcher([exclude]).first(text) is None
+
+
+def test_false_positive_does_not_hide_real_match():
+    matches = get_exclusion_matcher(["게"]).find_all("맛있게 끓인 꽃게탕")
+    assert matches
+    assert all(m.start >= 7 for m in matches)  # "맛있게"의 게(2)는 무시, "꽃게"만 매칭
+
+
+def test_find_all_reports_positions():
+    matches = get_exclusion_matcher(["계란"]).find_all("계란말이와 달걀국")
+    assert [(m.term, m.start, m.end) for m in matches] == [("계란", 0, 2), ("달걀", 6, 8)]
+
+
+def test_empty_exclusions_match_nothing():
+    matcher = get_exclusion_matcher([" ", ""])
+    assert not matcher
+    assert matcher.first("새우") is None
+
+
+def test_derivatives_closure():
+    assert "새우젓" in get_all_derivatives("갑각류")
+    assert "새우젓" in get_all_derivatives("새우")
+    assert get_all_derivatives("감자") == frozenset({"감자"})
+    assert expand_exclusions(["우유", " 우유 "]) == get_all_derivatives("우유")
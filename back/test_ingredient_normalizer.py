@@ -0,0 +1,57 @@
+"""
+재료명 정규화 테스트
+
+실행 방법:
+   python -m pytest test_ingredient_normalizer.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.ingredient_normalizer import (
+    ingredient_key,
+    normalize_ingredient,
+    split_quantities,
+)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("신선한 계란 1개", "계란"),
+        ("달걀 2개", "계란"),
+        ("김치 100g", "김치"),
+        ("다진 마늘 1큰술", "마늘"),
+        ("채썬 양파", "양파"),
+        ("굵게 썬 대파 1/2대", "대파"),
+        ("우유 0.5컵", "우유"),
+        ("소금 약간", "소금"),
+        ("간장 2T", "간장"),
+        ("", ""),
+    ],
+)
+def test_normalize_ingredient(raw, expected):
+    assert normalize_ingredient(raw) == expected
+
+
+def test_ingredient_key_is_lowercase():
+    assert ingredient_key("Mozzarella 100g") == "mozzarella"
+
+
+def test_split_quantities_without_commas():
+    assert split_quantities("돼지고기 200g 양파 1/2개") == [("돼지고기", "200g"), ("양파", "1/2개")]
+
+
+def test_split_quantities_words():
+    assert split_quantities("소금 약간") == [("소금", "약간")]
+    assert split_quantities("후추") == [("후추", None)]
+    assert split_quantities("부추 한 줌") == [("부추", "한줌")]
+
+
+def test_split_quantities_leading_quantity():
+    """분량이 앞에 오면 재료명에 분량을 붙이지 않음"""
+    assert split_quantities("0.5큰술 소금") == [("소금", None)]
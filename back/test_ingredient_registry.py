@@ -0,0 +1,59 @@
+"""
+재료 레지스트리 (정수 ID 비트셋) 테스트
+
+실행 방법:
+   python -m pytest test_ingredient_registry.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import app.services.ingredient_registry as registry_module
+from app.services.ingredient_registry import IngredientRegistry, bit_ids
+
+
+def test_bit_ids():
+    assert bit_ids(0) == []
+    assert bit_ids(0b101001) == [0, 3, 5]
+    assert bit_ids(1 << 200) == [200]
+
+
+def test_normalized_ingredients_share_an_id():
+    registry = IngredientRegistry()
+
+    assert registry.id_of("달걀 2개") == registry.id_of("계란")
+    assert registry.id_of("다진 마늘 1큰술") == registry.id_of("마늘")
+    assert registry.id_of("") is None
+    assert len(registry) == 2
+
+
+def test_mask_intersection_counts_matches():
+    registry = IngredientRegistry()
+    recipe = registry.mask(["계란 2개", "대파 1대", "밥 1공기"], register=True)
+    user = registry.mask(["달걀", "밥", "김치"])
+
+    assert (user & recipe).bit_count() == 2
+    assert registry.names(user & recipe) == ["계란", "밥"]
+
+
+def test_user_mask_does_not_register():
+    """사용자 입력은 조회만 - 처음 보는 재료로 레지스트리가 커지지 않음"""
+    registry = IngredientRegistry()
+    registry.mask(["계란"], register=True)
+
+    assert registry.mask(["계란", "처음보는재료"]) == 1
+    assert registry.lookup("처음보는재료") is None
+    assert len(registry) == 1
+
+
+def test_registry_is_capped(monkeypatch):
+    monkeypatch.setattr(registry_module, "MAX_INGREDIENTS", 2)
+    registry = IngredientRegistry()
+
+    assert registry.id_of("계란") == 0
+    assert registry.id_of("양파") == 1
+    assert registry.id_of("마늘") is None
+    assert registry.id_of("계란") == 0  # 이미 등록된 재료는 계속 조회
+    assert len(registry) == 2
@@ -0,0 +1,77 @@
+"""
+재료 자동완성 (자모/초성 트라이) 테스트
+
+실행 방법:
+   python -m pytest test_ingredient_suggest.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.ingredient_suggest import (
+    TOP_N,
+    IngredientSuggester,
+    PrefixTrie,
+    is_chosung_query,
+    to_chosung,
+    to_jamo,
+)
+
+
+def test_to_jamo_decomposes_compound_vowels_and_finals():
+    assert to_jamo("계란") == "ㄱㅖㄹㅏㄴ"
+    assert to_jamo("닭") == "ㄷㅏㄹㄱ"
+    assert to_jamo("과") == "ㄱㅗㅏ"
+    assert to_jamo("ㅘ") == "ㅗㅏ"
+
+
+def test_chosung():
+    assert to_chosung("계란 말이") == "ㄱㄹㅁㅇ"
+    assert is_chosung_query("ㄱ ㄹ")
+    assert not is_chosung_query("계ㄹ")
+    assert not is_chosung_query("")
+
+
+def test_partial_syllable_prefixes():
+    """입력 중인 음절("곌", "계ㄹ", "계라")도 "계란"의 접두사"""
+    suggester = IngredientSuggester()
+    suggester.add("계란")
+
+    for query in ("계", "곌", "계ㄹ", "계라", "ㄱㄹ"):
+        assert "계란" in suggester.suggest(query), query
+
+
+def test_ranked_by_popularity():
+    suggester = IngredientSuggester()
+    for _ in range(3):
+        suggester.add("감자")
+    suggester.add("감귤")
+
+    assert suggester.suggest("감")[:2] == ["감자", "감귤"]
+
+    for _ in range(5):
+        suggester.add("감귤")
+    assert suggester.suggest("감")[:2] == ["감귤", "감자"]
+
+
+def test_node_keeps_top_n_only():
+    counts = {f"재료{i:02d}": i for i in range(TOP_N + 5)}
+    trie = PrefixTrie(counts)
+    for term in counts:
+        trie.insert(to_jamo(term), term)
+
+    top = trie.lookup(to_jamo("재료"))
+    assert len(top) == TOP_N
+    assert top[0] == f"재료{TOP_N + 4:02d}"
+
+
+def test_lookup_returns_copy():
+    counts = {"양파": 1}
+    trie = PrefixTrie(counts)
+    trie.insert(to_jamo("양파"), "양파")
+
+    trie.lookup("ㅇ").append("오염")
+
+    assert trie.lookup("ㅇ") == ["양파"]
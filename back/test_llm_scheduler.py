@@ -0,0 +1,169 @@
+"""
+LLM 호출 스케줄러 (가중 공정 큐잉) 테스트
+
+실행 방법:
+   python -m pytest test_llm_scheduler.py
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import app.services.llm_adapter as llm_adapter
+from app.models.meal_plan import MealPlanCreate
+from app.services.llm_scheduler import (
+    FairLLMScheduler,
+    LLMTenant,
+    SchedulerTimeoutError,
+    run_llm_call,
+)
+
+USER = LLMTenant(key="user:1", weight=3.0)
+GUEST = LLMTenant(key="guest:1.2.3.4", weight=1.0)
+
+
+def _hold(scheduler, tenant, release: threading.Event, granted: list, name: str, **kwargs):
+    with scheduler.slot(tenant, timeout=5, **kwargs):
+        granted.append(name)
+        release.wait(5)
+
+
+def _start(*args, **kwargs) -> threading.Thread:
+    thread = threading.Thread(target=_hold, args=args, kwargs=kwargs, daemon=True)
+    thread.start()
+    return thread
+
+
+def _wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "조건 대기 시간 초과"
+        time.sleep(0.005)
+
+
+def test_weighted_user_is_served_before_queued_guests():
+    scheduler = FairLLMScheduler(max_concurrency=1, per_tenant_concurrency=4)
+    gate, release = threading.Event(), threading.Event()
+    order: list[str] = []
+
+    blocker = _start(scheduler, LLMTenant("system", 1.0), gate, [], "blocker")
+    _wait_until(lambda: scheduler.get_stats()["active_total"] == 1)
+
+    threads = [_start(scheduler, GUEST, release, order, f"guest{i}") for i in range(3)]
+    _wait_until(lambda: scheduler.get_stats()["queued"] == 3)
+    threads.append(_start(scheduler, USER, release, order, "user"))
+    _wait_until(lambda: scheduler.get_stats()["queued"] == 4)
+
+    release.set()
+    gate.set()
+    for thread in [blocker, *threads]:
+        thread.join(5)
+
+    # 게스트가 먼저 줄을 섰어도 가중치 3인 사용자가 두 번째 게스트보다 먼저
+    assert order.index("user") < order.index("guest1")
+
+
+def test_per_tenant_limit():
+    scheduler = FairLLMScheduler(max_concurrency=8, per_tenant_concurrency=1)
+    release = threading.Event()
+    granted: list[str] = []
+
+    first = _start(scheduler, GUEST, release, granted, "a")
+    second = _start(scheduler, GUEST, release, granted, "b")
+    _wait_until(lambda: len(granted) == 1 and scheduler.get_stats()["queued"] == 1)
+    assert granted == ["a"]  # 전체 슬롯이 남아도 테넌트 상한 1
+
+    release.set()
+    for thread in (first, second):
+        thread.join(5)
+    assert granted == ["a", "b"]
+    assert scheduler.get_stats() == {
+        "active_total": 0,
+        "max_concurrency": 8,
+        "queued": 0,
+        "tenants": 0,
+    }
+
+
+def test_queue_timeout():
+    scheduler = FairLLMScheduler(max_concurrency=1, per_tenant_concurrency=1)
+    release = threading.Event()
+    holder = _start(scheduler, USER, release, [], "holder")
+    _wait_until(lambda: scheduler.get_stats()["active_total"] == 1)
+
+    with pytest.raises(SchedulerTimeoutError), scheduler.slot(GUEST, timeout=0.05):
+        pass
+
+    release.set()
+    holder.join(5)
+    assert scheduler.get_stats()["queued"] == 0
+
+
+def test_waiting_calls_do_not_block_default_executor():
+    """슬롯 대기 중인 LLM 호출이 기본 실행기(asyncio.to_thread)를 점유하지 않음"""
+    scheduler = FairLLMScheduler(max_concurrency=1, per_tenant_concurrency=8)
+
+    def call():
+        with scheduler.slot(GUEST, timeout=5):
+            time.sleep(0.05)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=2))
+        calls = [asyncio.ensure_future(run_llm_call(call)) for _ in range(6)]
+        await asyncio.sleep(0.01)
+        started = loop.time()
+        await asyncio.to_thread(lambda: None)
+        waited = loop.time() - started
+        await asyncio.gather(*calls)
+        return waited
+
+    assert asyncio.run(run()) < 0.05
+
+
+class _MealPlanClient:
+    """호출 수와 최대 동시 호출 수를 기록하는 Anthropic 호환 클라이언트"""
+
+    def __init__(self):
+        self.messages = self
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        recipe = {"title": "계란말이", "ingredients_total": ["계란"], "steps": ["굽기"]}
+        text = json.dumps({str(day): [recipe] for day in range(1, 8)}, ensure_ascii=False)
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def test_meal_plan_uses_fixed_calls_within_tenant_cap(monkeypatch):
+    """식단은 고정된 수의 호출로 나눠 생성하고 테넌트 동시 호출 상한을 넘지 않음"""
+    monkeypatch.setattr(
+        llm_adapter, "llm_scheduler", FairLLMScheduler(max_concurrency=8, per_tenant_concurrency=1)
+    )
+    client = _MealPlanClient()
+
+    days = llm_adapter.RecipeLLMAdapter(client=client).generate_meal_plan(
+        MealPlanCreate(ingredients=["계란"], days=7), tenant=GUEST
+    )
+
+    assert len(days) == 7
+    assert client.calls == llm_adapter.MEAL_PLAN_CALLS
+    assert client.peak == 1
@@ -0,0 +1,47 @@
+"""
+로컬 영양 성분 추정 테스트
+
+실행 방법:
+   python -m pytest test_nutrition_estimator.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.nutrition_estimator import _NAMES, lookup
+
+
+def _matched_name(raw: str) -> str | None:
+    result = lookup(raw)
+    return _NAMES[result[0]] if result else None
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("대파 1대", "대파"),
+        ("다진 마늘 1큰술", "마늘"),
+        ("실파 약간", "파"),
+        ("물 500ml", "물"),
+        ("숙주나물 100g", "숙주"),
+        ("참기름 1큰술", "참기름"),
+    ],
+)
+def test_match(raw, expected):
+    assert _matched_name(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["파인애플 1/4개", "해물 200g", "국물 1컵", "새송이 튀김"])
+def test_single_character_name_needs_suffix_match(raw):
+    """한 글자 재료명("파", "물", "김")이 다른 단어 안에 들어 있다고 매칭하면 안 됨"""
+    assert _matched_name(raw) is None
+
+
+def test_grams_from_quantity():
+    index, grams = lookup("돼지고기 200g")
+    assert _NAMES[index] == "돼지고기"
+    assert grams == 200.0
@@ -0,0 +1,125 @@
+"""
+로컬 레시피 코퍼스 (mmap 바이너리 형식) 테스트
+
+실행 방법:
+   python -m pytest test_recipe_corpus.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.models.recommendation import Constraints, RecommendationCreate
+from app.services.recipe_corpus import (
+    HEADER,
+    MAGIC,
+    CorpusFormatError,
+    RecipeCorpus,
+    build_corpus,
+)
+
+RECORDS = [
+    {
+        "title": "계란볶음밥",
+        "summary": "간단한 한 그릇",
+        "time_min": 10,
+        "servings": 1,
+        "ingredients_total": ["달걀 2개", "밥 1공기", "대파 1/2대"],
+        "steps": ["파기름을 낸다", "계란을 볶는다", "밥을 넣고 볶는다"],
+        "tips": ["찬밥이 좋아요"],
+    },
+    {
+        "title": "두부조림",
+        "time_min": 25,
+        "servings": 2,
+        "ingredients_total": ["두부 1모", "간장 2큰술", "대파"],
+        "steps": ["두부를 굽는다", "양념을 붓고 졸인다"],
+    },
+    {
+        "title": "새우볶음밥",
+        "time_min": 15,
+        "servings": 1,
+        "ingredients_total": ["새우 100g", "밥", "계란"],
+        "steps": ["새우를 볶는다", "밥과 계란을 넣는다"],
+    },
+]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path / "recipes.corpus"
+    assert build_corpus(RECORDS, path) == 3
+    return RecipeCorpus(path)
+
+
+def _payload(ingredients, **constraints):
+    return RecommendationCreate(ingredients=ingredients, constraints=Constraints(**constraints))
+
+
+def test_round_trip(corpus):
+    recipe = corpus.recipe(0)
+
+    assert len(corpus) == 3
+    assert recipe.title == "계란볶음밥"
+    assert recipe.summary == "간단한 한 그릇"
+    assert recipe.time_min == 10
+    assert recipe.ingredients_total == ["달걀 2개", "밥 1공기", "대파 1/2대"]
+    assert recipe.steps[-1] == "밥을 넣고 볶는다"
+    assert recipe.tips == ["찬밥이 좋아요"]
+    assert corpus.recipe(1).tips == []
+
+
+def test_key_postings(corpus):
+    """정규화 키 사전 (달걀 → 계란) + 키별 레시피 목록"""
+    assert list(corpus.postings(corpus.key_id("계란"))) == [0, 2]
+    assert list(corpus.postings(corpus.key_id("대파"))) == [0, 1]
+    assert corpus.key_id("없는재료") is None
+
+
+def test_search_scores_and_filters(corpus):
+    results = corpus.search(_payload(["계란", "밥"], time_limit_min=30), limit=3)
+    assert {r.recipe.title for r in results} == {"계란볶음밥", "새우볶음밥"}
+    assert all(r.coverage == 1.0 for r in results)
+
+    timed = corpus.search(_payload(["대파"], time_limit_min=15))
+    assert [r.recipe.title for r in timed] == ["계란볶음밥"]
+
+    excluded = corpus.search(_payload(["계란", "밥"], time_limit_min=30, exclude=["새우"]))
+    assert [r.recipe.title for r in excluded] == ["계란볶음밥"]
+
+
+def test_skips_invalid_and_duplicate_records(tmp_path):
+    path = tmp_path / "recipes.corpus"
+    records = [
+        *RECORDS,
+        RECORDS[0],  # 중복
+        {"title": "단계 없음", "ingredients_total": ["계란"], "steps": []},
+        {**RECORDS[1], "title": "음수 시간", "time_min": -5},
+        {**RECORDS[1], "title": "범위 초과", "servings": 2**40},
+        {**RECORDS[1], "title": "숫자 아님", "time_min": "약 10분"},
+    ]
+
+    assert build_corpus(records, path) == 3
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "broken.corpus"
+    path.write_bytes(b"NOTACORP" + bytes(HEADER.size))
+    with pytest.raises(CorpusFormatError):
+        RecipeCorpus(path)
+
+    short = tmp_path / "short.corpus"
+    short.write_bytes(MAGIC)
+    with pytest.raises(CorpusFormatError):
+        RecipeCorpus(short)
+
+
+def test_rejected_record_does_not_block_valid_duplicate(tmp_path):
+    path = tmp_path / "recipes.corpus"
+    records = [{**RECORDS[1], "time_min": -5}, RECORDS[1]]
+
+    assert build_corpus(records, path) == 1
+    assert RecipeCorpus(path).recipe(0).time_min == 25
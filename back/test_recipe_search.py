@@ -0,0 +1,60 @@
+"""
+레시피 검색 인덱스 (희소 n-gram 해싱 벡터) 테스트
+
+실행 방법:
+   python -m pytest test_recipe_search.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.models.recommendation import Recipe
+from app.services.recipe_search import MIN_SCORE, RecipeSearchIndex
+
+
+def _recipe(title: str, ingredients: list[str], summary: str = "") -> Recipe:
+    return Recipe(
+        title=title,
+        time_min=15,
+        servings=1,
+        summary=summary,
+        image_url=None,
+        ingredients_total=ingredients,
+        ingredients_have=[],
+        ingredients_need=[],
+        steps=["조리해요."],
+    )
+
+
+def _index() -> RecipeSearchIndex:
+    index = RecipeSearchIndex()
+    index.add("a", 0, _recipe("김치볶음밥", ["김치", "밥", "계란"], "남은 김치로 만드는 볶음밥"))
+    index.add("a", 1, _recipe("계란말이", ["계란", "파"], "폭신한 계란말이"))
+    index.add("b", 0, _recipe("된장찌개", ["된장", "두부", "애호박"], "구수한 찌개"))
+    index.add("b", 1, _recipe("파스타 알리오올리오", ["파스타", "마늘", "올리브유"]))
+    return index
+
+
+def test_best_match_ranks_first():
+    hits = _index().search("김치 볶음밥")
+
+    assert hits[0][0].recipe.title == "김치볶음밥"
+    assert [score for _, score in hits] == sorted((score for _, score in hits), reverse=True)
+
+
+def test_unrelated_query_is_cut_off():
+    """짧은 공통 n-gram 하나만 겹치는 레시피는 하한 미만으로 제외"""
+    index = _index()
+
+    assert index.search("스테이크") == []
+    assert all(score >= MIN_SCORE for _, score in index.search("마늘 파스타"))
+
+
+def test_duplicate_and_limit():
+    index = _index()
+
+    assert not index.add("c", 0, _recipe("김치볶음밥", ["계란", "김치", "밥"]))
+    assert len(index) == 4
+    assert len(index.search("계란", limit=1)) == 1
@@ -0,0 +1,164 @@
+"""
+추천 생성 흐름 테스트 (LLM 실패 시 폴백 응답은 캐시/색인하지 않음, 예산 초과 시 Haiku 생성)
+
+외부 호출 없이 실행되도록 LLM 어댑터와 이미지 검색을 가짜로 바꾸고
+메모리 SQLite에 테이블을 만들어 실제 저장 경로를 탑니다.
+
+실행 방법:
+   python -m pytest test_recommendation_service.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import app.main  # noqa: F401  모든 ORM 모델 등록
+import app.services.recommendation_service as recommendation_service
+from app.core.config import settings
+from app.core.database import Base
+from app.models.recipe_cache import RecipeCache
+from app.models.recommendation import (
+    Constraints,
+    RecommendationCreate,
+    RecommendationRecord,
+)
+from app.services.llm_adapter import MockRecipeLLMAdapter, RecipeLLMAdapter
+
+
+class _NoImages:
+    async def get_image(self, title, usage=None, cache_only=False):
+        return None
+
+
+class _FailingLLM:
+    def generate_recipes(self, payload, **kwargs):
+        raise ValueError("LLM 레시피 생성 최종 실패: overloaded")
+
+
+class _OverloadedClient:
+    """messages.create가 항상 실패하는 Anthropic 호환 클라이언트"""
+
+    def __init__(self):
+        self.calls = 0
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.calls += 1
+        raise RuntimeError("overloaded")
+
+
+class _WorkingLLM:
+    models: list[str | None] = []
+
+    def generate_recipes(self, payload, **kwargs):
+        _WorkingLLM.models.append(kwargs.get("model"))
+        return MockRecipeLLMAdapter().generate_recipes(payload)
+
+
+class _NoCorpus:
+    def __init__(self):
+        raise ValueError("로컬 레시피 코퍼스가 없습니다.")
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    monkeypatch.setattr(settings, "recipe_provider", "anthropic")
+    monkeypatch.setattr(settings, "llm_batch_enabled", False)
+    monkeypatch.setattr(settings, "daily_cost_budget_usd", 0.0)
+    monkeypatch.setattr(recommendation_service, "ImageSearchService", _NoImages)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def indexed(monkeypatch):
+    """색인에 추가된 추천 ID"""
+    added: list[str] = []
+    for index in (recommendation_service.recipe_index, recommendation_service.recipe_search_index):
+        monkeypatch.setattr(index, "add_response", lambda response: added.append(response.id))
+    return added
+
+
+def _create(db):
+    payload = RecommendationCreate(
+        ingredients=["김치", "계란", "밥"], constraints=Constraints(time_limit_min=30)
+    )
+    return asyncio.run(recommendation_service.create_recommendation(payload, db))
+
+
+def test_adapter_raises_after_retries():
+    """최종 실패 시 더미 레시피를 돌려주지 않고 예외 (폴백은 호출자가 생성 아님으로 표시)"""
+    client = _OverloadedClient()
+
+    with pytest.raises(ValueError, match="최종 실패"):
+        RecipeLLMAdapter(client=client).generate_recipes(
+            RecommendationCreate(ingredients=["계란"]), max_retries=2
+        )
+    assert client.calls == 2
+
+
+def test_llm_failure_is_not_cached_or_indexed(db, indexed, monkeypatch):
+    monkeypatch.setattr(recommendation_service, "RecipeLLMAdapter", _FailingLLM)
+
+    response = _create(db)
+
+    assert len(response.recipes) == 3  # 오프라인 레시피로 응답은 함
+    assert db.query(RecipeCache).count() == 0
+    assert indexed == []
+    record = db.get(RecommendationRecord, response.id)
+    assert record.data["generated"] is False
+
+
+def test_generated_response_is_cached_and_indexed(db, indexed, monkeypatch):
+    monkeypatch.setattr(recommendation_service, "RecipeLLMAdapter", _WorkingLLM)
+
+    response = _create(db)
+
+    assert db.query(RecipeCache).count() == 1
+    assert indexed == [response.id, response.id]
+    assert "generated" not in db.get(RecommendationRecord, response.id).data
+
+
+def test_over_budget_falls_back_to_haiku(db, indexed, monkeypatch):
+    """예산 초과 + 검색/코퍼스 결과 없음 → 더미가 아니라 Haiku 고정 모델로 생성"""
+    monkeypatch.setattr(settings, "daily_cost_budget_usd", 1.0)
+    monkeypatch.setattr(
+        recommendation_service.UsageLedgerService, "is_over_daily_budget", lambda self: True
+    )
+    monkeypatch.setattr(recommendation_service, "LocalRecipeAdapter", _NoCorpus)
+    monkeypatch.setattr(recommendation_service, "RecipeLLMAdapter", _WorkingLLM)
+    monkeypatch.setattr(_WorkingLLM, "models", [])
+
+    response = _create(db)
+
+    assert _WorkingLLM.models == [settings.haiku_model]
+    assert db.query(RecipeCache).count() == 1
+    assert indexed == [response.id, response.id]
+
+
+def test_over_budget_uses_dummies_only_when_haiku_fails(db, indexed, monkeypatch):
+    monkeypatch.setattr(settings, "daily_cost_budget_usd", 1.0)
+    monkeypatch.setattr(
+        recommendation_service.UsageLedgerService, "is_over_daily_budget", lambda self: True
+    )
+    monkeypatch.setattr(recommendation_service, "LocalRecipeAdapter", _NoCorpus)
+    monkeypatch.setattr(recommendation_service, "RecipeLLMAdapter", _FailingLLM)
+
+    response = _create(db)
+
+    assert len(response.recipes) == 3
+    assert db.query(RecipeCache).count() == 0
+    assert indexed == []
@@ -0,0 +1,76 @@
+"""
+트렌딩 집계 (시간 감쇠 Count-Min Sketch + Top-K) 테스트
+
+실행 방법:
+   python -m pytest test_trending.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.trending import HALF_LIFE_HOURS, DecayedTopK
+
+T0 = 1_700_000_000.0
+HALF_LIFE = HALF_LIFE_HOURS * 3600
+
+
+def test_counts_and_ranking():
+    tracker = DecayedTopK(k=5, t0=T0)
+    for _ in range(3):
+        tracker.add("계란", now=T0)
+    tracker.add("두부", now=T0)
+
+    assert tracker.top(2, now=T0) == [("계란", 3.0), ("두부", 1.0)]
+
+
+def test_score_halves_after_half_life():
+    tracker = DecayedTopK(k=5, t0=T0)
+    tracker.add("김치", weight=4.0, now=T0)
+
+    assert tracker.top(1, now=T0 + HALF_LIFE) == [("김치", pytest.approx(2.0, abs=1e-3))]
+
+
+def test_recent_events_outrank_old_ones():
+    tracker = DecayedTopK(k=5, t0=T0)
+    tracker.add("옛날 재료", weight=3.0, now=T0)
+    tracker.add("요즘 재료", weight=2.0, now=T0 + 2 * HALF_LIFE)
+
+    assert [key for key, _ in tracker.top(2, now=T0 + 2 * HALF_LIFE)] == ["요즘 재료", "옛날 재료"]
+
+
+def test_top_k_evicts_smallest():
+    tracker = DecayedTopK(k=2, t0=T0)
+    tracker.add("a", weight=1.0, now=T0)
+    tracker.add("b", weight=2.0, now=T0)
+    tracker.add("c", weight=3.0, now=T0)
+
+    assert [key for key, _ in tracker.top(5, now=T0)] == ["c", "b"]
+
+
+def test_sketch_never_underestimates():
+    """Count-Min Sketch는 충돌이 있어도 실제 값보다 작게 추정하지 않음"""
+    tracker = DecayedTopK(k=1000, width=16, depth=2, t0=T0)
+    for i in range(200):
+        tracker.add(f"재료{i}", weight=1.0, now=T0)
+
+    assert all(score >= 1.0 for _, score in tracker.top(1000, now=T0))
+
+
+def test_rescale_keeps_scores_for_long_running_process():
+    """지수 항이 커지면 기준 시각을 옮겨도 감쇠 점수는 그대로"""
+    tracker = DecayedTopK(k=5, t0=T0)
+    later = T0 + 80 * HALF_LIFE  # 지수 항 > _MAX_EXPONENT
+    tracker.add("오래된", weight=1.0, now=T0)
+    tracker.add("새 재료", weight=1.0, now=later)
+
+    assert tracker.top(1, now=later) == [("새 재료", 1.0)]
+
+
+def test_from_scores_round_trip():
+    tracker = DecayedTopK.from_scores({"계란": 5.0, "양파": 2.0}, now=T0, k=5)
+
+    assert tracker.top(2, now=T0) == [("계란", 5.0), ("양파", 2.0)]
@@ -0,0 +1,91 @@
+"""
+YouTube 호출 캐시 테스트 (TTL/LRU 캐시, search.list 단일 비행)
+
+실행 방법:
+   python -m pytest test_youtube_cache.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import app.services.youtube_adapter as youtube_adapter
+from app.services.youtube_adapter import TTLCache, YouTubeRecipeAdapter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """youtube_adapter 모듈이 보는 time.monotonic만 바꾸는 가짜 시계"""
+    now = [1000.0]
+    monkeypatch.setattr(youtube_adapter, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_ttl_expiry(clock):
+    cache = TTLCache[str](ttl_seconds=10, max_entries=5)
+    cache.set("a", "x")
+
+    clock[0] += 9
+    assert cache.get("a") == "x"
+    clock[0] += 1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction(clock):
+    cache = TTLCache[int](ttl_seconds=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a를 최근 사용으로
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+class _FakeSearchAdapter(YouTubeRecipeAdapter):
+    """search.list 호출 대신 가짜 응답 (호출 쿼리 기록)"""
+
+    def __init__(self, fail_on: str | None = None, delay: float = 0.05):
+        self.calls: list[str] = []
+        self.fail_on = fail_on
+        self.delay = delay
+
+    async def _fetch_search(self, query: str, max_results: int, key: str) -> list[str]:
+        self.calls.append(query)
+        if query == self.fail_on:
+            raise ValueError("YouTube API 할당량 초과 또는 API 키 오류")
+        await asyncio.sleep(self.delay)
+        return [f"{query}-video"]
+
+
+def test_concurrent_identical_searches_share_one_call():
+    adapter = _FakeSearchAdapter()
+
+    async def run():
+        return await asyncio.gather(
+            adapter._search_youtube(["계란 요리"]), adapter._search_youtube(["계란 요리"])
+        )
+
+    assert asyncio.run(run()) == [["계란 요리-video"], ["계란 요리-video"]]
+    assert adapter.calls == ["계란 요리"]
+    assert youtube_adapter._search_inflight == {}
+
+
+def test_quota_error_does_not_wait_for_other_queries():
+    adapter = _FakeSearchAdapter(fail_on="할당량", delay=5.0)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(ValueError):
+            await adapter._search_youtube(["느린 쿼리", "할당량"])
+        return loop.time() - started
+
+    assert asyncio.run(run()) < 1.0
@@ -0,0 +1,45 @@
+"""
+YouTube 영상 재료 색인 테스트 (제목의 합성어에서 검색 재료 추출)
+
+실행 방법:
+   python -m pytest test_youtube_video_index.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.youtube_adapter import VideoInfo
+from app.services.youtube_video_index import extract_ingredient_keys
+
+
+def _video(title: str, description: str = "") -> VideoInfo:
+    return VideoInfo(
+        video_id="v1", title=title, description=description, view_count=0, channel_title="c"
+    )
+
+
+def test_compound_title_is_indexed_under_user_ingredient():
+    """계란말이/김치볶음밥처럼 재료가 요리명에 붙어 있어도 색인"""
+    keys = extract_ingredient_keys(
+        _video("초간단 계란말이 & 김치볶음밥 황금레시피"), ["계란", "김치", "밥"]
+    )
+
+    assert {"계란", "김치", "밥"} <= set(keys)
+
+
+def test_particle_and_whole_word():
+    keys = extract_ingredient_keys(_video("두부를 넣은 찌개"), ["두부", "감자"])
+
+    assert "두부" in keys
+    assert "감자" not in keys
+
+
+def test_one_syllable_stoplist_needs_whole_word():
+    """파스타의 파, 꿀팁의 꿀처럼 다른 단어 안의 한 글자는 재료로 보지 않음"""
+    keys = extract_ingredient_keys(_video("크림 파스타 꿀팁"), ["파", "꿀"])
+    assert "파" not in keys
+    assert "꿀" not in keys
+
+    assert "파" in extract_ingredient_keys(_video("파 송송 라면"), ["파"])
@@ -6,7 +6,7 @@ import { Button } from "@/components/ui/button";
 import { Card, CardContent } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Separator } from "@/components/ui/separator";
-import { Clock, Users, ChefHat, ShoppingCart, Lightbulb, ChevronDown, ChevronUp, Plus, Check, ExternalLink, CircleCheck } from "lucide-react";
+import { Clock, Users, ChefHat, ShoppingCart, Lightbulb, ChevronDown, ChevronUp, Plus, Check, ExternalLink, CircleCheck, Flame } from "lucide-react";
 import { FavoriteButton } from "@/components/FavoriteButton";
 import { ShareButton } from "@/components/ShareButton";
 import AdUnit from "@/components/AdUnit";
@@ -312,6 +312,12 @@ export default function ResultClient({ id }: { id: string }) {
                         <Users className="w-3.5 h-3.5" />
                         {r.servings}인분
                       </span>
+                      {r.nutrition && (
+                        <span className="flex items-center gap-1" title="1인분 추정치">
+                          <Flame className="w-3.5 h-3.5" />
+                          약 {r.nutrition.calories_kcal}kcal
+                        </span>
+                      )}
                       {recipeCompleted > 0 && (
                         <span className="flex items-center gap-1 text-primary">
                           <CircleCheck className="w-3.5 h-3.5" />
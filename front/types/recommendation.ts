@@ -1,3 +1,11 @@
+export interface Nutrition {
+  calories_kcal: number;
+  protein_g: number;
+  fat_g: number;
+  carbs_g: number;
+  matched_ratio: number;
+}
+
 export interface Recipe {
   title: string;
   time_min: number;
@@ -10,6 +18,7 @@ export interface Recipe {
   steps: string[];
   tips: string[];
   warnings: string[];
+  nutrition?: Nutrition | null;
 }
 
 export interface ShoppingItem {